@@ -0,0 +1,123 @@
+"""Client-side cache of single-object reads, revalidated by resourceVersion."""
+import copy
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from typing import Any, Dict, Hashable, Optional
+
+
+class CacheEntry:
+    """A cached object and when its resourceVersion was last confirmed current"""
+
+    def __init__(self, obj: Dict[str, Any]):
+        self.obj = obj
+        self.resource_version = (obj.get("metadata") or {}).get("resourceVersion")
+        self.validated_at = time.monotonic()
+
+    def age(self) -> float:
+        return time.monotonic() - self.validated_at
+
+
+class GetCache:
+    """
+    LRU cache of raw objects returned by single-object GETs.
+
+    Entries younger than max_age seconds are served as-is; older ones are
+    revalidated by the caller with a metadata-only GET and served again while
+    the resourceVersion is unchanged. Objects are copied in and out, so
+    callers may mutate what they get.
+    """
+
+    def __init__(self, max_size: int = 256, max_age: float = 0.0):
+        self.max_size = max_size
+        self.max_age = max_age
+        self._entries: "OrderedDict[Hashable, CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.metrics = {
+            "hits_total": 0,
+            "revalidated_total": 0,
+            "misses_total": 0,
+            "evictions_total": 0,
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(self, key: Hashable) -> Optional[CacheEntry]:
+        """Return the entry for key, marking it most recently used"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def is_fresh(self, entry: CacheEntry) -> bool:
+        """Whether an entry may be served without revalidation"""
+        return entry.age() < self.max_age
+
+    def hit(self, entry: CacheEntry, revalidated: bool = False) -> Dict[str, Any]:
+        """Record a served entry and return a copy of its object"""
+        if revalidated:
+            entry.validated_at = time.monotonic()
+            self.metrics["revalidated_total"] += 1
+        else:
+            self.metrics["hits_total"] += 1
+        return copy.deepcopy(entry.obj)
+
+    def store(self, key: Hashable, obj: Dict[str, Any]) -> None:
+        """Cache an object fetched from the API server, evicting the least recently used"""
+        self.metrics["misses_total"] += 1
+        if self.max_size <= 0 or not (obj.get("metadata") or {}).get("resourceVersion"):
+            return
+        entry = CacheEntry(copy.deepcopy(obj))
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.metrics["evictions_total"] += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def _parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).astimezone(timezone.utc)
+    except ValueError:
+        return None
+
+
+def http_validators(resource) -> Dict[str, str]:
+    """
+    HTTP validators for a resource, to answer conditional requests with 304.
+
+    ETag is the weak tag of the resourceVersion. Last-Modified is the latest
+    managedFields update, falling back to the creation timestamp.
+
+    Args:
+        resource: A raw resource dict or a typed model
+
+    Returns:
+        'ETag' and 'Last-Modified' header values, each only when known
+    """
+    metadata = resource.get("metadata") if isinstance(resource, dict) else resource.metadata
+    metadata = metadata or {}
+    headers = {}
+    if metadata.get("resourceVersion"):
+        headers["ETag"] = f'W/"{metadata["resourceVersion"]}"'
+    times = [_parse_timestamp(field.get("time")) for field in metadata.get("managedFields") or []]
+    times = [t for t in times if t is not None]
+    modified = max(times) if times else _parse_timestamp(metadata.get("creationTimestamp"))
+    if modified is not None:
+        headers["Last-Modified"] = format_datetime(modified, usegmt=True)
+    return headers
@@ -1,30 +1,221 @@
+import asyncio
+import os
+import threading
+from collections import OrderedDict
 from contextlib import asynccontextmanager
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
 from ark_sdk import versions
 
 V1_ALPHA1 = "v1alpha1"
 V1_PREALPHA1 = "v1prealpha1"
 
-def get_client(namespace: str, version: str):
+# Name of the cluster of the kubeconfig or in-cluster config, also selected by cluster=None
+LOCAL_CLUSTER = "local"
+
+# Most recently used ARK clients kept by get_client; older ones are dropped
+MAX_CLIENTS = int(os.getenv('ARK_SDK_MAX_CLIENTS', '256'))
+
+# Process-wide client registry: one ARK client per (cluster, namespace, version),
+# and one ApiClientPool per cluster so connections are reused across requests.
+_pool_settings: Dict[str, Any] = {}
+_pools: Dict[str, versions.ApiClientPool] = {}
+_clusters: Dict[str, Dict[str, Any]] = {}
+_clients: "OrderedDict[Tuple[str, str, str], versions._ARKClient]" = OrderedDict()
+_lock = threading.Lock()
+
+def configure_client_pool(
+    pool_maxsize: Optional[int] = None,
+    qps: Optional[float] = None,
+    burst: Optional[int] = None,
+    max_retries: Optional[int] = None,
+    codec: Optional[str] = None,
+    hooks: Optional[List] = None,
+    configuration=None,
+    get_cache_size: Optional[int] = None,
+    get_cache_max_age: Optional[float] = None
+):
+    """
+    Configure the shared connection pool used by cached clients.
+
+    Must be called before the first client is created, e.g. at startup.
+    Pools of registered clusters use the same settings, except configuration.
+
+    Args:
+        pool_maxsize: Maximum number of connections per pool
+        qps: Sustained async requests per second (unlimited when unset)
+        burst: Requests allowed above qps in a burst (defaults to 2 * qps)
+        max_retries: Retries for throttled (429) and transient 5xx responses
+        codec: JSON codec for resource bodies: 'json', 'orjson' or 'auto'
+        hooks: Call hooks from ark_sdk.instrumentation, e.g. PrometheusHistogramHook
+        configuration: kubernetes_asyncio Configuration to use instead of the kubeconfig or
+            in-cluster config, e.g. FakeApiServer.configuration() in tests
+        get_cache_size: Objects kept by the a_get cache of agents, models and teams (0 disables)
+        get_cache_max_age: Seconds a cached object is served before revalidating its resourceVersion
+    """
+    with _lock:
+        _clients.clear()
+        _pools.clear()
+        _pool_settings.clear()
+        _pool_settings.update(
+            pool_maxsize=pool_maxsize, qps=qps, burst=burst, max_retries=max_retries, codec=codec,
+            get_cache_size=get_cache_size, get_cache_max_age=get_cache_max_age
+        )
+        _pools[LOCAL_CLUSTER] = versions.ApiClientPool(
+            hooks=hooks, configuration=configuration, **_pool_settings
+        )
+
+def register_cluster(
+    name: str,
+    context: Optional[str] = None,
+    config_file: Optional[str] = None,
+    configuration=None
+):
+    """
+    Register a named cluster that clients can select with cluster=name.
+
+    Each cluster gets its own connection pool, created on first use, which
+    shares the hooks of the local cluster's pool.
+
+    Args:
+        name: The cluster name used to select it
+        context: The kubeconfig context of the cluster (defaults to name)
+        config_file: The kubeconfig file (defaults to KUBECONFIG or ~/.kube/config)
+        configuration: kubernetes_asyncio Configuration to use instead of a kubeconfig context
+    """
+    if name == LOCAL_CLUSTER:
+        raise ValueError(f"'{LOCAL_CLUSTER}' is reserved for the default cluster")
+    with _lock:
+        _clusters[name] = {
+            'context': context or name,
+            'config_file': config_file,
+            'configuration': configuration,
+        }
+        _pools.pop(name, None)
+        for key in [key for key in _clients if key[0] == name]:
+            del _clients[key]
+
+def _load_clusters_from_env():
+    """Register clusters listed in ARK_SDK_CLUSTERS, e.g. 'east=prod-east,west'"""
+    for entry in os.getenv('ARK_SDK_CLUSTERS', '').split(','):
+        name, _, context = entry.strip().partition('=')
+        if name and name not in _clusters:
+            _clusters[name] = {'context': context or name, 'config_file': None, 'configuration': None}
+
+def list_clusters() -> List[str]:
+    """
+    Names of the registered clusters, including those from ARK_SDK_CLUSTERS.
+
+    Returns [LOCAL_CLUSTER] when no clusters are registered.
+    """
+    with _lock:
+        _load_clusters_from_env()
+        return list(_clusters) or [LOCAL_CLUSTER]
+
+def get_client_pool(cluster: Optional[str] = None) -> versions.ApiClientPool:
+    cluster = cluster or LOCAL_CLUSTER
+    with _lock:
+        local = _pools.get(LOCAL_CLUSTER)
+        if local is None:
+            local = _pools[LOCAL_CLUSTER] = versions.ApiClientPool(**_pool_settings)
+        if cluster == LOCAL_CLUSTER:
+            return local
+        pool = _pools.get(cluster)
+        if pool is None:
+            _load_clusters_from_env()
+            if cluster not in _clusters:
+                raise Exception(f"Cluster '{cluster}' not found")
+            pool = versions.ApiClientPool(**_clusters[cluster], **_pool_settings)
+            # Hooks added to the local pool, e.g. metrics, see every cluster's calls
+            pool.hooks = local.hooks
+            _pools[cluster] = pool
+        return pool
+
+def get_client(namespace: str, version: str, cluster: Optional[str] = None):
     clazz = {
         V1_ALPHA1: versions.ARKClientV1alpha1,
         V1_PREALPHA1: versions.ARKClientV1prealpha1
     }.get(version)
     if not clazz:
         raise Exception(f"No client for {version}")
-    return clazz(namespace)
+    cluster = cluster or LOCAL_CLUSTER
+    pool = get_client_pool(cluster)
+    key = (cluster, namespace, version)
+    with _lock:
+        ark_client = _clients.get(key)
+        if ark_client is None:
+            ark_client = clazz(namespace, pool=pool)
+            _clients[key] = ark_client
+            # Clients are cheap to recreate; the connections live in the pool
+            while len(_clients) > MAX_CLIENTS:
+                _clients.popitem(last=False)
+        else:
+            _clients.move_to_end(key)
+        return ark_client
+
+async def close_clients():
+    """
+    Close the shared connection pools and drop all cached clients.
+
+    Intended for FastAPI lifespan shutdown.
+    """
+    with _lock:
+        pools = list(_pools.values())
+        _pools.clear()
+        _clients.clear()
+    for pool in pools:
+        await pool.a_close()
+        pool.close()
 
 @asynccontextmanager
-async def with_ark_client(namespace: str, version: str):
+async def with_ark_client(namespace: str, version: str, cluster: Optional[str] = None):
     """
     Async context manager that provides an ARK client.
 
+    The ARK_SDK_MAX_CLIENTS most recently used clients are cached per
+    (cluster, namespace, version) and share one connection pool per cluster,
+    so the client is not closed on exit.
+
     Args:
         namespace: The Kubernetes namespace
         version: The API version to use
+        cluster: A registered cluster name (defaults to the local cluster)
 
     Yields:
         ARK client instance
     """
-    ark_client = get_client(namespace, version)
-    yield ark_client
\ No newline at end of file
+    ark_client = get_client(namespace, version, cluster)
+    yield ark_client
+
+async def a_for_each_cluster(
+    namespace: str,
+    version: str,
+    call: Callable[[Any], Awaitable[Any]],
+    clusters: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    """
+    Run call(ark_client) concurrently against several clusters.
+
+    Example:
+        agents = await a_for_each_cluster("default", V1_ALPHA1, lambda c: c.agents.a_list(raw=True))
+
+    Args:
+        namespace: The Kubernetes namespace
+        version: The API version to use
+        call: Coroutine function called with each cluster's ARK client
+        clusters: Cluster names (defaults to list_clusters())
+
+    Returns:
+        The result, or the Exception raised, keyed by cluster name, so one
+        unreachable cluster does not fail the others
+    """
+    names = clusters if clusters is not None else list_clusters()
+
+    async def run(cluster: str):
+        try:
+            return await call(get_client(namespace, version, cluster))
+        except Exception as e:
+            return e
+
+    results = await asyncio.gather(*(run(cluster) for cluster in names))
+    return dict(zip(names, results))
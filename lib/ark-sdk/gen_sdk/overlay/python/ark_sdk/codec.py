@@ -0,0 +1,62 @@
+"""JSON codecs for encoding request bodies and decoding API server responses."""
+import json
+import os
+from typing import Any, Optional
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional dependency: pip install ark_sdk[fast]
+    orjson = None
+
+
+class JsonCodec:
+    """Standard library codec, used by default"""
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+    def loads(self, data) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec:
+    """orjson-backed codec, several times faster on large payloads"""
+
+    name = "orjson"
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError("The orjson codec requires orjson: pip install ark_sdk[fast]")
+
+    def dumps(self, obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    def loads(self, data) -> Any:
+        return orjson.loads(data)
+
+
+def get_codec(name: Optional[str] = None):
+    """
+    Get a codec by name.
+
+    Args:
+        name: 'json', 'orjson', or 'auto' for orjson when installed; defaults
+            to ARK_SDK_JSON_CODEC, then 'json'
+
+    Returns:
+        The codec instance
+
+    Raises:
+        ValueError: If the codec name is unknown
+        ImportError: If orjson is requested but not installed
+    """
+    name = name or os.getenv("ARK_SDK_JSON_CODEC", "json")
+    if name == "auto":
+        name = "orjson" if orjson is not None else "json"
+    if name == "json":
+        return JsonCodec()
+    if name == "orjson":
+        return OrjsonCodec()
+    raise ValueError(f"Unknown JSON codec: {name}")
@@ -0,0 +1,388 @@
+"""List+watch caches for ARK custom resources."""
+import asyncio
+import logging
+import random
+import re
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from kubernetes_asyncio.client.rest import ApiException
+
+logger = logging.getLogger(__name__)
+
+Indexer = Callable[[Dict[str, Any]], Iterable[str]]
+
+_SET_REQUIREMENT = re.compile(r'^([^\s!=]+)\s+(in|notin)\s+\(([^)]*)\)$')
+
+
+def label_indexer(key: str) -> Indexer:
+    """Index objects by the value of a label"""
+    def index(obj: Dict[str, Any]) -> List[str]:
+        labels = (obj.get('metadata') or {}).get('labels') or {}
+        return [labels[key]] if key in labels else []
+    return index
+
+
+def field_indexer(path: str) -> Indexer:
+    """Index objects by the value at a dotted path, e.g. 'spec.sessionId'"""
+    keys = path.split('.')
+
+    def index(obj: Dict[str, Any]) -> List[str]:
+        value: Any = obj
+        for key in keys:
+            if not isinstance(value, dict) or key not in value:
+                return []
+            value = value[key]
+        return [str(value)] if value is not None else []
+    return index
+
+
+def _split_selector(selector: str) -> List[str]:
+    """Split a label selector on commas that are not inside parentheses"""
+    parts, depth, current = [], 0, ''
+    for char in selector:
+        if char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+        if char == ',' and depth == 0:
+            parts.append(current.strip())
+            current = ''
+        else:
+            current += char
+    if current.strip():
+        parts.append(current.strip())
+    return parts
+
+
+def parse_label_selector(selector: Optional[str]) -> List[Tuple[str, str, Set[str]]]:
+    """
+    Parse a Kubernetes label selector into (key, operator, values) requirements.
+
+    Supports =, ==, !=, in, notin, existence (key) and non-existence (!key).
+
+    Raises:
+        ValueError: If the selector cannot be parsed
+    """
+    requirements = []
+    for part in _split_selector(selector or ''):
+        match = _SET_REQUIREMENT.match(part)
+        if match:
+            values = {v.strip() for v in match.group(3).split(',') if v.strip()}
+            requirements.append((match.group(1), match.group(2), values))
+        elif '!=' in part:
+            key, value = part.split('!=', 1)
+            requirements.append((key.strip(), '!=', {value.strip()}))
+        elif '=' in part:
+            key, value = part.replace('==', '=').split('=', 1)
+            requirements.append((key.strip(), '=', {value.strip()}))
+        elif part.startswith('!'):
+            requirements.append((part[1:].strip(), '!', set()))
+        elif re.match(r'^[A-Za-z0-9./_-]+$', part):
+            requirements.append((part, 'exists', set()))
+        else:
+            raise ValueError(f"Unsupported label selector: {selector}")
+    return requirements
+
+
+def match_labels(labels: Dict[str, str], requirements: List[Tuple[str, str, Set[str]]]) -> bool:
+    """Check labels against parsed label selector requirements"""
+    for key, operator, values in requirements:
+        present = key in labels
+        value = labels.get(key)
+        if operator in ('=', 'in') and (not present or value not in values):
+            return False
+        if operator in ('!=', 'notin') and present and value in values:
+            return False
+        if operator == 'exists' and not present:
+            return False
+        if operator == '!' and present:
+            return False
+    return True
+
+
+class Informer:
+    """
+    Shared list+watch cache for one ARK resource kind in one namespace.
+
+    Does an initial LIST, then watches from the returned resourceVersion and
+    keeps an in-memory store with optional secondary indexes. A 410 Gone from
+    the watch triggers a relist.
+
+    The cache counts as fresh while the watch is open, however quiet the
+    namespace is; once the watch drops, only for max_staleness seconds after
+    the API server was last heard from.
+
+    Objects returned by get/list/by_index are the cached dicts and must be
+    treated as read-only.
+    """
+
+    def __init__(
+        self,
+        resource_client,
+        namespace: Optional[str] = None,
+        indexers: Optional[Dict[str, Indexer]] = None,
+        watch_timeout_seconds: int = 300,
+        max_backoff_seconds: float = 30.0
+    ):
+        self.resource_client = resource_client
+        self.kind = resource_client.kind
+        self.namespace = namespace or resource_client.namespace
+        self.watch_timeout_seconds = watch_timeout_seconds
+        self.max_backoff_seconds = max_backoff_seconds
+
+        self._items: Dict[str, Dict[str, Any]] = {}
+        self._indexers: Dict[str, Indexer] = dict(indexers or {})
+        self._indices: Dict[str, Dict[str, Set[str]]] = {name: {} for name in self._indexers}
+        self._synced = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._watching = False
+
+        self.resource_version: Optional[str] = None
+        self.last_sync_time: Optional[float] = None
+        self.events_total = 0
+        self.relists_total = 0
+        self.watch_restarts_total = 0
+        self.errors_total = 0
+
+    async def start(self, wait: bool = True, timeout: Optional[float] = None) -> None:
+        """Start the list+watch loop, optionally waiting for the initial sync"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        if wait:
+            await self.wait_for_sync(timeout)
+
+    async def wait_for_sync(self, timeout: Optional[float] = None) -> None:
+        """Wait until the initial list has populated the cache"""
+        await asyncio.wait_for(self._synced.wait(), timeout)
+
+    async def stop(self) -> None:
+        """Stop the list+watch loop"""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._synced.clear()
+        self._watching = False
+
+    def has_synced(self) -> bool:
+        return self._synced.is_set()
+
+    def staleness_seconds(self) -> Optional[float]:
+        """Seconds since the cache last heard from the API server"""
+        if self.last_sync_time is None:
+            return None
+        return time.monotonic() - self.last_sync_time
+
+    def is_watching(self) -> bool:
+        """Check whether the watch stream is open"""
+        return self._watching
+
+    def is_fresh(self, max_staleness: float) -> bool:
+        """Check whether reads can be served from the cache"""
+        if not self.has_synced():
+            return False
+        if self._watching:
+            return True
+        staleness = self.staleness_seconds()
+        return staleness is not None and staleness <= max_staleness
+
+    def get(self, name: str) -> Optional[Dict[str, Any]]:
+        return self._items.get(name)
+
+    def supports_selector(self, label_selector: Optional[str]) -> bool:
+        """Check whether a label selector can be evaluated against the cache"""
+        try:
+            parse_label_selector(label_selector)
+            return True
+        except ValueError:
+            return False
+
+    def list(self, label_selector: Optional[str] = None) -> List[Dict[str, Any]]:
+        items = list(self._items.values())
+        if not label_selector:
+            return items
+        requirements = parse_label_selector(label_selector)
+        return [
+            item for item in items
+            if match_labels((item.get('metadata') or {}).get('labels') or {}, requirements)
+        ]
+
+    def by_index(self, index_name: str, value: str) -> List[Dict[str, Any]]:
+        """Return cached objects whose index value matches"""
+        if index_name not in self._indices:
+            raise KeyError(f"No index named '{index_name}'")
+        names = self._indices[index_name].get(value, set())
+        return [self._items[name] for name in names if name in self._items]
+
+    def add_indexer(self, name: str, indexer: Indexer) -> None:
+        """Add a secondary index and build it from the current cache"""
+        self._indexers[name] = indexer
+        self._indices[name] = {}
+        for obj_name, obj in self._items.items():
+            self._index(name, obj_name, obj)
+
+    def metrics(self) -> Dict[str, Any]:
+        """Cache freshness and activity metrics"""
+        return {
+            "kind": self.kind,
+            "namespace": self.namespace,
+            "synced": self.has_synced(),
+            "watching": self._watching,
+            "items": len(self._items),
+            "resource_version": self.resource_version,
+            "staleness_seconds": self.staleness_seconds(),
+            "events_total": self.events_total,
+            "relists_total": self.relists_total,
+            "watch_restarts_total": self.watch_restarts_total,
+            "errors_total": self.errors_total,
+        }
+
+    def _index(self, index_name: str, obj_name: str, obj: Dict[str, Any]) -> None:
+        for value in self._indexers[index_name](obj):
+            self._indices[index_name].setdefault(value, set()).add(obj_name)
+
+    def _unindex(self, obj_name: str) -> None:
+        for index in self._indices.values():
+            for value in [v for v, names in index.items() if obj_name in names]:
+                index[value].discard(obj_name)
+                if not index[value]:
+                    del index[value]
+
+    def _store(self, obj: Dict[str, Any]) -> None:
+        name = obj['metadata']['name']
+        self._unindex(name)
+        self._items[name] = obj
+        for index_name in self._indexers:
+            self._index(index_name, name, obj)
+
+    def _remove(self, obj: Dict[str, Any]) -> None:
+        name = obj['metadata']['name']
+        self._unindex(name)
+        self._items.pop(name, None)
+
+    async def _relist(self) -> None:
+        result = await self.resource_client._a_list_raw(self.namespace)
+        self._items = {}
+        self._indices = {name: {} for name in self._indexers}
+        for item in result.get('items', []):
+            self._store(item)
+        self.resource_version = (result.get('metadata') or {}).get('resourceVersion')
+        self.relists_total += 1
+        self.last_sync_time = time.monotonic()
+        self._synced.set()
+
+    def _watch_opened(self) -> None:
+        self._watching = True
+
+    def _handle_event(self, event: Dict[str, Any]) -> None:
+        event_type = event.get('type')
+        obj = event.get('object') or {}
+        resource_version = (obj.get('metadata') or {}).get('resourceVersion')
+        if event_type in ('ADDED', 'MODIFIED'):
+            self._store(obj)
+        elif event_type == 'DELETED':
+            self._remove(obj)
+        if resource_version:
+            self.resource_version = resource_version
+        self.events_total += 1
+        self.last_sync_time = time.monotonic()
+
+    async def _run(self) -> None:
+        backoff = 0.0
+        while True:
+            try:
+                if self.resource_version is None:
+                    await self._relist()
+                try:
+                    async for event in self.resource_client._a_watch_events(
+                        self.namespace,
+                        resource_version=self.resource_version,
+                        timeout_seconds=self.watch_timeout_seconds,
+                        on_open=self._watch_opened
+                    ):
+                        self._handle_event(event)
+                finally:
+                    self._watching = False
+                # Server closed the watch after its timeout; resume from the last version
+                self.watch_restarts_total += 1
+                self.last_sync_time = time.monotonic()
+                backoff = 0.0
+            except asyncio.CancelledError:
+                raise
+            except ApiException as e:
+                if e.status == 410:
+                    logger.info(f"Watch for {self.kind}s in {self.namespace} expired, relisting")
+                    self.resource_version = None
+                    continue
+                self.errors_total += 1
+                logger.warning(f"Watch for {self.kind}s in {self.namespace} failed: {e}")
+                backoff = min(max(backoff * 2, 1.0), self.max_backoff_seconds)
+                await asyncio.sleep(backoff * random.uniform(0.5, 1.0))
+            except Exception as e:
+                self.errors_total += 1
+                logger.warning(f"Informer for {self.kind}s in {self.namespace} failed: {e}")
+                backoff = min(max(backoff * 2, 1.0), self.max_backoff_seconds)
+                await asyncio.sleep(backoff * random.uniform(0.5, 1.0))
+
+
+# Keyed by the resource client's pool too, so each cluster has its own informers
+_informers: Dict[Tuple[Any, str, str, str], Informer] = {}
+
+
+async def start_informer(
+    resource_client,
+    namespace: Optional[str] = None,
+    indexers: Optional[Dict[str, Indexer]] = None,
+    max_staleness: float = 60.0,
+    timeout: Optional[float] = None,
+    wait: bool = True
+) -> Informer:
+    """
+    Get or start the shared informer for a resource kind and namespace.
+
+    The resource client then serves a_get/a_list for that namespace from the
+    informer cache once it has synced, while it is watching or no older than
+    max_staleness seconds.
+
+    Args:
+        resource_client: The ARKResourceClient to list and watch with
+        namespace: The namespace to cache (defaults to the client's namespace)
+        indexers: Secondary indexes by name, e.g. {'session': field_indexer('spec.sessionId')}
+        max_staleness: Maximum cache age in seconds for serving reads
+        timeout: Maximum seconds to wait for the initial sync
+        wait: Wait for the initial sync; otherwise reads use the API server until it completes
+
+    Returns:
+        The started informer
+    """
+    ns = namespace or resource_client.namespace
+    key = (resource_client.pool, resource_client.api_version, resource_client.plural, ns)
+    informer = _informers.get(key)
+    if informer is None:
+        informer = Informer(resource_client, ns, indexers)
+        _informers[key] = informer
+    else:
+        for name, indexer in (indexers or {}).items():
+            if name not in informer._indexers:
+                informer.add_indexer(name, indexer)
+    await informer.start(wait=wait, timeout=timeout)
+    resource_client.use_informer(informer, max_staleness)
+    return informer
+
+
+async def stop_informers(namespace: Optional[str] = None) -> None:
+    """Stop the shared informers of a namespace, or all of them, e.g. on FastAPI lifespan shutdown"""
+    keys = [key for key in _informers if namespace is None or key[3] == namespace]
+    informers = [_informers.pop(key) for key in keys]
+    for informer in informers:
+        informer.resource_client.remove_informer(informer.namespace)
+        await informer.stop()
+
+
+def informer_metrics() -> List[Dict[str, Any]]:
+    """Cache freshness metrics for all shared informers"""
+    return [informer.metrics() for informer in _informers.values()]
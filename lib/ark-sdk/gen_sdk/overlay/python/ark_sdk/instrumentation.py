@@ -0,0 +1,127 @@
+"""Instrumentation hooks for Kubernetes API calls made by ARK resource clients."""
+import logging
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Latency buckets in seconds, from a cached read to a slow list
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class CallInfo:
+    """
+    One Kubernetes API call as seen by hooks.
+
+    verb, kind and namespace are set before the call; status, duration and
+    error once it finished. status is the HTTP status of a failed call, 200
+    for a successful one and None when no response was received. Retries of
+    throttled or transient failures are part of the same call.
+    """
+
+    def __init__(self, verb: str, kind: str, namespace: Optional[str]):
+        self.verb = verb
+        self.kind = kind
+        self.namespace = namespace
+        self.status: Optional[int] = None
+        self.duration: float = 0.0
+        self.error: Optional[BaseException] = None
+        # Per-call state for hooks, e.g. an open span
+        self.context: Dict[str, object] = {}
+
+
+class CallHook:
+    """Base class for call hooks; override either method"""
+
+    def before_call(self, call: CallInfo) -> None:
+        pass
+
+    def after_call(self, call: CallInfo) -> None:
+        pass
+
+
+def run_hooks(hooks: Sequence[CallHook], stage: str, call: CallInfo) -> None:
+    """Run a hook stage, logging instead of raising hook failures"""
+    for hook in hooks:
+        try:
+            getattr(hook, stage)(call)
+        except Exception as e:
+            logger.warning(f"{type(hook).__name__}.{stage} failed: {e}")
+
+
+class PrometheusHistogramHook(CallHook):
+    """
+    Latency histogram of API calls by verb, kind, namespace and status code.
+
+    render() returns the Prometheus text exposition format, so the histogram
+    can be served from a /metrics endpoint without prometheus_client.
+    """
+
+    def __init__(self, name: str = "ark_sdk_request_duration_seconds", buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.name = name
+        self.buckets = tuple(sorted(buckets))
+        self._series: Dict[Tuple[str, str, str, str], List[float]] = {}
+        self._lock = threading.Lock()
+
+    def after_call(self, call: CallInfo) -> None:
+        code = str(call.status) if call.status is not None else "error"
+        key = (call.verb, call.kind, call.namespace or "", code)
+        with self._lock:
+            # Per-bucket counts, then +Inf count and sum
+            series = self._series.setdefault(key, [0.0] * (len(self.buckets) + 2))
+            for i, bound in enumerate(self.buckets):
+                if call.duration <= bound:
+                    series[i] += 1
+            series[-2] += 1
+            series[-1] += call.duration
+
+    def render(self) -> str:
+        lines = [
+            f"# HELP {self.name} Latency of Kubernetes API calls made by ark_sdk",
+            f"# TYPE {self.name} histogram",
+        ]
+        with self._lock:
+            series = sorted(self._series.items())
+        for (verb, kind, namespace, code), values in series:
+            labels = f'verb="{verb}",kind="{kind}",namespace="{namespace}",code="{code}"'
+            for bound, count in zip(self.buckets, values):
+                lines.append(f'{self.name}_bucket{{{labels},le="{bound}"}} {count:g}')
+            lines.append(f'{self.name}_bucket{{{labels},le="+Inf"}} {values[-2]:g}')
+            lines.append(f"{self.name}_sum{{{labels}}} {values[-1]}")
+            lines.append(f"{self.name}_count{{{labels}}} {values[-2]:g}")
+        return "\n".join(lines) + "\n"
+
+
+class OpenTelemetryHook(CallHook):
+    """
+    Client span per API call, a child of the current span such as the
+    incoming request span of a FastAPI service.
+
+    Requires opentelemetry-api.
+    """
+
+    def __init__(self, tracer=None):
+        from opentelemetry import trace
+        self._trace = trace
+        self.tracer = tracer or trace.get_tracer("ark_sdk")
+
+    def before_call(self, call: CallInfo) -> None:
+        attributes = {"ark.verb": call.verb, "ark.kind": call.kind}
+        if call.namespace:
+            attributes["k8s.namespace.name"] = call.namespace
+        call.context["span"] = self.tracer.start_span(
+            f"ark {call.verb} {call.kind}",
+            kind=self._trace.SpanKind.CLIENT,
+            attributes=attributes,
+        )
+
+    def after_call(self, call: CallInfo) -> None:
+        span = call.context.get("span")
+        if span is None:
+            return
+        if call.status is not None:
+            span.set_attribute("http.response.status_code", call.status)
+        if call.error is not None:
+            span.record_exception(call.error)
+            span.set_status(self._trace.Status(self._trace.StatusCode.ERROR, str(call.error)))
+        span.end()
@@ -3,10 +3,14 @@ import functools
 import logging
 import os
 from functools import lru_cache
+from urllib.parse import quote, urlencode
+
+import aiohttp
 
 from kubernetes import config
 from kubernetes.config.config_exception import ConfigException
 from kubernetes_asyncio import config as async_config
+from kubernetes_asyncio.client.rest import ApiException, RESTResponse
 
 logger = logging.getLogger(__name__)
 
@@ -58,4 +62,173 @@ async def init_k8s():
         await async_config.load_kube_config()
     except:
         # If that fails, try in-cluster config
-        async_config.load_incluster_config()
\ No newline at end of file
+        async_config.load_incluster_config()
+
+# Accept headers asking the API server to return PartialObjectMetadata instead
+# of full objects, i.e. only apiVersion, kind and metadata
+METADATA_LIST_ACCEPT = "application/json;as=PartialObjectMetadataList;v=v1;g=meta.k8s.io,application/json"
+METADATA_WATCH_ACCEPT = "application/json;as=PartialObjectMetadata;v=v1;g=meta.k8s.io,application/json"
+
+_QUERY_PARAMS = {
+    "label_selector": "labelSelector",
+    "field_selector": "fieldSelector",
+    "resource_version": "resourceVersion",
+    "timeout_seconds": "timeoutSeconds",
+    "allow_watch_bookmarks": "allowWatchBookmarks",
+    "limit": "limit",
+    "_continue": "continue",
+    "field_manager": "fieldManager",
+    "force": "force",
+}
+
+
+async def list_metadata(api_client, resource_path: str, path_params: dict, watch: bool = False, **kwargs):
+    """
+    List or watch a collection as PartialObjectMetadata, skipping spec and status.
+
+    Args:
+        api_client: A kubernetes_asyncio ApiClient
+        resource_path: The collection path, e.g. '/api/v1/namespaces/{namespace}/secrets'
+        path_params: Values for the placeholders in resource_path
+        watch: Start a watch and return the unread streaming response
+        **kwargs: List options such as label_selector, resource_version or limit
+
+    Returns:
+        The PartialObjectMetadataList as a dict, or the streaming response when watching
+    """
+    query_params = [(_QUERY_PARAMS[key], value) for key, value in kwargs.items() if value is not None]
+    if watch:
+        query_params.append(("watch", True))
+    return await api_client.call_api(
+        resource_path,
+        "GET",
+        path_params=path_params,
+        query_params=query_params,
+        header_params={"Accept": METADATA_WATCH_ACCEPT if watch else METADATA_LIST_ACCEPT},
+        response_types_map={200: "object"},
+        auth_settings=["BearerToken"],
+        _return_http_data_only=True,
+        _preload_content=not watch,
+    )
+
+
+def partial_object_metadata(obj: dict) -> dict:
+    """Reduce a full object to the PartialObjectMetadata the API server returns for it"""
+    return {"apiVersion": "meta.k8s.io/v1", "kind": "PartialObjectMetadata", "metadata": obj["metadata"]}
+
+
+async def get_metadata(api_client, resource_path: str, path_params: dict):
+    """
+    Get a single object as PartialObjectMetadata, skipping spec and status.
+
+    Args:
+        api_client: A kubernetes_asyncio ApiClient
+        resource_path: The object path, e.g. '/api/v1/namespaces/{namespace}/secrets/{name}'
+        path_params: Values for the placeholders in resource_path
+
+    Returns:
+        The PartialObjectMetadata as a dict
+    """
+    return await api_client.call_api(
+        resource_path,
+        "GET",
+        path_params=path_params,
+        header_params={"Accept": METADATA_WATCH_ACCEPT},
+        response_types_map={200: "object"},
+        auth_settings=["BearerToken"],
+        _return_http_data_only=True,
+    )
+
+
+async def checked_stream(request):
+    """
+    Await a streaming (_preload_content=False) request and check its status.
+
+    kubernetes_asyncio returns unread responses without checking the status,
+    so an error such as 403 Forbidden would otherwise be read as a stream.
+
+    Raises:
+        ApiException: If the API server returns a non-2xx status
+    """
+    response = await request
+    if not 200 <= response.status <= 299:
+        data = await response.read()
+        response.release()
+        error = ApiException(http_resp=RESTResponse(response, data))
+        error.body = data.decode("utf-8")
+        raise error
+    return response
+
+
+async def request_json(
+    api_client,
+    method: str,
+    resource_path: str,
+    path_params: dict,
+    codec,
+    body=None,
+    content_type: str = "application/json",
+    **kwargs
+):
+    """
+    Send a request with the body encoded and the response decoded by codec.
+
+    Skips the kubernetes_asyncio serializer, which walks every body and always
+    uses the standard json module, so a faster codec handles both directions.
+
+    Args:
+        api_client: A kubernetes_asyncio ApiClient
+        method: The HTTP method
+        resource_path: The resource path, e.g. '/apis/{group}/{version}/namespaces/{namespace}/{plural}'
+        path_params: Values for the placeholders in resource_path
+        codec: A codec from ark_sdk.codec
+        body: The request body, sent as content_type
+        content_type: The request content type
+        **kwargs: Query options such as label_selector, limit or field_manager
+
+    Returns:
+        The decoded response body
+
+    Raises:
+        ApiException: If the API server returns a non-2xx status
+    """
+    configuration = api_client.configuration
+    for key, value in path_params.items():
+        resource_path = resource_path.replace(
+            "{%s}" % key, quote(str(value), safe=configuration.safe_chars_for_path_param)
+        )
+    query_params = [
+        (_QUERY_PARAMS[key], str(value).lower() if isinstance(value, bool) else value)
+        for key, value in kwargs.items() if value is not None
+    ]
+    headers = dict(api_client.default_headers)
+    headers["Accept"] = "application/json"
+    if body is not None:
+        headers["Content-Type"] = content_type
+    await api_client.update_params_for_auth(headers, query_params, ["BearerToken"])
+
+    url = configuration.host + resource_path
+    if query_params:
+        url += "?" + urlencode(query_params)
+    rest_client = api_client.rest_client
+    options = {}
+    if rest_client.proxy:
+        options["proxy"] = rest_client.proxy
+        options["proxy_headers"] = rest_client.proxy_headers
+    if getattr(rest_client, "server_hostname", None):
+        options["server_hostname"] = rest_client.server_hostname
+
+    response = await rest_client.pool_manager.request(
+        method,
+        url,
+        headers=headers,
+        data=None if body is None else codec.dumps(body),
+        timeout=aiohttp.ClientTimeout(),
+        **options,
+    )
+    data = await response.read()
+    if not 200 <= response.status <= 299:
+        error = ApiException(http_resp=RESTResponse(response, data))
+        error.body = data.decode("utf-8")
+        raise error
+    return codec.loads(data)
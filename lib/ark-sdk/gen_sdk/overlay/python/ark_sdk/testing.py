@@ -0,0 +1,611 @@
+"""In-process fake Kubernetes API server for ARK custom resources.
+
+Serves the custom resource endpoints the SDK uses over real HTTP, so clients,
+informers and services can be tested and benchmarked end to end without a
+cluster:
+
+    async with FakeApiServer(latency=0.002) as server:
+        client = ARKClientV1alpha1("default", pool=server.pool())
+        await client.agents.a_create(agent)
+
+For code running its own event loop, e.g. a FastAPI TestClient, run the
+server on a background thread with `with FakeApiServer() as server:` and
+point the shared pool at it with configure_client_pool(configuration=server.configuration()).
+"""
+import asyncio
+import base64
+import copy
+import json
+import threading
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from aiohttp import web
+from kubernetes_asyncio import client as async_client
+
+from ark_sdk.informer import match_labels, parse_label_selector
+from ark_sdk.k8s import partial_object_metadata
+
+ARK_API_VERSION = "ark.mckinsey.com/v1alpha1"
+
+# (group, version, plural, namespace, name)
+ObjectKey = Tuple[str, str, str, str, str]
+
+_REASONS = {
+    400: "BadRequest",
+    404: "NotFound",
+    409: "Conflict",
+    410: "Expired",
+    415: "UnsupportedMediaType",
+    422: "Invalid",
+    429: "TooManyRequests",
+    500: "InternalError",
+    503: "ServiceUnavailable",
+    504: "Timeout",
+}
+
+
+class ApiError(Exception):
+    """An API error returned to the client as a Status object"""
+
+    def __init__(self, code: int, message: str, reason: Optional[str] = None):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+        self.reason = reason or _REASONS.get(code, "Unknown")
+
+
+def status_body(code: int, message: str, reason: Optional[str] = None) -> Dict[str, Any]:
+    return {
+        "apiVersion": "v1",
+        "kind": "Status",
+        "metadata": {},
+        "status": "Failure",
+        "message": message,
+        "reason": reason or _REASONS.get(code, "Unknown"),
+        "code": code,
+    }
+
+
+def merge_patch(target: Any, patch: Any) -> Any:
+    """Apply a JSON merge patch (RFC 7386)"""
+    if not isinstance(patch, dict):
+        return copy.deepcopy(patch)
+    result = dict(target) if isinstance(target, dict) else {}
+    for key, value in patch.items():
+        if value is None:
+            result.pop(key, None)
+        else:
+            result[key] = merge_patch(result.get(key), value)
+    return result
+
+
+def json_patch(target: Dict[str, Any], operations: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Apply JSON patch (RFC 6902) add, replace, remove and test operations"""
+    document = copy.deepcopy(target)
+    for operation in operations:
+        op, path = operation.get("op"), operation.get("path", "")
+        keys = [key.replace("~1", "/").replace("~0", "~") for key in path.split("/")[1:]]
+        if not keys:
+            raise ApiError(422, f"Unsupported JSON patch path '{path}'")
+        parent = document
+        for key in keys[:-1]:
+            try:
+                parent = parent[int(key)] if isinstance(parent, list) else parent[key]
+            except (KeyError, IndexError, ValueError):
+                raise ApiError(422, f"JSON patch path '{path}' does not exist")
+        last = keys[-1]
+        try:
+            if op == "add":
+                if isinstance(parent, list):
+                    parent.insert(len(parent) if last == "-" else int(last), operation["value"])
+                else:
+                    parent[last] = operation["value"]
+            elif op == "replace":
+                if isinstance(parent, list):
+                    parent[int(last)] = operation["value"]
+                elif last not in parent:
+                    raise KeyError(last)
+                else:
+                    parent[last] = operation["value"]
+            elif op == "remove":
+                del parent[int(last) if isinstance(parent, list) else last]
+            elif op == "test":
+                current = parent[int(last)] if isinstance(parent, list) else parent[last]
+                if current != operation.get("value"):
+                    raise ApiError(422, f"JSON patch test failed at '{path}'")
+            else:
+                raise ApiError(422, f"Unsupported JSON patch operation '{op}'")
+        except (KeyError, IndexError, ValueError):
+            raise ApiError(422, f"JSON patch path '{path}' does not exist")
+    return document
+
+
+def make_resource(
+    kind: str,
+    name: str,
+    namespace: str = "default",
+    spec: Optional[Dict[str, Any]] = None,
+    status: Optional[Dict[str, Any]] = None,
+    labels: Optional[Dict[str, str]] = None,
+    api_version: str = ARK_API_VERSION
+) -> Dict[str, Any]:
+    """Build a resource dict for seeding a FakeApiServer with FakeApiServer.add"""
+    resource = {
+        "apiVersion": api_version,
+        "kind": kind,
+        "metadata": {"name": name, "namespace": namespace, "labels": labels or {}},
+        "spec": spec or {},
+    }
+    if status is not None:
+        resource["status"] = status
+    return resource
+
+
+def _is_true(value: Optional[str]) -> bool:
+    return (value or "").lower() in ("true", "1")
+
+
+class FakeApiServer:
+    """
+    Fake API server for namespaced ARK custom resources.
+
+    Supports create, get, list (label and metadata.name/metadata.namespace
+    field selectors, limit/continue pagination, PartialObjectMetadata), watch
+    from a resourceVersion with bookmarks and 410 Gone once the requested
+    version has left the event history, replace with optimistic concurrency,
+    merge/JSON/apply patches, delete and deletecollection.
+
+    Server-side apply is approximated by a merge patch that creates missing
+    objects; field ownership is not tracked.
+
+    Args:
+        latency: Seconds added to every request
+        history_size: Watch events kept for resuming watches
+        watch_timeout: Seconds a watch stays open without timeoutSeconds
+    """
+
+    def __init__(self, latency: float = 0.0, history_size: int = 1000, watch_timeout: float = 300.0):
+        self.latency = latency
+        self.history_size = history_size
+        self.watch_timeout = watch_timeout
+        self.objects: Dict[ObjectKey, Dict[str, Any]] = {}
+        self.resource_version = 0
+        self.requests: List[Tuple[str, str]] = []
+
+        self._history: List[Tuple[int, ObjectKey, str, Dict[str, Any]]] = []
+        self._errors: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._changed: Optional[asyncio.Event] = None
+        self._closing = False
+        self._runner: Optional[web.AppRunner] = None
+        self._thread: Optional[threading.Thread] = None
+        self.port: Optional[int] = None
+
+    @property
+    def host(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    def configuration(self) -> async_client.Configuration:
+        """A kubernetes_asyncio configuration pointing at the server"""
+        return async_client.Configuration(host=self.host)
+
+    def pool(self, **kwargs):
+        """An ApiClientPool using the server, taking the ApiClientPool arguments"""
+        from ark_sdk.versions import ApiClientPool
+        return ApiClientPool(configuration=self.configuration(), **kwargs)
+
+    async def start(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._changed = asyncio.Event()
+        self._closing = False
+        app = web.Application(middlewares=[self._middleware])
+        app.router.add_route("*", "/apis/{group}/{version}/namespaces/{namespace}/{plural}", self._collection)
+        app.router.add_route("*", "/apis/{group}/{version}/namespaces/{namespace}/{plural}/{name}", self._item)
+        app.router.add_route("GET", "/apis/{group}/{version}/{plural}", self._collection)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, "127.0.0.1", 0).start()
+        self.port = self._runner.addresses[0][1]
+
+    async def stop(self) -> None:
+        self._closing = True
+        self._wake()
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> "FakeApiServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.stop()
+
+    def __enter__(self) -> "FakeApiServer":
+        """Run the server on its own event loop in a daemon thread"""
+        loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=loop.run_forever, name="fake-apiserver", daemon=True)
+        self._thread.start()
+        asyncio.run_coroutine_threadsafe(self.start(), loop).result()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        loop = self._loop
+        asyncio.run_coroutine_threadsafe(self.stop(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        self._thread.join()
+        loop.close()
+        self._thread = None
+
+    def inject_error(
+        self,
+        status: int,
+        count: int = 1,
+        method: Optional[str] = None,
+        plural: Optional[str] = None,
+        retry_after: Optional[float] = None
+    ) -> None:
+        """
+        Fail the next count matching requests with a status code.
+
+        Args:
+            status: The HTTP status, e.g. 429, 500 or 503
+            count: Number of requests to fail
+            method: Only fail this HTTP method, e.g. 'GET'
+            plural: Only fail requests for this resource plural
+            retry_after: Seconds sent in a Retry-After header
+        """
+        with self._lock:
+            self._errors.append({
+                "status": status, "count": count, "method": method, "plural": plural, "retry_after": retry_after
+            })
+
+    def add(self, obj: Dict[str, Any]) -> Dict[str, Any]:
+        """Store an object directly, e.g. to seed the server, and return the stored copy"""
+        group, version = obj["apiVersion"].split("/")
+        kind = obj["kind"].lower()
+        plural = kind[:-1] + "ies" if kind.endswith("y") else kind + "s"
+        return self.add_resource(group, version, plural, obj)
+
+    def add_resource(self, group: str, version: str, plural: str, obj: Dict[str, Any]) -> Dict[str, Any]:
+        """Store an object under an explicit plural and return the stored copy"""
+        namespace = obj["metadata"].get("namespace", "default")
+        key = (group, version, plural, namespace, obj["metadata"]["name"])
+        with self._lock:
+            existing = self.objects.get(key)
+            stored = self._stamp(copy.deepcopy(obj), key, existing)
+            self.objects[key] = stored
+            self._record("MODIFIED" if existing else "ADDED", key, stored)
+        self._notify()
+        return copy.deepcopy(stored)
+
+    def _stamp(self, obj: Dict[str, Any], key: ObjectKey, existing: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Set server-managed metadata on an object being stored"""
+        self.resource_version += 1
+        metadata = obj.setdefault("metadata", {})
+        metadata["name"] = key[4]
+        metadata["namespace"] = key[3]
+        metadata["resourceVersion"] = str(self.resource_version)
+        if existing is None:
+            metadata["uid"] = str(uuid.uuid4())
+            metadata["creationTimestamp"] = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+            metadata["generation"] = 1
+        else:
+            old = existing["metadata"]
+            metadata["uid"] = old.get("uid")
+            metadata["creationTimestamp"] = old.get("creationTimestamp")
+            changed = obj.get("spec") != existing.get("spec")
+            metadata["generation"] = old.get("generation", 1) + (1 if changed else 0)
+        return obj
+
+    def _record(self, event_type: str, key: ObjectKey, obj: Dict[str, Any]) -> None:
+        self._history.append((self.resource_version, key, event_type, copy.deepcopy(obj)))
+        if len(self._history) > self.history_size:
+            del self._history[:len(self._history) - self.history_size]
+
+    def _notify(self) -> None:
+        """Wake watchers, from the server loop or from another thread"""
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            self._wake()
+        else:
+            loop.call_soon_threadsafe(self._wake)
+
+    def _wake(self) -> None:
+        if self._changed is not None:
+            self._changed.set()
+            self._changed = asyncio.Event()
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler):
+        self.requests.append((request.method, request.path_qs))
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        error = self._take_error(request)
+        if error is not None:
+            headers = {"Retry-After": str(error["retry_after"])} if error["retry_after"] is not None else None
+            return web.json_response(
+                status_body(error["status"], "Injected error"), status=error["status"], headers=headers
+            )
+        try:
+            return await handler(request)
+        except ApiError as e:
+            return web.json_response(status_body(e.code, e.message, e.reason), status=e.code)
+
+    def _take_error(self, request: web.Request) -> Optional[Dict[str, Any]]:
+        plural = request.match_info.get("plural")
+        with self._lock:
+            for error in self._errors:
+                if error["method"] not in (None, request.method) or error["plural"] not in (None, plural):
+                    continue
+                error["count"] -= 1
+                if error["count"] <= 0:
+                    self._errors.remove(error)
+                return error
+        return None
+
+    async def _body(self, request: web.Request) -> Any:
+        try:
+            return json.loads(await request.read())
+        except ValueError:
+            raise ApiError(400, "Request body is not valid JSON")
+
+    def _key(self, request: web.Request, name: Optional[str] = None) -> ObjectKey:
+        info = request.match_info
+        return (info["group"], info["version"], info["plural"], info["namespace"], name or info["name"])
+
+    def _get(self, key: ObjectKey) -> Dict[str, Any]:
+        obj = self.objects.get(key)
+        if obj is None:
+            raise ApiError(404, f'{key[2]} "{key[4]}" not found')
+        return obj
+
+    def _matching(self, request: web.Request) -> List[Tuple[ObjectKey, Dict[str, Any]]]:
+        """Objects of the collection matching the namespace and selectors, in name order"""
+        info = request.match_info
+        namespace = info.get("namespace")
+        try:
+            requirements = parse_label_selector(request.query.get("labelSelector"))
+        except ValueError as e:
+            raise ApiError(400, str(e))
+        fields = self._field_selector(request.query.get("fieldSelector"))
+        return [
+            (key, obj) for key, obj in sorted(self.objects.items())
+            if key[:3] == (info["group"], info["version"], info["plural"])
+            and (namespace is None or key[3] == namespace)
+            and self._matches(obj, requirements, fields)
+        ]
+
+    @staticmethod
+    def _field_selector(selector: Optional[str]) -> Dict[str, str]:
+        fields = {}
+        for part in filter(None, (selector or "").split(",")):
+            field, _, value = part.replace("==", "=").partition("=")
+            if field not in ("metadata.name", "metadata.namespace") or not value:
+                raise ApiError(400, f"Unsupported field selector: {part}")
+            fields[field.split(".")[1]] = value
+        return fields
+
+    @staticmethod
+    def _matches(obj: Dict[str, Any], requirements, fields: Dict[str, str]) -> bool:
+        metadata = obj["metadata"]
+        if any(metadata.get(field) != value for field, value in fields.items()):
+            return False
+        return match_labels(metadata.get("labels") or {}, requirements)
+
+    async def _collection(self, request: web.Request) -> web.StreamResponse:
+        if request.method == "GET":
+            if _is_true(request.query.get("watch")):
+                return await self._watch(request)
+            return self._list(request)
+        if "namespace" not in request.match_info:
+            raise ApiError(405, f"{request.method} is not supported for all namespaces", "MethodNotAllowed")
+        if request.method == "POST":
+            return await self._create(request)
+        if request.method == "DELETE":
+            return self._delete_collection(request)
+        raise ApiError(405, f"{request.method} is not supported on collections", "MethodNotAllowed")
+
+    async def _item(self, request: web.Request) -> web.Response:
+        if request.method == "GET":
+            with self._lock:
+                obj = self._get(self._key(request))
+            if "as=PartialObjectMetadata" in request.headers.get("Accept", ""):
+                obj = partial_object_metadata(obj)
+            return web.json_response(obj)
+        if request.method == "PUT":
+            return await self._replace(request)
+        if request.method == "PATCH":
+            return await self._patch(request)
+        if request.method == "DELETE":
+            return self._delete(request)
+        raise ApiError(405, f"{request.method} is not supported", "MethodNotAllowed")
+
+    def _list(self, request: web.Request) -> web.Response:
+        metadata_only = "as=PartialObjectMetadata" in request.headers.get("Accept", "")
+        with self._lock:
+            items = [obj for _, obj in self._matching(request)]
+            resource_version = str(self.resource_version)
+        offset = 0
+        token = request.query.get("continue")
+        if token:
+            try:
+                offset = json.loads(base64.urlsafe_b64decode(token))["offset"]
+            except (ValueError, KeyError):
+                raise ApiError(400, "Invalid continue token")
+        limit = int(request.query.get("limit") or 0)
+        page = items[offset:offset + limit] if limit else items[offset:]
+        list_metadata = {"resourceVersion": resource_version}
+        remaining = len(items) - offset - len(page)
+        if limit and remaining > 0:
+            next_offset = json.dumps({"offset": offset + len(page)}).encode()
+            list_metadata["continue"] = base64.urlsafe_b64encode(next_offset).decode()
+            list_metadata["remainingItemCount"] = remaining
+        group, version = request.match_info["group"], request.match_info["version"]
+        return web.json_response({
+            "apiVersion": "meta.k8s.io/v1" if metadata_only else f"{group}/{version}",
+            "kind": "PartialObjectMetadataList" if metadata_only else "List",
+            "metadata": list_metadata,
+            "items": [partial_object_metadata(obj) for obj in page] if metadata_only else page,
+        })
+
+    async def _create(self, request: web.Request) -> web.Response:
+        body = await self._body(request)
+        metadata = body.setdefault("metadata", {})
+        if not metadata.get("name"):
+            if not metadata.get("generateName"):
+                raise ApiError(422, "metadata.name or metadata.generateName is required")
+            metadata["name"] = metadata["generateName"] + uuid.uuid4().hex[:5]
+        key = self._key(request, metadata["name"])
+        with self._lock:
+            if key in self.objects:
+                raise ApiError(409, f'{key[2]} "{key[4]}" already exists', "AlreadyExists")
+            stored = self._stamp(body, key, None)
+            self.objects[key] = stored
+            self._record("ADDED", key, stored)
+        self._notify()
+        return web.json_response(stored, status=201)
+
+    async def _replace(self, request: web.Request) -> web.Response:
+        body = await self._body(request)
+        key = self._key(request)
+        with self._lock:
+            existing = self._get(key)
+            expected = (body.get("metadata") or {}).get("resourceVersion")
+            if expected and expected != existing["metadata"]["resourceVersion"]:
+                raise ApiError(409, f'Operation cannot be fulfilled on {key[2]} "{key[4]}": the object has been modified')
+            stored = self._stamp(body, key, existing)
+            self.objects[key] = stored
+            self._record("MODIFIED", key, stored)
+        self._notify()
+        return web.json_response(stored)
+
+    async def _patch(self, request: web.Request) -> web.Response:
+        content_type = request.headers.get("Content-Type", "").split(";")[0]
+        body = await self._body(request)
+        key = self._key(request)
+        with self._lock:
+            existing = self.objects.get(key)
+            if content_type == "application/apply-patch+yaml":
+                patched = merge_patch(existing or {}, body)
+            elif existing is None:
+                self._get(key)
+            elif content_type == "application/merge-patch+json":
+                patched = merge_patch(existing, body)
+            elif content_type == "application/json-patch+json":
+                if not isinstance(body, list):
+                    raise ApiError(400, "A JSON patch must be a list of operations")
+                patched = json_patch(existing, body)
+            else:
+                raise ApiError(415, f"Unsupported patch content type '{content_type}'")
+            stored = self._stamp(patched, key, existing)
+            self.objects[key] = stored
+            self._record("MODIFIED" if existing else "ADDED", key, stored)
+        self._notify()
+        return web.json_response(stored, status=200 if existing else 201)
+
+    def _delete(self, request: web.Request) -> web.Response:
+        key = self._key(request)
+        with self._lock:
+            self._get(key)
+            obj = self._remove(key)
+        self._notify()
+        return web.json_response(obj)
+
+    def _delete_collection(self, request: web.Request) -> web.Response:
+        with self._lock:
+            deleted = [self._remove(key) for key, _ in self._matching(request)]
+        self._notify()
+        return web.json_response({"kind": "List", "metadata": {}, "items": deleted})
+
+    def _remove(self, key: ObjectKey) -> Dict[str, Any]:
+        """Delete a stored object, recording the deletion at a new resourceVersion"""
+        obj = self.objects.pop(key)
+        self.resource_version += 1
+        obj["metadata"]["resourceVersion"] = str(self.resource_version)
+        self._record("DELETED", key, obj)
+        return obj
+
+    def _events_since(self, request: web.Request, resource_version: Optional[str]):
+        """Events to send for a watch starting at a resourceVersion
+
+        Returns the events and the version they reach, or None when the
+        version is older than the retained history.
+        """
+        info = request.match_info
+        collection = (info["group"], info["version"], info["plural"])
+        namespace = info.get("namespace")
+        if not resource_version or resource_version == "0":
+            # Synthetic ADDED events for the current state, as the API server does
+            events = [{"type": "ADDED", "object": obj} for _, obj in self._matching(request)]
+            return events, self.resource_version
+        start = int(resource_version)
+        oldest = self._history[0][0] if self._history else self.resource_version + 1
+        if start < oldest - 1 and start < self.resource_version:
+            return None
+        try:
+            requirements = parse_label_selector(request.query.get("labelSelector"))
+        except ValueError as e:
+            raise ApiError(400, str(e))
+        fields = self._field_selector(request.query.get("fieldSelector"))
+        events = [
+            {"type": event_type, "object": obj}
+            for version, key, event_type, obj in self._history
+            if version > start and key[:3] == collection
+            and (namespace is None or key[3] == namespace)
+            and self._matches(obj, requirements, fields)
+        ]
+        return events, max(start, self.resource_version)
+
+    async def _watch(self, request: web.Request) -> web.StreamResponse:
+        metadata_only = "as=PartialObjectMetadata" in request.headers.get("Accept", "")
+        timeout = float(request.query.get("timeoutSeconds") or self.watch_timeout)
+        bookmarks = _is_true(request.query.get("allowWatchBookmarks"))
+        deadline = asyncio.get_running_loop().time() + timeout
+        response = web.StreamResponse(headers={"Content-Type": "application/json"})
+        await response.prepare(request)
+
+        async def send(event: Dict[str, Any]) -> None:
+            if metadata_only and event["type"] != "ERROR":
+                event = {"type": event["type"], "object": partial_object_metadata(event["object"])}
+            await response.write(json.dumps(event).encode() + b"\n")
+
+        resource_version = request.query.get("resourceVersion")
+        try:
+            while not self._closing:
+                changed = self._changed
+                with self._lock:
+                    result = self._events_since(request, resource_version)
+                if result is None:
+                    await send({"type": "ERROR", "object": status_body(
+                        410, f"too old resource version: {resource_version}", "Expired"
+                    )})
+                    break
+                events, reached = result
+                for event in events:
+                    await send(event)
+                resource_version = str(reached)
+                remaining = deadline - asyncio.get_running_loop().time()
+                if remaining <= 0:
+                    if bookmarks:
+                        await send({"type": "BOOKMARK", "object": {
+                            "kind": request.match_info["plural"],
+                            "metadata": {"resourceVersion": resource_version},
+                        }})
+                    break
+                try:
+                    await asyncio.wait_for(changed.wait(), remaining)
+                except asyncio.TimeoutError:
+                    pass
+        except ConnectionResetError:
+            pass
+        return response
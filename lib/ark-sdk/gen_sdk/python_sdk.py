@@ -36,26 +36,20 @@ def generate_versioned_client(api_version: str, resources: List[Dict[str, Any]])
 
     to_class = lambda name: f"{name}{version_part.capitalize()}"
 
-    # Generate imports
-    imports = set()
-    for resource in resources:
-        model_class = resource['model_class']
-        kind = resource['kind']
-        imports.add(f"from .models.{to_snake_case(model_class)} import {to_class(kind)}")
-    
-    imports_str = '\n'.join(sorted(imports))
-    
-    # Generate resource client initializations
+    # Generate resource client initializations; models are referenced by
+    # import path so they are only imported when first used
     resource_inits = []
     for resource in resources:
         kind = resource['kind']
         attr_name = resource['plural']
+        model_path = f"ark_sdk.models.{to_snake_case(resource['model_class'])}.{to_class(kind)}"
         resource_init = f'''        self.{attr_name} = ARKResourceClient(
             api_version="{resource['api_version']}",
             kind="{resource['kind']}",
             plural="{resource['plural']}",
-            model_class={to_class(kind)},
-            namespace=namespace
+            model_class="{model_path}",
+            namespace=namespace,
+            pool=self.pool
         )'''
         resource_inits.append(resource_init)
     
@@ -64,14 +58,12 @@ def generate_versioned_client(api_version: str, resources: List[Dict[str, Any]])
     # Generate class
     return f'''
 
-{imports_str}
-
 
 class {class_name}(_ARKClient):
     """ARK client for API version {api_version}"""
     
-    def __init__(self, namespace: str = "default"):
-        super().__init__(namespace)
+    def __init__(self, namespace: str = "default", pool: Optional[ApiClientPool] = None):
+        super().__init__(namespace, pool)
         
 {resource_inits_str}
 '''
@@ -91,4 +83,62 @@ def generate_yaml_routing(resources: List[Dict[str, Any]]) -> str:
             condition = f"elif kind == '{kind}':\n            return self.{plural}.create({model_class}(**data))"
         conditions.append(condition)
     
-    return '\n        '.join(conditions)
\ No newline at end of file
+    return '\n        '.join(conditions)
+
+LAZY_IMPORT_RE = re.compile(r'^from (ark_sdk(?:\.\w+)+) import (\w+)(?: as \2)?$')
+
+
+def generate_lazy_init(init_source: str) -> str:
+    """Rewrite a generated package __init__ to import its members lazily
+    
+    openapi-generator imports every API and model module up front, which
+    dominates `import ark_sdk`. Each `from ark_sdk.x import Name` line becomes
+    an entry resolved by a module __getattr__ on first access. The original
+    imports are kept under TYPE_CHECKING for type checkers and IDEs.
+    """
+    if '_LAZY_IMPORTS' in init_source:
+        return init_source
+    
+    kept, imports, lazy = [], [], {}
+    for line in init_source.splitlines():
+        match = LAZY_IMPORT_RE.match(line.strip())
+        if match:
+            lazy[match.group(2)] = match.group(1)
+            imports.append(line.strip())
+        elif line.startswith('# import '):
+            continue
+        else:
+            kept.append(line)
+    
+    if not lazy:
+        return init_source
+    
+    entries = '\n'.join(f'    "{name}": "{module}",' for name, module in lazy.items())
+    type_imports = '\n'.join(f'    {line}' for line in imports)
+    body = '\n'.join(kept).rstrip()
+    return f'''{body}
+
+# Members are imported on first attribute access to keep package import cheap
+import importlib as _importlib
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
+_LAZY_IMPORTS = {{
+{entries}
+}}
+
+if _TYPE_CHECKING:
+{type_imports}
+
+
+def __getattr__(name):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {{__name__!r}} has no attribute {{name!r}}")
+    value = getattr(_importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+'''
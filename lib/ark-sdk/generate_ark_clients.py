@@ -16,7 +16,8 @@ from gen_sdk import extract_api_versions
 from gen_sdk.python_sdk import (
     generate_base_client,
     generate_versioned_client,
-    generate_yaml_routing
+    generate_yaml_routing,
+    generate_lazy_init
 )
 from gen_sdk.python_sdk_tests import (
     generate_test_base,
@@ -29,11 +30,20 @@ from gen_sdk.python_sdk_tests import (
 def main():
     """Main function to generate ARK clients from OpenAPI schema"""
     parser = argparse.ArgumentParser(description='Generate ARK Client Classes from OpenAPI Schema')
-    parser.add_argument('schema_path', help='Path to OpenAPI schema JSON file')
+    parser.add_argument('schema_path', nargs='?', help='Path to OpenAPI schema JSON file')
     parser.add_argument('-v', '--version', action='store_true', help='Generate version info to stdout')
     parser.add_argument('-t', '--test', action='store_true', help='Generate unittest tests for the generated clients')
+    parser.add_argument('-l', '--lazy-init', metavar='PACKAGE_DIR', help='Rewrite the generated package __init__ files to import lazily')
     
     args = parser.parse_args()
+    if args.lazy_init: # Handle -l flag - rewrite generated __init__ files in place
+        for init_path in [Path(args.lazy_init) / '__init__.py', Path(args.lazy_init) / 'models' / '__init__.py']:
+            print(f"Rewriting {init_path} for lazy imports...", file=sys.stderr)
+            init_path.write_text(generate_lazy_init(init_path.read_text()))
+        return
+    if not args.schema_path:
+        parser.print_help()
+        sys.exit(1)
     # Load OpenAPI schema
     print(f"Loading OpenAPI schema from {args.schema_path}...", file=sys.stderr)
     with open(args.schema_path, 'r') as f:
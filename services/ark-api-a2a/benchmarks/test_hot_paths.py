@@ -0,0 +1,57 @@
+"""
+Benchmarks of a2agw hot paths against the in-process fake API server.
+
+Set FAKE_APISERVER_LATENCY (seconds) to model a remote API server.
+Run with: make ark-api-a2a-benchmark
+"""
+import asyncio
+import os
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from ark_sdk.client import close_clients, configure_client_pool
+from ark_sdk.testing import FakeApiServer, make_resource
+
+from a2agw.manager import DynamicManager
+from a2agw.registry import AgentRegistry
+
+NAMESPACE = "default"
+AGENTS = 50
+
+
+@pytest.fixture(scope="module")
+def run():
+    """Run coroutines on one event loop, so SDK connections are reused across rounds"""
+    with FakeApiServer(latency=float(os.getenv("FAKE_APISERVER_LATENCY", "0"))) as server:
+        for i in range(AGENTS):
+            server.add(make_resource("Agent", f"agent-{i}", NAMESPACE, spec={
+                "description": f"Agent {i}",
+                "prompt": "You are a helpful assistant.",
+            }))
+        configure_client_pool(configuration=server.configuration())
+        loop = asyncio.new_event_loop()
+        yield loop.run_until_complete
+        loop.run_until_complete(close_clients())
+        loop.close()
+
+
+def test_list_agents(benchmark, run):
+    registry = AgentRegistry(NAMESPACE)
+    cards = benchmark(lambda: run(registry.list_agents()))
+    assert len(cards) == AGENTS
+
+
+def test_get_agent(benchmark, run):
+    registry = AgentRegistry(NAMESPACE)
+    card = benchmark(lambda: run(registry.get_agent("agent-1")))
+    assert card.name == "agent-1"
+
+
+def test_unchanged_registry_sync(benchmark, run):
+    manager = DynamicManager()
+    manager.registry = AgentRegistry(NAMESPACE)
+    run(manager._sync_with_registry())
+    benchmark(lambda: run(manager._sync_with_registry()))
+    assert len(manager.agents) == AGENTS
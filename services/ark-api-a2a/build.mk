@@ -34,7 +34,7 @@ CLEAN_TARGETS += $(ARK_API_A2A_SERVICE_DIR)/.coverage
 CLEAN_TARGETS += $(ARK_API_A2A_SERVICE_DIR)/htmlcov
 
 # Define phony targets
-.PHONY: $(ARK_API_A2A_SERVICE_NAME)-build $(ARK_API_A2A_SERVICE_NAME)-install $(ARK_API_A2A_SERVICE_NAME)-uninstall $(ARK_API_A2A_SERVICE_NAME)-dev $(ARK_API_A2A_SERVICE_NAME)-test
+.PHONY: $(ARK_API_A2A_SERVICE_NAME)-build $(ARK_API_A2A_SERVICE_NAME)-install $(ARK_API_A2A_SERVICE_NAME)-uninstall $(ARK_API_A2A_SERVICE_NAME)-dev $(ARK_API_A2A_SERVICE_NAME)-test $(ARK_API_A2A_SERVICE_NAME)-benchmark
 
 # Dependencies
 $(ARK_API_A2A_SERVICE_NAME)-deps: $(ARK_API_A2A_STAMP_DEPS)
@@ -54,6 +54,10 @@ $(ARK_API_A2A_STAMP_TEST): $(ARK_API_A2A_STAMP_DEPS)
 	uv run coverage lcov
 	@touch $@
 
+# Benchmark target (not stamped, results vary between runs)
+$(ARK_API_A2A_SERVICE_NAME)-benchmark: $(ARK_API_A2A_STAMP_DEPS) # HELP: Run ARK A2A Gateway benchmarks against a fake API server
+	cd $(ARK_API_A2A_SERVICE_DIR) && uv run --with pytest --with pytest-benchmark pytest benchmarks --benchmark-only
+
 # Build target
 $(ARK_API_A2A_SERVICE_NAME)-build: $(ARK_API_A2A_STAMP_BUILD) # HELP: Build ARK A2A Gateway service Docker image
 $(ARK_API_A2A_STAMP_BUILD): $(ARK_API_A2A_STAMP_TEST) $(ARK_SDK_WHL)
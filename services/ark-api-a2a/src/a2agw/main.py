@@ -6,6 +6,8 @@ from datetime import datetime
 from importlib.metadata import version
 
 import uvicorn
+from ark_sdk.client import close_clients, get_client_pool
+from ark_sdk.instrumentation import OpenTelemetryHook
 from ark_sdk.k8s import init_k8s
 from fastapi import FastAPI, Request
 from fastapi.exceptions import RequestValidationError
@@ -55,6 +57,9 @@ def setup_telemetry():
     span_processor = BatchSpanProcessor(otlp_exporter)
     tracer_provider.add_span_processor(span_processor)
     
+    # Trace the Kubernetes API calls made through ark_sdk
+    get_client_pool().add_hook(OpenTelemetryHook())
+    
     logger.info(f"Telemetry initialized for {service_name} -> {otel_endpoint}")
 
 def extract_session_context(request: Request):
@@ -79,7 +84,7 @@ async def lifespan(app: FastAPI):
     
     await init_k8s()
     
-    # Initialize manager and start periodic sync
+    # Initialize manager and start watching agents
     await manager.initialize()
     
     app.mount("/agent", manager.app)
@@ -89,6 +94,7 @@ async def lifespan(app: FastAPI):
     # Shutdown manager on app shutdown
     logger.info("Shutting down ARK A2A GW...")
     await manager.shutdown()
+    await close_clients()
 
 app = FastAPI(
     title="A2AGW - Agent-to-Agent Gateway",
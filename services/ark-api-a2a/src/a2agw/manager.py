@@ -7,7 +7,7 @@ import threading
 from a2a.server.apps import A2AStarletteApplication
 from a2a.server.request_handlers import DefaultRequestHandler
 from a2a.server.tasks import InMemoryTaskStore
-from ark_sdk.k8s import get_namespace, is_k8s
+from ark_sdk.k8s import get_namespace
 from starlette.applications import Starlette
 from starlette.types import ASGIApp, Receive, Scope, Send
 
@@ -16,7 +16,8 @@ from .registry import get_registry
 
 logger = logging.getLogger(__name__)
 
-POLL_INTERVAL = 30 if is_k8s() else int(os.getenv('A2A_POLL_INTERVAL_SECONDS', 3))
+# Seconds to wait before resyncing and restarting the agent watch after it failed
+WATCH_RETRY_INTERVAL = int(os.getenv('A2A_WATCH_RETRY_SECONDS', 5))
 
 
 class ProxyApp:
@@ -88,43 +89,69 @@ class DynamicManager:
         self.lock = threading.Lock()
         self.app = ProxyApp()  # Use proxy instead of Starlette
         self.registry = get_registry()
-        self._refresh_task = None
+        self._agent_versions = None
+        self._watch_task = None
         self._running = False
 
-    async def start_periodic_sync(self):
-        """Start the periodic registry sync task"""
-        if self._refresh_task is None:
+    async def start_watch(self):
+        """Start the task applying agent changes from the registry watch"""
+        if self._watch_task is None:
             self._running = True
-            self._refresh_task = asyncio.create_task(self._periodic_sync_loop())
-            logger.info(f"Started periodic registry sync task ({POLL_INTERVAL}s)")
+            self._watch_task = asyncio.create_task(self._watch_loop())
+            logger.info("Started agent watch")
     
-    async def stop_periodic_sync(self):
-        """Stop the periodic registry sync task"""
+    async def stop_watch(self):
+        """Stop the agent watch task"""
         self._running = False
-        if self._refresh_task:
-            self._refresh_task.cancel()
+        if self._watch_task:
+            self._watch_task.cancel()
             with contextlib.suppress(asyncio.CancelledError):
-                await self._refresh_task
-            self._refresh_task = None
-            logger.info("Stopped periodic registry sync task")
+                await self._watch_task
+            self._watch_task = None
+            logger.info("Stopped agent watch")
     
-    async def _periodic_sync_loop(self):
-        """Periodically sync agents with registry every 30 seconds"""
+    async def _watch_loop(self):
+        """Update routes as soon as the registry watch reports agent changes"""
         while self._running:
             try:
-                await self._sync_with_registry()
+                async for event_type, name, card in self.registry.watch_agents():
+                    self._apply_agent_event(event_type, name, card)
             except Exception as e:
-                logger.error(f"Error during registry sync: {e}", exc_info=True)
+                logger.error(f"Agent watch failed: {e}", exc_info=True)
             
-            # Wait N seconds before next sync
+            # The watch reconnects by itself and only ends on errors it cannot
+            # retry, e.g. missing RBAC; resync in full before watching again
             try:
-                await asyncio.sleep(POLL_INTERVAL)
+                await asyncio.sleep(WATCH_RETRY_INTERVAL)
             except asyncio.CancelledError:
                 break
+            await self._sync_with_registry()
+    
+    def _apply_agent_event(self, event_type: str, name: str, card):
+        """Apply one watched agent change, updating routes if it changed anything"""
+        with self.lock:
+            if event_type == 'DELETED':
+                if self.agents.pop(name, None) is None:
+                    return
+                logger.info(f"Removed agent: {name}")
+            else:
+                if self.agents.get(name) == card:
+                    return
+                self.agents[name] = card
+                logger.info(f"Added/Updated agent: {name}")
+            # Versions seen by the last full sync no longer describe the routes
+            self._agent_versions = None
+        self._update_routes()
     
     async def _sync_with_registry(self):
         """Sync agents with registry and update routes if needed"""
         try:
+            # Cheap metadata-only check before fetching full agent specs
+            agent_versions = await self.registry.list_agent_versions()
+            if agent_versions == self._agent_versions:
+                logger.debug("No agent changes detected, routes unchanged")
+                return
+            
             # Get current agents from registry
             logger.debug("Fetching agents from registry...")
             agent_cards = await self.registry.list_agents()
@@ -157,21 +184,22 @@ class DynamicManager:
                 self._update_routes()
             else:
                 logger.debug("No agent changes detected, routes unchanged")
+            self._agent_versions = agent_versions
                 
         except Exception as e:
             logger.error(f"Failed to sync with registry: {e}", exc_info=True)
 
     async def initialize(self):
-        """Initialize the manager with agents from registry and start periodic sync"""
+        """Initialize the manager with agents from registry and start watching for changes"""
         # Do initial sync
         await self._sync_with_registry()
         
-        # Start periodic sync task
-        await self.start_periodic_sync()
+        # Start watch task
+        await self.start_watch()
     
     async def shutdown(self):
-        """Shutdown the manager and stop periodic sync"""
-        await self.stop_periodic_sync()
+        """Shutdown the manager and stop the agent watch"""
+        await self.stop_watch()
 
     def _update_routes(self):
         # Create a new Starlette app with all routes
@@ -1,7 +1,5 @@
-import asyncio
 import logging
 import uuid
-from datetime import datetime
 
 from ark_sdk.client import V1_ALPHA1, with_ark_client
 from ark_sdk.models.query_v1alpha1 import QueryV1alpha1
@@ -65,34 +63,30 @@ async def wait_for_query(namespace: str, query_name: str, timeout: int = 60) ->
     """
     async with with_ark_client(namespace, V1_ALPHA1) as ark_client:
         try:
-            # Poll for completion
-            start_time = datetime.now()
-            while (datetime.now() - start_time).total_seconds() < timeout:
-                # Get latest status
-                query_status = await ark_client.queries.a_get(query_name)
-
-                if query_status.status and query_status.status.phase:
-                    phase = query_status.status.phase
-                    logger.debug(f"Query {query_name} phase: {phase}")
-
-                    if phase == "done":
-                        # Extract response content
-                        if query_status.status.responses:
-                            response = query_status.status.responses[0]
-                            return response.content or "No response content"
-                        return "Query completed but no response available"
-
-                    elif phase == "error":
-                        error_msg = "Query failed"
-                        if query_status.status.responses:
-                            error_msg = query_status.status.responses[0].content or error_msg
-                        raise Exception(f"Query error: {error_msg}")
-
-                # Wait before next poll
-                await asyncio.sleep(1)
-
-            # Timeout reached
-            raise Exception(f"Query timeout after {timeout} seconds")
+            # Watch the query until it reaches a terminal phase
+            try:
+                query_status = await ark_client.queries.a_wait_for(
+                    query_name,
+                    lambda q: bool(q.status and q.status.phase in ("done", "error")),
+                    timeout=timeout,
+                )
+            except TimeoutError as e:
+                raise Exception(f"Query timeout after {timeout} seconds") from e
+
+            phase = query_status.status.phase
+            logger.debug(f"Query {query_name} phase: {phase}")
+
+            if phase == "error":
+                error_msg = "Query failed"
+                if query_status.status.responses:
+                    error_msg = query_status.status.responses[0].content or error_msg
+                raise Exception(f"Query error: {error_msg}")
+
+            # Extract response content
+            if query_status.status.responses:
+                response = query_status.status.responses[0]
+                return response.content or "No response content"
+            return "Query completed but no response available"
 
         except Exception as e:
             logger.error(f"Error waiting for query: {str(e)}")
@@ -21,11 +21,11 @@ def get_external(agent_name):
     scheme, host, port, path = _get_external_info()
     return f"{scheme}://{host}:{port}{path}/agent/{agent_name}/"
 
-def ark_to_agent_card(ark_agent) -> AgentCard:
-    metadata = ark_agent.metadata
+def ark_to_agent_card(ark_agent: dict) -> AgentCard:
+    metadata = ark_agent['metadata']
     annotations = metadata.get('annotations', {})
     skills = annotations.get('a2a.mckinsey.com/skill', [])
-    spec = ark_agent.spec
+    spec = ark_agent.get('spec', {})
     
     # Create capabilities object
     capabilities = AgentCapabilities(
@@ -57,7 +57,7 @@ def ark_to_agent_card(ark_agent) -> AgentCard:
     
     return AgentCard(
         name=metadata["name"],
-        description=spec.description or "No description",
+        description=spec.get('description') or "No description",
         capabilities=capabilities,
         skills=skills_list,
         url=get_external(metadata['name']),
@@ -73,14 +73,31 @@ class AgentRegistry:
 
     async def get_agent(self, name: str) -> AgentCard | None:
         async with with_ark_client(self._namespace, V1_ALPHA1) as ark_client:
-            agent = await ark_client.agents.a_get(name)
+            agent = await ark_client.agents.a_get(name, raw=True)
             return ark_to_agent_card(agent)
 
     async def list_agents(self) -> list[AgentCard]:
         async with with_ark_client(self._namespace, V1_ALPHA1) as ark_client:
-            agents = await ark_client.agents.a_list()
+            agents = await ark_client.agents.a_list(raw=True)
             return [ark_to_agent_card(a) for a in agents]
 
+    async def list_agent_versions(self) -> dict[str, str]:
+        """Map agent names to resourceVersions using a metadata-only list"""
+        async with with_ark_client(self._namespace, V1_ALPHA1) as ark_client:
+            agents = await ark_client.agents.a_list_metadata()
+            return {a['metadata']['name']: a['metadata'].get('resourceVersion') for a in agents}
+
+    async def watch_agents(self):
+        """Yield (event type, agent name, AgentCard or None if deleted) as agents change
+
+        Starts with an ADDED event for every existing agent.
+        """
+        async with with_ark_client(self._namespace, V1_ALPHA1) as ark_client:
+            async for event in ark_client.agents.a_watch(raw=True):
+                name = event.object['metadata']['name']
+                card = None if event.type == 'DELETED' else ark_to_agent_card(event.object)
+                yield event.type, name, card
+
     async def find_agents_by_capability(self, capability: str) -> list[AgentCard]:
         agents = await self.list_agents()
         return [agent for agent in agents if any(capability in skill.name for skill in agent.skills)]
@@ -85,13 +85,19 @@ class TestDynamicManager(unittest.IsolatedAsyncioTestCase):
         self.mock_registry = AsyncMock()
         self.mock_get_registry.return_value = self.mock_registry
         
+        # By default the watch reports no changes
+        async def no_changes():
+            await asyncio.Event().wait()
+            yield
+        self.mock_registry.watch_agents = MagicMock(side_effect=no_changes)
+        
         self.manager = DynamicManager()
     
     def tearDown(self):
         self.patcher.stop()
     
-    async def test_initialize_starts_periodic_sync(self):
-        """Test that initialize starts the periodic sync task"""
+    async def test_initialize_starts_watch(self):
+        """Test that initialize starts the agent watch task"""
         # Mock registry to return empty list
         self.mock_registry.list_agents.return_value = []
         
@@ -101,15 +107,15 @@ class TestDynamicManager(unittest.IsolatedAsyncioTestCase):
         # Verify sync was called
         self.mock_registry.list_agents.assert_called_once()
         
-        # Verify periodic task was started
-        self.assertIsNotNone(self.manager._refresh_task)
+        # Verify watch task was started
+        self.assertIsNotNone(self.manager._watch_task)
         self.assertTrue(self.manager._running)
         
         # Clean up
         await self.manager.shutdown()
     
-    async def test_shutdown_stops_periodic_sync(self):
-        """Test that shutdown stops the periodic sync task"""
+    async def test_shutdown_stops_watch(self):
+        """Test that shutdown stops the agent watch task"""
         # Initialize first
         self.mock_registry.list_agents.return_value = []
         await self.manager.initialize()
@@ -119,7 +125,7 @@ class TestDynamicManager(unittest.IsolatedAsyncioTestCase):
         
         # Verify task was stopped
         self.assertFalse(self.manager._running)
-        self.assertIsNone(self.manager._refresh_task)
+        self.assertIsNone(self.manager._watch_task)
     
     def test_app_is_proxy(self):
         """Test that manager.app is a ProxyApp instance"""
@@ -157,6 +163,7 @@ class TestDynamicManager(unittest.IsolatedAsyncioTestCase):
         mock_a2a_app.return_value.build.return_value = MagicMock()
         
         # First sync - one agent
+        self.mock_registry.list_agent_versions.return_value = {"agent1": "1"}
         self.mock_registry.list_agents.return_value = [agent1]
         await self.manager.initialize()
         
@@ -164,7 +171,8 @@ class TestDynamicManager(unittest.IsolatedAsyncioTestCase):
         initial_app = self.manager.app._app
         self.assertIsNotNone(initial_app)
         
-        # Second sync - two agents (simulating periodic sync)
+        # Second sync - two agents (simulating a resync)
+        self.mock_registry.list_agent_versions.return_value = {"agent1": "1", "agent2": "2"}
         self.mock_registry.list_agents.return_value = [agent1, agent2]
         await self.manager._sync_with_registry()
         
@@ -187,24 +195,90 @@ class TestDynamicManager(unittest.IsolatedAsyncioTestCase):
         # Verify registry was called
         self.mock_registry.list_agents.assert_called_once()
     
-    @patch('src.a2agw.manager.POLL_INTERVAL', 0.1)  # Speed up test
-    async def test_periodic_sync_runs_periodically(self):
-        """Test that periodic sync runs at intervals"""
-        # Mock registry
+    async def test_sync_skips_full_list_when_versions_unchanged(self):
+        """Test that agents are only fetched when their resourceVersions change"""
+        self.mock_registry.list_agent_versions.return_value = {"agent1": "1"}
         self.mock_registry.list_agents.return_value = []
         
-        # Start periodic sync
-        await self.manager.start_periodic_sync()
+        await self.manager._sync_with_registry()
+        await self.manager._sync_with_registry()
         
-        # Wait for multiple intervals
-        await asyncio.sleep(0.25)
+        self.assertEqual(self.mock_registry.list_agent_versions.call_count, 2)
+        self.mock_registry.list_agents.assert_called_once()
+    
+    def _card(self, name, description="Test agent"):
+        from a2a.types import AgentCapabilities
+        return AgentCard(
+            name=name,
+            description=description,
+            skills=[],
+            url=f"http://localhost:7184/agent/{name}",
+            version="1.0.0",
+            capabilities=AgentCapabilities(streaming=True, pushNotifications=False, stateTransitionHistory=False),
+            defaultInputModes=["text"],
+            defaultOutputModes=["text"]
+        )
+    
+    @patch('src.a2agw.manager.A2AStarletteApplication')
+    async def test_watch_events_update_routes(self, mock_a2a_app):
+        """Test that watched agent changes are applied without polling"""
+        mock_a2a_app.return_value.build.return_value = MagicMock()
+        applied = asyncio.Event()
+        
+        async def events():
+            yield 'ADDED', 'agent1', self._card('agent1')
+            yield 'ADDED', 'agent2', self._card('agent2')
+            yield 'MODIFIED', 'agent1', self._card('agent1', "Changed")
+            yield 'DELETED', 'agent2', None
+            applied.set()
+            await asyncio.Event().wait()
+        self.mock_registry.watch_agents = MagicMock(side_effect=events)
+        
+        await self.manager.start_watch()
+        await asyncio.wait_for(applied.wait(), 5)
+        
+        self.assertEqual(list(self.manager.agents), ['agent1'])
+        self.assertEqual(self.manager.agents['agent1'].description, "Changed")
+        # Routes are rebuilt for every agent after each of the four changes
+        self.assertEqual(mock_a2a_app.call_count, 1 + 2 + 2 + 1)
+        self.mock_registry.list_agents.assert_not_called()
+        
+        await self.manager.stop_watch()
+    
+    @patch('src.a2agw.manager.A2AStarletteApplication')
+    async def test_unchanged_agents_keep_routes(self, mock_a2a_app):
+        """Test that ADDED events for already known agents do not rebuild routes"""
+        self.manager.agents = {'agent1': self._card('agent1')}
         
-        # Verify multiple syncs happened
-        self.assertGreaterEqual(self.mock_registry.list_agents.call_count, 2)
+        self.manager._apply_agent_event('ADDED', 'agent1', self._card('agent1'))
+        self.manager._apply_agent_event('DELETED', 'unknown', None)
         
-        # Clean up
-        await self.manager.stop_periodic_sync()
-
+        mock_a2a_app.assert_not_called()
+    
+    @patch('src.a2agw.manager.WATCH_RETRY_INTERVAL', 0)
+    async def test_watch_failure_resyncs(self):
+        """Test that a failed watch is followed by a full sync and a new watch"""
+        self.mock_registry.list_agent_versions.return_value = {}
+        self.mock_registry.list_agents.return_value = []
+        watching = asyncio.Event()
+        
+        async def failing():
+            raise Exception("Forbidden")
+            yield
+        
+        async def no_changes():
+            watching.set()
+            await asyncio.Event().wait()
+            yield
+        self.mock_registry.watch_agents = MagicMock(side_effect=[failing(), no_changes()])
+        
+        await self.manager.start_watch()
+        await asyncio.wait_for(watching.wait(), 5)
+        
+        self.mock_registry.list_agent_versions.assert_called_once()
+        self.assertEqual(self.mock_registry.watch_agents.call_count, 2)
+        
+        await self.manager.stop_watch()
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
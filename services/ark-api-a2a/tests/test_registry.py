@@ -1,4 +1,5 @@
 import unittest
+from types import SimpleNamespace
 from unittest import IsolatedAsyncioTestCase
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -9,9 +10,7 @@ class TestAgentRegistry(IsolatedAsyncioTestCase):
     def setUp(self):
         """Set up test fixtures"""
         # Create mock ARK agent
-        self.mock_ark_agent = MagicMock()
-        self.mock_ark_agent.metadata = {"name": "test-agent"}
-        self.mock_ark_agent.spec.description = "Test agent description"
+        self.mock_ark_agent = {"metadata": {"name": "test-agent"}, "spec": {"description": "Test agent description"}}
 
         # Create mock ARK client
         self.mock_client = AsyncMock()
@@ -34,13 +33,9 @@ class TestAgentRegistry(IsolatedAsyncioTestCase):
 
     async def test_list_agents(self):
         # Setup mock agents
-        agent1 = MagicMock()
-        agent1.metadata = {"name": "agent-1"}
-        agent1.spec.description = "Agent 1 description"
+        agent1 = {"metadata": {"name": "agent-1"}, "spec": {"description": "Agent 1 description"}}
 
-        agent2 = MagicMock()
-        agent2.metadata = {"name": "agent-2"}
-        agent2.spec.description = "Agent 2 description"
+        agent2 = {"metadata": {"name": "agent-2"}, "spec": {"description": "Agent 2 description"}}
 
         self.mock_client.agents.a_list.return_value = [agent1, agent2]
 
@@ -62,7 +57,7 @@ class TestAgentRegistry(IsolatedAsyncioTestCase):
         self.assertIsNotNone(agent_card)
         self.assertEqual(agent_card.name, "test-agent")
         self.assertEqual(agent_card.description, "Test agent description")
-        self.mock_client.agents.a_get.assert_called_once_with("test-agent")
+        self.mock_client.agents.a_get.assert_called_once_with("test-agent", raw=True)
 
     async def test_get_nonexistent_agent(self):
         self.mock_client.agents.a_get.side_effect = Exception("Agent not found")
@@ -72,15 +67,43 @@ class TestAgentRegistry(IsolatedAsyncioTestCase):
         with self.assertRaisesRegex(Exception, "Agent not found"):
             await registry.get_agent("nonexistent")
 
+    async def test_list_agent_versions(self):
+        self.mock_client.agents.a_list_metadata.return_value = [
+            {"metadata": {"name": "agent-1", "resourceVersion": "11"}},
+            {"metadata": {"name": "agent-2", "resourceVersion": "12"}},
+        ]
+
+        registry = AgentRegistry(namespace="test-namespace")
+        versions = await registry.list_agent_versions()
+
+        self.assertEqual(versions, {"agent-1": "11", "agent-2": "12"})
+        self.mock_client.agents.a_list.assert_not_called()
+
+    async def test_watch_agents(self):
+        events = [
+            SimpleNamespace(type="ADDED", object=self.mock_ark_agent),
+            SimpleNamespace(type="DELETED", object={"metadata": {"name": "old-agent"}}),
+        ]
+
+        async def watch(**kwargs):
+            for event in events:
+                yield event
+
+        self.mock_client.agents.a_watch = MagicMock(side_effect=watch)
+
+        registry = AgentRegistry(namespace="test-namespace")
+        changes = [change async for change in registry.watch_agents()]
+
+        self.assertEqual([(event_type, name) for event_type, name, _ in changes], [("ADDED", "test-agent"), ("DELETED", "old-agent")])
+        self.assertEqual(changes[0][2].description, "Test agent description")
+        self.assertIsNone(changes[1][2])
+        self.mock_client.agents.a_watch.assert_called_once_with(raw=True)
+
     async def test_find_agents_by_capability(self):
         # Create agents with different capabilities
-        agent1 = MagicMock()
-        agent1.metadata = {"name": "data-agent"}
-        agent1.spec.description = "Data processing agent"
+        agent1 = {"metadata": {"name": "data-agent"}, "spec": {"description": "Data processing agent"}}
 
-        agent2 = MagicMock()
-        agent2.metadata = {"name": "task-agent"}
-        agent2.spec.description = "Task management agent"
+        agent2 = {"metadata": {"name": "task-agent"}, "spec": {"description": "Task management agent"}}
 
         self.mock_client.agents.a_list.return_value = [agent1, agent2]
 
@@ -96,9 +119,7 @@ class TestAgentRegistry(IsolatedAsyncioTestCase):
 
     async def test_ark_to_agent_card_conversion(self):
         # Test the ark_to_agent_card conversion function
-        ark_agent = MagicMock()
-        ark_agent.metadata = {"name": "converted-agent"}
-        ark_agent.spec.description = "Converted agent description"
+        ark_agent = {"metadata": {"name": "converted-agent"}, "spec": {"description": "Converted agent description"}}
 
         agent_card = ark_to_agent_card(ark_agent)
 
@@ -111,9 +132,7 @@ class TestAgentRegistry(IsolatedAsyncioTestCase):
 
     async def test_ark_to_agent_card_no_description(self):
         # Test conversion when description is None
-        ark_agent = MagicMock()
-        ark_agent.metadata = {"name": "no-desc-agent"}
-        ark_agent.spec.description = None
+        ark_agent = {"metadata": {"name": "no-desc-agent"}, "spec": {"description": None}}
 
         agent_card = ark_to_agent_card(ark_agent)
 
@@ -0,0 +1,88 @@
+"""
+Benchmarks of ark-api hot paths against the in-process fake API server.
+
+Requests go through the real routes, ark_sdk clients and HTTP, with only the
+Kubernetes API server faked. Set FAKE_APISERVER_LATENCY (seconds) to model a
+remote API server. Run with: make ark-api-benchmark
+"""
+import itertools
+import os
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from ark_sdk.client import configure_client_pool
+from ark_sdk.testing import FakeApiServer, make_resource
+from fastapi.testclient import TestClient
+
+from ark_api.main import app
+
+NAMESPACE = "default"
+ITEMS = 100
+
+
+def seed(server: FakeApiServer) -> None:
+    for i in range(ITEMS):
+        server.add(make_resource("Agent", f"agent-{i}", NAMESPACE, spec={
+            "description": f"Agent {i}",
+            "prompt": "You are a helpful assistant. " * 20,
+            "modelRef": {"name": "default"},
+        }))
+        server.add(make_resource("Query", f"query-{i}", NAMESPACE, spec={
+            "input": f"Summarise the quarterly results for region {i}",
+            "targets": [{"type": "agent", "name": f"agent-{i}"}],
+        }, status={
+            "phase": "done",
+            "responses": [{"target": {"type": "agent", "name": f"agent-{i}"}, "content": "Revenue grew. " * 200}],
+        }))
+
+
+@pytest.fixture(scope="module")
+def client():
+    with FakeApiServer(latency=float(os.getenv("FAKE_APISERVER_LATENCY", "0"))) as server:
+        seed(server)
+        configure_client_pool(configuration=server.configuration())
+        with patch("ark_api.main.init_k8s", new_callable=AsyncMock):
+            with TestClient(app) as test_client:
+                yield test_client
+
+
+def test_list_agents(benchmark, client):
+    response = benchmark(client.get, f"/v1/namespaces/{NAMESPACE}/agents")
+    assert response.status_code == 200
+    assert response.json()["count"] == ITEMS
+
+
+def test_get_agent(benchmark, client):
+    response = benchmark(client.get, f"/v1/namespaces/{NAMESPACE}/agents/agent-1")
+    assert response.status_code == 200
+    assert response.json()["name"] == "agent-1"
+
+
+def test_update_agent(benchmark, client):
+    response = benchmark(client.put, f"/v1/namespaces/{NAMESPACE}/agents/agent-2", json={"description": "Updated"})
+    assert response.status_code == 200
+    assert response.json()["description"] == "Updated"
+
+
+def test_list_queries_page(benchmark, client):
+    response = benchmark(client.get, f"/v1/namespaces/{NAMESPACE}/queries", params={"limit": 20})
+    assert response.status_code == 200
+    assert response.json()["count"] == 20
+
+
+def test_get_query(benchmark, client):
+    response = benchmark(client.get, f"/v1/namespaces/{NAMESPACE}/queries/query-1")
+    assert response.status_code == 200
+
+
+def test_create_query(benchmark, client):
+    names = (f"bench-query-{i}" for i in itertools.count())
+
+    def create():
+        return client.post(f"/v1/namespaces/{NAMESPACE}/queries", json={"name": next(names), "input": "Hello"})
+
+    response = benchmark(create)
+    assert response.status_code == 200
@@ -3,6 +3,7 @@ from fastapi import APIRouter
 
 from .v1 import router as v1_router
 from .v1.openai import router as openai_router
+from .v1.openai_batches import router as openai_batches_router
 from .health import router as health_router
 
 router = APIRouter()
@@ -14,4 +15,5 @@ router.include_router(health_router)
 router.include_router(v1_router)
 
 # Include OpenAI endpoints (at root level for correct paths)
-router.include_router(openai_router)
\ No newline at end of file
+router.include_router(openai_router)
+router.include_router(openai_batches_router)
\ No newline at end of file
@@ -1,7 +1,9 @@
 """Health check endpoints."""
 import logging
 
+from ark_sdk.instrumentation import PrometheusHistogramHook
 from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
 from kubernetes_asyncio import client
 from kubernetes_asyncio.client.api_client import ApiClient
 
@@ -11,6 +13,10 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["health"])
 
+# Latency of Kubernetes API calls made through ark_sdk, registered on the
+# shared client pool at startup
+k8s_call_metrics = PrometheusHistogramHook()
+
 
 @router.get("/health", response_model=HealthResponse)
 async def health_check() -> HealthResponse:
@@ -38,3 +44,13 @@ async def readiness_check() -> ReadinessResponse:
     except Exception as e:
         logger.error(f"Readiness check failed: {e}")
         return ReadinessResponse(status="not ready", service="ark-api", error="An internal error occurred during readiness check.")
+
+
+@router.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def metrics() -> str:
+    """
+    Prometheus metrics for the Kubernetes API calls made by the service.
+
+    Returns: The ark_sdk_request_duration_seconds histogram in text exposition format
+    """
+    return k8s_call_metrics.render()
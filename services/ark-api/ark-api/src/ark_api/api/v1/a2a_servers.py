@@ -1,7 +1,8 @@
 """Kubernetes A2A servers API endpoints."""
 import logging
+from typing import Optional
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Query
 from ark_sdk.models.a2_a_server_v1prealpha1 import A2AServerV1prealpha1
 from ark_sdk.models.a2_a_server_v1prealpha1_spec import A2AServerV1prealpha1Spec
 
@@ -14,6 +15,8 @@ from ...models.a2a_servers import (
     A2AServerUpdateRequest,
     A2AServerDetailResponse
 )
+from ...utils.json_patch import set_fields
+from ...utils.pagination import list_resources
 from .exceptions import handle_k8s_errors
 
 logger = logging.getLogger(__name__)
@@ -75,7 +78,11 @@ def a2a_server_to_detail_response(a2a_server: dict) -> A2AServerDetailResponse:
 
 @router.get("", response_model=A2AServerListResponse)
 @handle_k8s_errors(operation="list", resource_type="a2a server")
-async def list_a2a_servers(namespace: str) -> A2AServerListResponse:
+async def list_a2a_servers(
+    namespace: str,
+    limit: Optional[int] = Query(None, ge=1, description="Maximum number of items to return"),
+    page_token: Optional[str] = Query(None, description="Token from next_page_token of the previous page")
+) -> A2AServerListResponse:
     """
     List all A2AServer CRs in a namespace.
     
@@ -86,15 +93,16 @@ async def list_a2a_servers(namespace: str) -> A2AServerListResponse:
         A2AServerListResponse: List of all A2A servers in the namespace
     """
     async with with_ark_client(namespace, VERSION) as ark_client:
-        a2a_servers = await ark_client.a2aservers.a_list()
+        a2a_servers, next_page_token = await list_resources(ark_client.a2aservers, limit, page_token)
         
         a2a_server_list = []
         for a2a_server in a2a_servers:
-            a2a_server_list.append(a2a_server_to_response(a2a_server.to_dict()))
+            a2a_server_list.append(a2a_server_to_response(a2a_server))
         
         return A2AServerListResponse(
             items=a2a_server_list,
-            total=len(a2a_server_list)
+            total=len(a2a_server_list),
+            next_page_token=next_page_token
         )
 
 
@@ -165,24 +173,12 @@ async def update_a2a_server(namespace: str, a2a_server_name: str, body: A2AServe
         A2AServerDetailResponse: The updated A2A server details
     """
     async with with_ark_client(namespace, VERSION) as ark_client:
-        # Get the existing A2A server first
-        existing_a2a_server = await ark_client.a2aservers.a_get(a2a_server_name)
-        existing_dict = existing_a2a_server.to_dict()
-        
-        # Update metadata if provided
-        if body.labels is not None:
-            existing_dict["metadata"]["labels"] = body.labels
-        if body.annotations is not None:
-            existing_dict["metadata"]["annotations"] = body.annotations
-            
-        # Update spec if provided
+        # Replace metadata and spec if provided, in a single patch request
+        patch = set_fields({"labels": body.labels, "annotations": body.annotations}, path="/metadata")
         if body.spec is not None:
-            existing_dict["spec"] = body.spec.model_dump(exclude_none=True)
-        
-        # Update the A2A server
-        updated_resource = A2AServerV1prealpha1(**existing_dict)
+            patch += set_fields({"spec": body.spec.model_dump(exclude_none=True)}, path="")
         
-        updated_a2a_server = await ark_client.a2aservers.a_update(updated_resource)
+        updated_a2a_server = await ark_client.a2aservers.a_patch(a2a_server_name, patch)
         
         return a2a_server_to_detail_response(updated_a2a_server.to_dict())
 
@@ -2,8 +2,9 @@
 import logging
 import json
 import re
+from typing import Optional
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Query, Request, Response
 from ark_sdk.models.agent_v1alpha1 import AgentV1alpha1
 
 from ark_sdk.client import with_ark_client
@@ -16,6 +17,10 @@ from ...models.agents import (
     AgentDetailResponse
 )
 from ...constants.annotations import A2A_SERVER_ADDRESS_ANNOTATION
+from ...utils.conditional import not_modified
+from ...utils.informers import ensure_informer
+from ...utils.json_patch import set_fields
+from ...utils.pagination import list_resources
 from .exceptions import handle_k8s_errors
 
 logger = logging.getLogger(__name__)
@@ -90,7 +95,11 @@ def agent_to_detail_response(agent: dict) -> AgentDetailResponse:
 
 @router.get("", response_model=AgentListResponse)
 @handle_k8s_errors(operation="list", resource_type="agent")
-async def list_agents(namespace: str) -> AgentListResponse:
+async def list_agents(
+    namespace: str,
+    limit: Optional[int] = Query(None, ge=1, description="Maximum number of items to return"),
+    page_token: Optional[str] = Query(None, description="Token from next_page_token of the previous page")
+) -> AgentListResponse:
     """
     List all Agent CRs in a namespace.
     
@@ -101,15 +110,17 @@ async def list_agents(namespace: str) -> AgentListResponse:
         AgentListResponse: List of all agents in the namespace
     """
     async with with_ark_client(namespace, VERSION) as ark_client:
-        agents = await ark_client.agents.a_list()
+        await ensure_informer(ark_client.agents, namespace)
+        agents, next_page_token = await list_resources(ark_client.agents, limit, page_token)
         
         agent_list = []
         for agent in agents:
-            agent_list.append(agent_to_response(agent.to_dict()))
+            agent_list.append(agent_to_response(agent))
         
         return AgentListResponse(
             items=agent_list,
-            count=len(agent_list)
+            count=len(agent_list),
+            next_page_token=next_page_token
         )
 
 
@@ -162,10 +173,13 @@ async def create_agent(namespace: str, body: AgentCreateRequest) -> AgentDetailR
 
 @router.get("/{agent_name}", response_model=AgentDetailResponse)
 @handle_k8s_errors(operation="get", resource_type="agent")
-async def get_agent(namespace: str, agent_name: str) -> AgentDetailResponse:
+async def get_agent(namespace: str, agent_name: str, request: Request, response: Response) -> AgentDetailResponse:
     """
     Get a specific Agent CR by name.
     
+    Answers 304 Not Modified when If-None-Match or If-Modified-Since show the
+    client already has the current version.
+    
     Args:
         namespace: The namespace to get the agent from
         agent_name: The name of the agent
@@ -174,9 +188,13 @@ async def get_agent(namespace: str, agent_name: str) -> AgentDetailResponse:
         AgentDetailResponse: The agent details
     """
     async with with_ark_client(namespace, VERSION) as ark_client:
-        agent = await ark_client.agents.a_get(agent_name)
+        agent = (await ark_client.agents.a_get(agent_name)).to_dict()
+        
+        cached = not_modified(request, response, agent)
+        if cached is not None:
+            return cached
         
-        return agent_to_detail_response(agent.to_dict())
+        return agent_to_detail_response(agent)
 
 
 @router.put("/{agent_name}", response_model=AgentDetailResponse)
@@ -194,38 +212,17 @@ async def update_agent(namespace: str, agent_name: str, body: AgentUpdateRequest
         AgentDetailResponse: The updated agent details
     """
     async with with_ark_client(namespace, VERSION) as ark_client:
-        # Get the existing agent first
-        existing_agent = await ark_client.agents.a_get(agent_name)
-        existing_spec = existing_agent.to_dict()["spec"]
-        
-        # Update only the fields that are provided
-        if body.description is not None:
-            existing_spec["description"] = body.description
-        
-        if body.executionEngine is not None:
-            existing_spec["executionEngine"] = body.executionEngine.model_dump(exclude_none=True)
-        
-        if body.modelRef is not None:
-            existing_spec["modelRef"] = body.modelRef.model_dump(exclude_none=True)
-        
-        if body.parameters is not None:
-            existing_spec["parameters"] = [param.model_dump(exclude_none=True) for param in body.parameters]
-        
-        if body.prompt is not None:
-            existing_spec["prompt"] = body.prompt
-        
-        if body.tools is not None:
-            existing_spec["tools"] = [tool.model_dump(exclude_none=True) for tool in body.tools]
-        
-        # Update the agent
-        # Get the full existing agent object and update its spec
-        existing_agent_dict = existing_agent.to_dict()
-        existing_agent_dict["spec"] = existing_spec
-        
-        # Create updated agent object
-        updated_agent_obj = AgentV1alpha1(**existing_agent_dict)
-        
-        updated_agent = await ark_client.agents.a_update(updated_agent_obj)
+        # Set only the fields that are provided, in a single patch request
+        spec_fields = {
+            "description": body.description,
+            "executionEngine": body.executionEngine.model_dump(exclude_none=True) if body.executionEngine is not None else None,
+            "modelRef": body.modelRef.model_dump(exclude_none=True) if body.modelRef is not None else None,
+            "parameters": [param.model_dump(exclude_none=True) for param in body.parameters] if body.parameters is not None else None,
+            "prompt": body.prompt,
+            "tools": [tool.model_dump(exclude_none=True) for tool in body.tools] if body.tools is not None else None,
+        }
+        
+        updated_agent = await ark_client.agents.a_patch(agent_name, set_fields(spec_fields))
         
         return agent_to_detail_response(updated_agent.to_dict())
 
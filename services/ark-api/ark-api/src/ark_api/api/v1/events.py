@@ -1,13 +1,16 @@
 """Kubernetes events API endpoints."""
+import heapq
 import logging
-from typing import Optional
+from typing import List, Optional, Tuple
 
+from ark_sdk.codec import get_codec
+from ark_sdk.k8s import request_json
 from fastapi import APIRouter, Query
 from kubernetes_asyncio import client
 from kubernetes_asyncio.client.api_client import ApiClient
 from kubernetes_asyncio.client.rest import ApiException
 
-from ...models.events import EventListResponse, EventResponse, event_to_response
+from ...models.events import EventListResponse, EventResponse, event_to_response, raw_event_to_dict
 from .exceptions import handle_k8s_errors
 
 logger = logging.getLogger(__name__)
@@ -15,43 +18,69 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/namespaces/{namespace}/events", tags=["events"])
 
 
-def _matches_type_filter(event_dict: dict, type_filter: Optional[str]) -> bool:
-    """Check if event matches type filter."""
-    return not type_filter or event_dict.get("type") == type_filter
+EVENTS_PATH = "/api/v1/namespaces/{namespace}/events"
+# Events fetched per API request while scanning for a numbered page
+SCAN_CHUNK_SIZE = 500
 
 
-def _matches_kind_filter(event_dict: dict, kind_filter: Optional[str]) -> bool:
-    """Check if event matches kind filter."""
-    if not kind_filter:
-        return True
-    involved_object = event_dict.get("involved_object", {})
-    return involved_object.get("kind") == kind_filter
+def _escape_field_value(value: str) -> str:
+    """Escape a value for use in a Kubernetes field selector."""
+    return value.replace("\\", "\\\\").replace(",", "\\,").replace("=", "\\=")
 
 
-def _matches_name_filter(event_dict: dict, name_filter: Optional[str]) -> bool:
-    """Check if event matches name filter."""
-    if not name_filter:
-        return True
-    involved_object = event_dict.get("involved_object", {})
-    object_name = involved_object.get("name", "").lower()
-    return name_filter.lower() in object_name
+def _field_selector(type_filter: Optional[str], kind_filter: Optional[str],
+                    name_filter: Optional[str]) -> Optional[str]:
+    """Build a field selector so the API server does the filtering."""
+    requirements = []
+    if type_filter:
+        requirements.append(f"type={_escape_field_value(type_filter)}")
+    if kind_filter:
+        requirements.append(f"involvedObject.kind={_escape_field_value(kind_filter)}")
+    if name_filter:
+        requirements.append(f"involvedObject.name={_escape_field_value(name_filter)}")
+    return ",".join(requirements) or None
 
 
-def _should_include_event(event_dict: dict, type_filter: Optional[str], 
-                         kind_filter: Optional[str], name_filter: Optional[str]) -> bool:
-    """Check if event should be included based on all filters."""
-    return (_matches_type_filter(event_dict, type_filter) and
-            _matches_kind_filter(event_dict, kind_filter) and
-            _matches_name_filter(event_dict, name_filter))
+def _creation_key(event: dict) -> str:
+    # RFC 3339 UTC timestamps sort chronologically as strings
+    return (event.get("metadata") or {}).get("creationTimestamp") or ""
 
 
-def _paginate_events(events: list, page_num: int, limit_num: int) -> tuple[list, int]:
-    """Apply pagination to events list and return paginated events with total count."""
-    total_count = len(events)
-    start_index = (page_num - 1) * limit_num
-    end_index = start_index + limit_num
-    paginated_events = events[start_index:end_index]
-    return paginated_events, total_count
+async def _scan_page(api_client, namespace: str, field_selector: Optional[str],
+                     page_num: int, limit_num: int) -> Tuple[List[dict], int]:
+    """
+    Find a newest-first page of events by scanning the list in chunks.
+
+    Only the newest page_num * limit_num events are kept while scanning, so
+    memory is bounded by the page rather than by the namespace.
+
+    Returns:
+        The raw events of the page and the number of matching events
+    """
+    keep = page_num * limit_num
+    newest: List[Tuple[str, int, dict]] = []  # Min-heap of (creationTimestamp, position, event)
+    total = 0
+    continue_token = None
+    codec = get_codec()
+    while True:
+        result = await request_json(
+            api_client, "GET", EVENTS_PATH, {"namespace": namespace}, codec,
+            field_selector=field_selector, limit=SCAN_CHUNK_SIZE, _continue=continue_token
+        )
+        for event in result.get("items", []):
+            total += 1
+            entry = (_creation_key(event), total, event)
+            if len(newest) < keep:
+                heapq.heappush(newest, entry)
+            elif entry[:2] > newest[0][:2]:
+                heapq.heapreplace(newest, entry)
+        continue_token = (result.get("metadata") or {}).get("continue")
+        if not continue_token:
+            break
+
+    newest.sort(key=lambda entry: entry[:2], reverse=True)
+    start = (page_num - 1) * limit_num
+    return [event for _, _, event in newest[start:start + limit_num]], total
 
 
 @router.get("", response_model=EventListResponse)
@@ -61,48 +90,54 @@ async def list_events(
     type_filter: Optional[str] = Query(None, alias="type", description="Filter by event type (Normal, Warning)"),
     kind_filter: Optional[str] = Query(None, alias="kind", description="Filter by involved object kind"),
     name_filter: Optional[str] = Query(None, alias="name", description="Filter by involved object name"),
-    limit: Optional[int] = Query(500, description="Maximum number of events to return"),
-    page: Optional[int] = Query(1, description="Page number for pagination (1-based)")
+    limit: Optional[int] = Query(500, ge=1, description="Maximum number of events to return"),
+    page: Optional[int] = Query(1, ge=1, description="Page number of the newest-first list (1-based)"),
+    page_token: Optional[str] = Query(None, description="Page by API server pages instead: empty for the first page, then next_page_token of the previous one")
 ) -> EventListResponse:
     """
-    List all Kubernetes events in a namespace with optional filtering.
+    List Kubernetes events in a namespace with optional filtering.
+    
+    Filters are applied by the API server as a field selector. Events are
+    sorted newest first across the namespace and total counts all matches.
+    With page_token a single API server page is returned instead, newest
+    first within the page, with next_page_token for the following one.
     
     Args:
         namespace: The namespace to list events from
         type_filter: Filter by event type (Normal, Warning)
         kind_filter: Filter by involved object kind (Agent, Team, Query, etc.)
-        name_filter: Filter by involved object name
+        name_filter: Filter by involved object name (exact match)
         limit: Maximum number of events to return (default: 500)
-        page: Page number for pagination (1-based, default: 1)
+        page: Page number of the newest-first list (1-based, default: 1)
+        page_token: Empty for the first API server page, then next_page_token of the previous one
         
     Returns:
         EventListResponse: List of events in the namespace
     """
     async with ApiClient() as api_client:
-        v1 = client.CoreV1Api(api_client)
-        
+        field_selector = _field_selector(type_filter, kind_filter, name_filter)
+        limit_num = limit or 500
+
         try:
-            page_num = page or 1
-            limit_num = limit or 200
-                        
-            events = await v1.list_namespaced_event(namespace=namespace)
-                        
-            filtered_events = []
-            for event in events.items:
-                event_dict = event.to_dict()
-                
-                if _should_include_event(event_dict, type_filter, kind_filter, name_filter):
-                    filtered_events.append(event_to_response(event_dict))
-                        
-            filtered_events.sort(key=lambda x: x.creation_timestamp, reverse=True)
-            
-            paginated_events, total_count = _paginate_events(filtered_events, page_num, limit_num)
-                        
+            if page_token is None:
+                events, total_count = await _scan_page(api_client, namespace, field_selector, page or 1, limit_num)
+                return EventListResponse(
+                    items=[event_to_response(raw_event_to_dict(event)) for event in events],
+                    total=total_count
+                )
+
+            result = await request_json(
+                api_client, "GET", EVENTS_PATH, {"namespace": namespace}, get_codec(),
+                field_selector=field_selector, limit=limit_num, _continue=page_token or None
+            )
+            events = sorted(result.get("items", []), key=_creation_key, reverse=True)
+            metadata = result.get("metadata") or {}
             return EventListResponse(
-                items=paginated_events,
-                total=total_count
+                items=[event_to_response(raw_event_to_dict(event)) for event in events],
+                total=len(events) + (metadata.get("remainingItemCount") or 0),
+                next_page_token=metadata.get("continue") or None
             )
-            
+
         except ApiException as e:
             logger.error(f"Failed to list events: {e}")
             raise
@@ -1,7 +1,8 @@
 """Kubernetes MCP servers API endpoints."""
 import logging
+from typing import Optional
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Query
 from ark_sdk.models.mcp_server_v1alpha1 import MCPServerV1alpha1
 from ark_sdk.models.mcp_server_v1alpha1_spec import MCPServerV1alpha1Spec
 
@@ -14,6 +15,8 @@ from ...models.mcp_servers import (
     MCPServerUpdateRequest,
     MCPServerDetailResponse
 )
+from ...utils.json_patch import set_fields
+from ...utils.pagination import list_resources
 from .exceptions import handle_k8s_errors
 
 logger = logging.getLogger(__name__)
@@ -78,7 +81,11 @@ def mcp_server_to_detail_response(mcp_server: dict) -> MCPServerDetailResponse:
 
 @router.get("", response_model=MCPServerListResponse)
 @handle_k8s_errors(operation="list", resource_type="mcp server")
-async def list_mcp_servers(namespace: str) -> MCPServerListResponse:
+async def list_mcp_servers(
+    namespace: str,
+    limit: Optional[int] = Query(None, ge=1, description="Maximum number of items to return"),
+    page_token: Optional[str] = Query(None, description="Token from next_page_token of the previous page")
+) -> MCPServerListResponse:
     """
     List all MCPServer CRs in a namespace.
     
@@ -89,15 +96,16 @@ async def list_mcp_servers(namespace: str) -> MCPServerListResponse:
         MCPServerListResponse: List of all MCP servers in the namespace
     """
     async with with_ark_client(namespace, VERSION) as ark_client:
-        mcp_servers = await ark_client.mcpservers.a_list()
+        mcp_servers, next_page_token = await list_resources(ark_client.mcpservers, limit, page_token)
         
         mcp_server_list = []
         for mcp_server in mcp_servers:
-            mcp_server_list.append(mcp_server_to_response(mcp_server.to_dict()))
+            mcp_server_list.append(mcp_server_to_response(mcp_server))
         
         return MCPServerListResponse(
             items=mcp_server_list,
-            total=len(mcp_server_list)
+            total=len(mcp_server_list),
+            next_page_token=next_page_token
         )
 
 
@@ -168,24 +176,12 @@ async def update_mcp_server(namespace: str, mcp_server_name: str, body: MCPServe
         MCPServerDetailResponse: The updated MCP server details
     """
     async with with_ark_client(namespace, VERSION) as ark_client:
-        # Get the existing MCP server first
-        existing_mcp_server = await ark_client.mcpservers.a_get(mcp_server_name)
-        existing_dict = existing_mcp_server.to_dict()
-        
-        # Update metadata if provided
-        if body.labels is not None:
-            existing_dict["metadata"]["labels"] = body.labels
-        if body.annotations is not None:
-            existing_dict["metadata"]["annotations"] = body.annotations
-            
-        # Update spec if provided
+        # Replace metadata and spec if provided, in a single patch request
+        patch = set_fields({"labels": body.labels, "annotations": body.annotations}, path="/metadata")
         if body.spec is not None:
-            existing_dict["spec"] = body.spec.model_dump(exclude_none=True)
-        
-        # Update the MCP server
-        updated_resource = MCPServerV1alpha1(**existing_dict)
+            patch += set_fields({"spec": body.spec.model_dump(exclude_none=True)}, path="")
         
-        updated_mcp_server = await ark_client.mcpservers.a_update(updated_resource)
+        updated_mcp_server = await ark_client.mcpservers.a_patch(mcp_server_name, patch)
         
         return mcp_server_to_detail_response(updated_mcp_server.to_dict())
 
@@ -1,7 +1,8 @@
 """Kubernetes memories API endpoints."""
 import logging
+from typing import Optional
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Query
 from ark_sdk.models.memory_v1alpha1 import MemoryV1alpha1
 
 from ark_sdk.client import with_ark_client
@@ -13,6 +14,8 @@ from ...models.memories import (
     MemoryUpdateRequest,
     MemoryDetailResponse
 )
+from ...utils.json_patch import set_fields
+from ...utils.pagination import list_resources
 from .exceptions import handle_k8s_errors
 
 logger = logging.getLogger(__name__)
@@ -66,13 +69,17 @@ def memory_to_detail_response(memory) -> MemoryDetailResponse:
 
 @router.get("", response_model=MemoryListResponse)
 @handle_k8s_errors(operation="list", resource_type="memory")
-async def list_memories(namespace: str) -> MemoryListResponse:
+async def list_memories(
+    namespace: str,
+    limit: Optional[int] = Query(None, ge=1, description="Maximum number of items to return"),
+    page_token: Optional[str] = Query(None, description="Token from next_page_token of the previous page")
+) -> MemoryListResponse:
     """List all memories in a namespace."""
     async with with_ark_client(namespace, VERSION) as client:
-        memories = await client.memories.a_list()
+        memories, next_page_token = await list_resources(client.memories, limit, page_token)
         
-        memory_responses = [memory_to_response(memory.to_dict()) for memory in memories]
-        return MemoryListResponse(items=memory_responses)
+        memory_responses = [memory_to_response(memory) for memory in memories]
+        return MemoryListResponse(items=memory_responses, next_page_token=next_page_token)
 
 
 @router.get("/{name}", response_model=MemoryDetailResponse)
@@ -106,24 +113,13 @@ async def create_memory(namespace: str, memory_request: MemoryCreateRequest) ->
 async def update_memory(namespace: str, name: str, memory_request: MemoryUpdateRequest) -> MemoryDetailResponse:
     """Update an existing memory."""
     async with with_ark_client(namespace, VERSION) as client:
-        # Get existing memory
-        existing_memory = await client.memories.a_get(name)
-        existing_dict = existing_memory.to_dict()
+        # Set the provided spec fields in a single patch request
+        spec_fields = {
+            "description": memory_request.description,
+            "config": memory_request.config,
+        }
         
-        # Update spec fields
-        spec = existing_dict.get("spec", {})
-        if memory_request.description is not None:
-            spec["description"] = memory_request.description
-        if memory_request.config is not None:
-            spec["config"] = memory_request.config
-        
-        # Create updated memory object
-        memory_obj = MemoryV1alpha1(
-            metadata=existing_dict["metadata"],
-            spec=spec
-        )
-        
-        updated_memory = await client.memories.a_update(memory_obj)
+        updated_memory = await client.memories.a_patch(name, set_fields(spec_fields))
         return memory_to_detail_response(updated_memory.to_dict())
 
 
@@ -1,7 +1,8 @@
 """Kubernetes models API endpoints."""
 import logging
+from typing import Optional
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Query, Request, Response
 
 from ark_sdk.client import with_ark_client
 
@@ -12,6 +13,9 @@ from ...models.models import (
     ModelUpdateRequest,
     ModelDetailResponse
 )
+from ...utils.conditional import not_modified
+from ...utils.informers import ensure_informer
+from ...utils.pagination import list_resources
 from .exceptions import handle_k8s_errors
 
 logger = logging.getLogger(__name__)
@@ -70,7 +74,11 @@ def model_to_detail_response(model: dict) -> ModelDetailResponse:
 
 @router.get("", response_model=ModelListResponse)
 @handle_k8s_errors(operation="list", resource_type="model")
-async def list_models(namespace: str) -> ModelListResponse:
+async def list_models(
+    namespace: str,
+    limit: Optional[int] = Query(None, ge=1, description="Maximum number of items to return"),
+    page_token: Optional[str] = Query(None, description="Token from next_page_token of the previous page")
+) -> ModelListResponse:
     """
     List all Model CRs in a namespace.
     
@@ -81,15 +89,17 @@ async def list_models(namespace: str) -> ModelListResponse:
         ModelListResponse: List of all models in the namespace
     """
     async with with_ark_client(namespace, VERSION) as ark_client:
-        models = await ark_client.models.a_list()
+        await ensure_informer(ark_client.models, namespace)
+        models, next_page_token = await list_resources(ark_client.models, limit, page_token)
         
         model_list = []
         for model in models:
-            model_list.append(model_to_response(model.to_dict()))
+            model_list.append(model_to_response(model))
         
         return ModelListResponse(
             items=model_list,
-            count=len(model_list)
+            count=len(model_list),
+            next_page_token=next_page_token
         )
 
 
@@ -167,10 +177,13 @@ async def create_model(namespace: str, body: ModelCreateRequest) -> ModelDetailR
 
 @router.get("/{model_name}", response_model=ModelDetailResponse)
 @handle_k8s_errors(operation="get", resource_type="model")
-async def get_model(namespace: str, model_name: str) -> ModelDetailResponse:
+async def get_model(namespace: str, model_name: str, request: Request, response: Response) -> ModelDetailResponse:
     """
     Get a specific Model CR by name.
     
+    Answers 304 Not Modified when If-None-Match or If-Modified-Since show the
+    client already has the current version.
+    
     Args:
         namespace: The namespace to get the model from
         model_name: The name of the model
@@ -179,9 +192,13 @@ async def get_model(namespace: str, model_name: str) -> ModelDetailResponse:
         ModelDetailResponse: The model details
     """
     async with with_ark_client(namespace, VERSION) as ark_client:
-        model = await ark_client.models.a_get(model_name)
+        model = (await ark_client.models.a_get(model_name)).to_dict()
+        
+        cached = not_modified(request, response, model)
+        if cached is not None:
+            return cached
         
-        return model_to_detail_response(model.to_dict())
+        return model_to_detail_response(model)
 
 
 @router.put("/{model_name}", response_model=ModelDetailResponse)
@@ -1,24 +1,31 @@
 import logging
+import math
 import time
 import uuid
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from ark_sdk import QueryV1alpha1Spec
 from ark_sdk.models.query_v1alpha1 import QueryV1alpha1
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 from openai.types.chat import ChatCompletion
 from openai.types import Model
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from ark_sdk.client import with_ark_client
+from ...utils.model_cache import MetadataListCache
 from ...utils.query_targets import parse_model_to_query_target
-from ...utils.query_polling import poll_query_completion
+from ...utils.query_polling import QUERY_TIMEOUT_SECONDS, poll_query_completion, stream_query_completion
 
 router = APIRouter(prefix="/openai/v1", tags=["OpenAI"])
 logger = logging.getLogger(__name__)
 
 # Constants
 TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+# Model id prefix and resource client of each kind served by /models
+MODEL_KINDS = (("agent", "agents"), ("team", "teams"), ("model", "models"), ("tool", "tools"))
+
+model_list_cache = MetadataListCache()
 
 
 def _parse_timestamp(metadata: dict) -> int:
@@ -52,36 +59,61 @@ class ChatCompletionRequest(BaseModel):
     temperature: float = 1.0
     max_tokens: Optional[int] = None
     stream: bool = False
+    # ARK extension: seconds to wait for the query, e.g. extra_body={"timeout": 30}
+    timeout: Optional[float] = Field(default=None, gt=0)
 
 
-@router.post("/chat/completions")
-async def chat_completions(request: ChatCompletionRequest) -> ChatCompletion:
-    model = request.model
-    messages = request.messages
+def build_chat_query(
+    request: ChatCompletionRequest, query_name: Optional[str] = None, namespace: str = "default"
+) -> Tuple[QueryV1alpha1, str, float]:
+    """Build the Query for a chat completion request, named query_name or openai-query-<random>.
 
-    logger.info(f"Received chat completion request for model: {model}")
+    Returns:
+        The query, its input text and the seconds to wait for it
+    """
+    target = parse_model_to_query_target(request.model)
+    input_text = "\n".join([f"{msg.role}: {msg.content}" for msg in request.messages])
+    query_name = query_name or f"openai-query-{uuid.uuid4().hex[:8]}"
+    timeout = request.timeout or QUERY_TIMEOUT_SECONDS
 
-    target = parse_model_to_query_target(model)
-    input_text = "\n".join([f"{msg.role}: {msg.content}" for msg in messages])
-    query_name = f"openai-query-{uuid.uuid4().hex[:8]}"
-
-    # Create the QueryV1alpha1 object like the queries API does
+    # Create the QueryV1alpha1 object like the queries API does; the query
+    # times out with the request so the controller stops working on it too
     query_resource = QueryV1alpha1(
-        metadata={"name": query_name, "namespace": "default"},
-        spec=QueryV1alpha1Spec(input=input_text, targets=[target]),
+        metadata={"name": query_name, "namespace": namespace},
+        spec=QueryV1alpha1Spec(
+            input=input_text, targets=[target], timeout=f"{math.ceil(timeout)}s"
+        ),
     )
-
     logger.info(f"Creating query for {target.type}/{target.name}")
+    return query_resource, input_text, timeout
+
+
+@router.post("/chat/completions")
+async def chat_completions(request: ChatCompletionRequest, namespace: str = "default") -> ChatCompletion:
+    model = request.model
+
+    logger.info(f"Received chat completion request for model: {model}")
+
+    query_resource, input_text, timeout = build_chat_query(request, namespace=namespace)
+    query_name = query_resource.metadata["name"]
 
     try:
-        async with with_ark_client("default", "v1alpha1") as ark_client:
+        async with with_ark_client(namespace, "v1alpha1") as ark_client:
             # Create the query using QueryV1alpha1 object like queries API
             await ark_client.queries.a_create(query_resource)
             logger.info(f"Created query: {query_name}")
 
-            # Poll for completion using helper function
+            if request.stream:
+                # Stream chunks as the query progresses; errors are sent as events
+                return StreamingResponse(
+                    stream_query_completion(ark_client, query_name, model, timeout),
+                    media_type="text/event-stream",
+                    headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+                )
+
+            # Wait for completion using helper function
             return await poll_query_completion(
-                ark_client, query_name, model, input_text
+                ark_client, query_name, model, input_text, timeout
             )
 
     except Exception as e:
@@ -92,45 +124,20 @@ async def chat_completions(request: ChatCompletionRequest) -> ChatCompletion:
 
 
 @router.get("/models")
-async def list_models():
+async def list_models(namespace: str = "default"):
     """List available models in OpenAI format, including ARK agents, teams, models, and tools."""
     models_list = []
 
-    async with with_ark_client("default", "v1alpha1") as ark_client:
-        # Get agents
-        try:
-            agents = await ark_client.agents.a_list()
-            for agent in agents:
-                name = agent.metadata["name"]
-                models_list.append(_create_model_entry(f"agent/{name}", agent.metadata))
-        except Exception as e:
-            logger.error(f"Failed to list agents: {e}")
-
-        # Get teams
-        try:
-            teams = await ark_client.teams.a_list()
-            for team in teams:
-                name = team.metadata["name"]
-                models_list.append(_create_model_entry(f"team/{name}", team.metadata))
-        except Exception as e:
-            logger.error(f"Failed to list teams: {e}")
-
-        # Get models
-        try:
-            models = await ark_client.models.a_list()
-            for model in models:
-                name = model.metadata["name"]
-                models_list.append(_create_model_entry(f"model/{name}", model.metadata))
-        except Exception as e:
-            logger.error(f"Failed to list models: {e}")
-
-        # Get tools
-        try:
-            tools = await ark_client.tools.a_list()
-            for tool in tools:
-                name = tool.metadata["name"]
-                models_list.append(_create_model_entry(f"tool/{name}", tool.metadata))
-        except Exception as e:
-            logger.error(f"Failed to list tools: {e}")
+    async with with_ark_client(namespace, "v1alpha1") as ark_client:
+        listing = await model_list_cache.get(ark_client, namespace, [plural for _, plural in MODEL_KINDS])
+
+    for prefix, plural in MODEL_KINDS:
+        items = listing[plural]
+        if isinstance(items, Exception):
+            logger.error(f"Failed to list {plural}: {items}")
+            continue
+        for item in items:
+            name = item["metadata"]["name"]
+            models_list.append(_create_model_entry(f"{prefix}/{name}", item["metadata"]))
 
     return {"object": "list", "data": models_list}
@@ -0,0 +1,129 @@
+"""OpenAI-compatible files and batches API."""
+import logging
+from typing import Any, Dict, Optional, Tuple
+
+from fastapi import APIRouter, File, Form, HTTPException, UploadFile
+from fastapi.responses import FileResponse
+from openai.types import Batch, FileDeleted, FileObject
+from pydantic import BaseModel, ValidationError
+
+from ark_sdk.client import with_ark_client
+from .openai import ChatCompletionRequest, build_chat_query
+from ...utils.batches import BatchManager, error_body
+from ...utils.file_store import CHUNK_SIZE, FileStore
+from ...utils.query_polling import poll_query_completion
+
+router = APIRouter(prefix="/openai/v1", tags=["OpenAI"])
+logger = logging.getLogger(__name__)
+
+
+async def run_batch_request(batch_id: str, index: int, body: Dict[str, Any]) -> Tuple[int, Optional[str], Dict[str, Any]]:
+    """Run one batch line as a chat completion query, deleting the query once answered."""
+    try:
+        request = ChatCompletionRequest.model_validate({**body, "stream": False})
+        query_name = f"openai-batch-{batch_id.removeprefix('batch_')[:12]}-{index}"
+        query_resource, input_text, timeout = build_chat_query(request, query_name)
+    except ValidationError as e:
+        return 400, None, error_body(str(e), "invalid_request_error")
+    except HTTPException as e:
+        return e.status_code, None, error_body(e.detail, "invalid_request_error")
+
+    async with with_ark_client("default", "v1alpha1") as ark_client:
+        try:
+            await ark_client.queries.a_create(query_resource)
+        except Exception as e:
+            return 500, None, error_body(str(e))
+
+        try:
+            completion = await poll_query_completion(ark_client, query_name, request.model, input_text, timeout)
+            return 200, query_name, completion.model_dump()
+        except HTTPException as e:
+            return e.status_code, query_name, error_body(e.detail)
+        except Exception as e:
+            return 500, query_name, error_body(str(e))
+        finally:
+            # The result is in the output file; don't leave thousands of queries behind
+            try:
+                await ark_client.queries.a_delete(query_name)
+            except Exception as e:
+                logger.warning(f"Failed to delete batch query {query_name}: {e}")
+
+
+file_store = FileStore()
+batch_manager = BatchManager(file_store, run_batch_request)
+
+
+class BatchCreateRequest(BaseModel):
+    input_file_id: str
+    endpoint: str
+    completion_window: str = "24h"
+    metadata: Optional[Dict[str, str]] = None
+
+
+@router.post("/files")
+async def create_file(file: UploadFile = File(...), purpose: str = Form(...)) -> FileObject:
+    """Upload a JSONL file of batch requests."""
+    if purpose != "batch":
+        raise HTTPException(status_code=400, detail="Only purpose 'batch' is supported")
+
+    async def chunks():
+        while chunk := await file.read(CHUNK_SIZE):
+            yield chunk
+
+    return await file_store.create(file.filename or "batch.jsonl", purpose, chunks())
+
+
+@router.get("/files")
+async def list_files(purpose: Optional[str] = None):
+    return {"object": "list", "data": file_store.list(purpose), "has_more": False}
+
+
+@router.get("/files/{file_id}")
+async def get_file(file_id: str) -> FileObject:
+    return file_store.get(file_id)
+
+
+@router.get("/files/{file_id}/content")
+async def get_file_content(file_id: str):
+    file = file_store.get(file_id)
+    return FileResponse(file_store.path(file_id), media_type="application/octet-stream", filename=file.filename)
+
+
+@router.delete("/files/{file_id}")
+async def delete_file(file_id: str) -> FileDeleted:
+    file_store.delete(file_id)
+    return FileDeleted(id=file_id, object="file", deleted=True)
+
+
+@router.post("/batches")
+async def create_batch(request: BatchCreateRequest) -> Batch:
+    """Run the chat completion requests of an input file in the background."""
+    return await batch_manager.create(
+        request.input_file_id, request.endpoint, request.completion_window, request.metadata
+    )
+
+
+@router.get("/batches")
+async def list_batches(limit: int = 20, after: Optional[str] = None):
+    batches = batch_manager.list()
+    if after:
+        ids = [batch.id for batch in batches]
+        batches = batches[ids.index(after) + 1:] if after in ids else []
+    page = batches[:limit]
+    return {
+        "object": "list",
+        "data": page,
+        "first_id": page[0].id if page else None,
+        "last_id": page[-1].id if page else None,
+        "has_more": len(batches) > limit,
+    }
+
+
+@router.get("/batches/{batch_id}")
+async def get_batch(batch_id: str) -> Batch:
+    return batch_manager.get(batch_id)
+
+
+@router.post("/batches/{batch_id}/cancel")
+async def cancel_batch(batch_id: str) -> Batch:
+    return batch_manager.cancel(batch_id)
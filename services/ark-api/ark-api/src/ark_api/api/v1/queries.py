@@ -1,7 +1,8 @@
 """API routes for Query resources."""
 
 from datetime import datetime
-from fastapi import APIRouter
+from typing import Optional
+from fastapi import APIRouter, Query
 from ark_sdk.models.query_v1alpha1 import QueryV1alpha1
 from ark_sdk.models.query_v1alpha1_spec import QueryV1alpha1Spec
 
@@ -14,6 +15,8 @@ from ...models.queries import (
     QueryUpdateRequest,
     QueryDetailResponse
 )
+from ...utils.json_patch import set_fields
+from ...utils.pagination import list_resources
 from .exceptions import handle_k8s_errors
 
 router = APIRouter(
@@ -66,16 +69,21 @@ def query_to_detail_response(query: dict) -> QueryDetailResponse:
 
 @router.get("", response_model=QueryListResponse)
 @handle_k8s_errors(operation="list", resource_type="query")
-async def list_queries(namespace: str) -> QueryListResponse:
+async def list_queries(
+    namespace: str,
+    limit: Optional[int] = Query(None, ge=1, description="Maximum number of items to return"),
+    page_token: Optional[str] = Query(None, description="Token from next_page_token of the previous page")
+) -> QueryListResponse:
     """List all queries in a namespace."""
     async with with_ark_client(namespace, VERSION) as ark_client:
-        result = await ark_client.queries.a_list()
+        result, next_page_token = await list_resources(ark_client.queries, limit, page_token)
         
-        queries = [query_to_response(item.to_dict()) for item in result]
+        queries = [query_to_response(item) for item in result]
         
         return QueryListResponse(
             items=queries,
-            count=len(queries)
+            count=len(queries),
+            next_page_token=next_page_token
         )
 
 
@@ -147,44 +155,23 @@ async def update_query(
 ) -> QueryDetailResponse:
     """Update a specific query."""
     async with with_ark_client(namespace, VERSION) as ark_client:
-        # Get current query
-        current = await ark_client.queries.a_get(query_name)
-        spec = current.to_dict()["spec"]
-        
-        # Update spec with non-None values
-        if query.input is not None:
-            spec["input"] = query.input
-        if query.memory is not None:
-            spec["memory"] = query.memory.model_dump()
-        if query.parameters is not None:
-            spec["parameters"] = [p.model_dump() for p in query.parameters]
-        if query.selector is not None:
-            spec["selector"] = query.selector.model_dump()
-        if query.serviceAccount is not None:
-            spec["serviceAccount"] = query.serviceAccount
-        if query.sessionId is not None:
-            spec["sessionId"] = query.sessionId
-        if query.targets is not None:
-            spec["targets"] = [t.model_dump() for t in query.targets]
-        if query.timeout is not None:
-            spec["timeout"] = query.timeout
-        if query.ttl is not None:
-            spec["ttl"] = query.ttl
-        if query.cancel is not None:
-            spec["cancel"] = query.cancel
-        if query.evaluators is not None:
-            spec["evaluators"] = [e.model_dump() for e in query.evaluators]
-        if query.evaluatorSelector is not None:
-            spec["evaluatorSelector"] = query.evaluatorSelector.model_dump()
-        
-        # Update the resource - need to update the entire resource object
-        current_dict = current.to_dict()
-        current_dict["spec"] = spec
-        
-        # Create updated query object
-        updated_query_obj = QueryV1alpha1(**current_dict)
+        # Set spec fields with non-None values, in a single patch request
+        spec_fields = {
+            "input": query.input,
+            "memory": query.memory.model_dump() if query.memory is not None else None,
+            "parameters": [p.model_dump() for p in query.parameters] if query.parameters is not None else None,
+            "selector": query.selector.model_dump() if query.selector is not None else None,
+            "serviceAccount": query.serviceAccount,
+            "sessionId": query.sessionId,
+            "targets": [t.model_dump() for t in query.targets] if query.targets is not None else None,
+            "timeout": query.timeout,
+            "ttl": query.ttl,
+            "cancel": query.cancel,
+            "evaluators": [e.model_dump() for e in query.evaluators] if query.evaluators is not None else None,
+            "evaluatorSelector": query.evaluatorSelector.model_dump() if query.evaluatorSelector is not None else None,
+        }
         
-        updated = await ark_client.queries.a_update(updated_query_obj)
+        updated = await ark_client.queries.a_patch(query_name, set_fields(spec_fields))
         
         return query_to_detail_response(updated.to_dict())
 
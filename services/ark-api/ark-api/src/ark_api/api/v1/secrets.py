@@ -5,6 +5,7 @@ import logging
 from fastapi import APIRouter, HTTPException
 from kubernetes_asyncio import client
 from kubernetes_asyncio.client.api_client import ApiClient
+from ark_sdk.k8s import list_metadata
 
 from ...models.kubernetes import (
     SecretResponse,
@@ -103,15 +104,15 @@ async def list_secrets(namespace: str) -> SecretListResponse:
         SecretListResponse: List of all secrets in the namespace
     """
     async with ApiClient() as api:
-        v1 = client.CoreV1Api(api)
-        secrets = await v1.list_namespaced_secret(namespace)
+        # Only names and uids are returned, so never fetch the secret data
+        secrets = await list_metadata(api, "/api/v1/namespaces/{namespace}/secrets", {"namespace": namespace})
     
         secret_list = []
-        for secret in secrets.items:
+        for secret in secrets.get("items", []):
             secret_list.append(
                 SecretResponse(
-                    name=secret.metadata.name,
-                    id=str(secret.metadata.uid)
+                    name=secret["metadata"]["name"],
+                    id=str(secret["metadata"]["uid"])
                 )
             )
         
@@ -1,7 +1,8 @@
 """Kubernetes teams API endpoints."""
 import logging
+from typing import Optional
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Query, Request, Response
 from ark_sdk.models.team_v1alpha1 import TeamV1alpha1
 
 from ark_sdk.client import with_ark_client
@@ -13,6 +14,10 @@ from ...models.teams import (
     TeamUpdateRequest,
     TeamDetailResponse
 )
+from ...utils.conditional import not_modified
+from ...utils.informers import ensure_informer
+from ...utils.json_patch import set_fields
+from ...utils.pagination import list_resources
 from .exceptions import handle_k8s_errors
 
 logger = logging.getLogger(__name__)
@@ -65,7 +70,11 @@ def team_to_detail_response(team: dict) -> TeamDetailResponse:
 
 @router.get("", response_model=TeamListResponse)
 @handle_k8s_errors(operation="list", resource_type="team")
-async def list_teams(namespace: str) -> TeamListResponse:
+async def list_teams(
+    namespace: str,
+    limit: Optional[int] = Query(None, ge=1, description="Maximum number of items to return"),
+    page_token: Optional[str] = Query(None, description="Token from next_page_token of the previous page")
+) -> TeamListResponse:
     """
     List all Team CRs in a namespace.
     
@@ -76,15 +85,17 @@ async def list_teams(namespace: str) -> TeamListResponse:
         TeamListResponse: List of all teams in the namespace
     """
     async with with_ark_client(namespace, VERSION) as ark_client:
-        teams = await ark_client.teams.a_list()
+        await ensure_informer(ark_client.teams, namespace)
+        teams, next_page_token = await list_resources(ark_client.teams, limit, page_token)
         
         team_list = []
         for team in teams:
-            team_list.append(team_to_response(team.to_dict()))
+            team_list.append(team_to_response(team))
         
         return TeamListResponse(
             items=team_list,
-            count=len(team_list)
+            count=len(team_list),
+            next_page_token=next_page_token
         )
 
 
@@ -136,10 +147,13 @@ async def create_team(namespace: str, body: TeamCreateRequest) -> TeamDetailResp
 
 @router.get("/{team_name}", response_model=TeamDetailResponse)
 @handle_k8s_errors(operation="get", resource_type="team")
-async def get_team(namespace: str, team_name: str) -> TeamDetailResponse:
+async def get_team(namespace: str, team_name: str, request: Request, response: Response) -> TeamDetailResponse:
     """
     Get a specific Team CR by name.
     
+    Answers 304 Not Modified when If-None-Match or If-Modified-Since show the
+    client already has the current version.
+    
     Args:
         namespace: The namespace to get the team from
         team_name: The name of the team
@@ -148,9 +162,13 @@ async def get_team(namespace: str, team_name: str) -> TeamDetailResponse:
         TeamDetailResponse: The team details
     """
     async with with_ark_client(namespace, VERSION) as ark_client:
-        team = await ark_client.teams.a_get(team_name)
+        team = (await ark_client.teams.a_get(team_name)).to_dict()
+        
+        cached = not_modified(request, response, team)
+        if cached is not None:
+            return cached
         
-        return team_to_detail_response(team.to_dict())
+        return team_to_detail_response(team)
 
 
 @router.put("/{team_name}", response_model=TeamDetailResponse)
@@ -168,40 +186,18 @@ async def update_team(namespace: str, team_name: str, body: TeamUpdateRequest) -
         TeamDetailResponse: The updated team details
     """
     async with with_ark_client(namespace, VERSION) as ark_client:
-        # Get the existing team first
-        existing_team = await ark_client.teams.a_get(team_name)
-        existing_spec = existing_team.to_dict()["spec"]
-        
-        # Update only the fields that are provided
-        if body.description is not None:
-            existing_spec["description"] = body.description
-        
-        if body.members is not None:
-            existing_spec["members"] = [member.model_dump(exclude_none=True) for member in body.members]
-        
-        if body.strategy is not None:
-            existing_spec["strategy"] = body.strategy
-        
-        if body.graph is not None:
+        # Set only the fields that are provided, in a single patch request
+        spec_fields = {
+            "description": body.description,
+            "members": [member.model_dump(exclude_none=True) for member in body.members] if body.members is not None else None,
+            "strategy": body.strategy,
             # Handle graph edges with from_ field conversion
-            graph_dict = body.graph.model_dump(exclude_none=True, by_alias=True)
-            existing_spec["graph"] = graph_dict
-        
-        if body.maxTurns is not None:
-            existing_spec["maxTurns"] = body.maxTurns
-        
-        if body.selector is not None:
-            existing_spec["selector"] = body.selector.model_dump(exclude_none=True)
-        
-        # Update the team
-        # Get the full existing team object and update its spec
-        existing_team_dict = existing_team.to_dict()
-        existing_team_dict["spec"] = existing_spec
-        
-        # Create updated team object
-        updated_team_obj = TeamV1alpha1(**existing_team_dict)
+            "graph": body.graph.model_dump(exclude_none=True, by_alias=True) if body.graph is not None else None,
+            "maxTurns": body.maxTurns,
+            "selector": body.selector.model_dump(exclude_none=True) if body.selector is not None else None,
+        }
         
-        updated_team = await ark_client.teams.a_update(updated_team_obj)
+        updated_team = await ark_client.teams.a_patch(team_name, set_fields(spec_fields))
         
         return team_to_detail_response(updated_team.to_dict())
 
@@ -1,7 +1,8 @@
 """Kubernetes tools API endpoints."""
 import logging
+from typing import Optional
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Query
 from ark_sdk.models.tool_v1alpha1 import ToolV1alpha1
 from ark_sdk.models.tool_v1alpha1_spec import ToolV1alpha1Spec
 
@@ -14,6 +15,9 @@ from ...models.tools import (
     ToolUpdateRequest,
     ToolDetailResponse
 )
+from ...utils.informers import ensure_informer
+from ...utils.json_patch import set_fields
+from ...utils.pagination import list_resources
 from .exceptions import handle_k8s_errors
 
 logger = logging.getLogger(__name__)
@@ -56,7 +60,11 @@ def tool_to_detail_response(tool: dict) -> ToolDetailResponse:
 
 @router.get("", response_model=ToolListResponse)
 @handle_k8s_errors(operation="list", resource_type="tool")
-async def list_tools(namespace: str) -> ToolListResponse:
+async def list_tools(
+    namespace: str,
+    limit: Optional[int] = Query(None, ge=1, description="Maximum number of items to return"),
+    page_token: Optional[str] = Query(None, description="Token from next_page_token of the previous page")
+) -> ToolListResponse:
     """
     List all Tool CRs in a namespace.
     
@@ -67,15 +75,17 @@ async def list_tools(namespace: str) -> ToolListResponse:
         ToolListResponse: List of all tools in the namespace
     """
     async with with_ark_client(namespace, VERSION) as ark_client:
-        tools = await ark_client.tools.a_list()
+        await ensure_informer(ark_client.tools, namespace)
+        tools, next_page_token = await list_resources(ark_client.tools, limit, page_token)
         
         tool_list = []
         for tool in tools:
-            tool_list.append(tool_to_response(tool.to_dict()))
+            tool_list.append(tool_to_response(tool))
         
         return ToolListResponse(
             items=tool_list,
-            total=len(tool_list)
+            total=len(tool_list),
+            next_page_token=next_page_token
         )
 
 
@@ -146,24 +156,12 @@ async def update_tool(namespace: str, tool_name: str, body: ToolUpdateRequest) -
         ToolDetailResponse: The updated tool details
     """
     async with with_ark_client(namespace, VERSION) as ark_client:
-        # Get the existing tool first
-        existing_tool = await ark_client.tools.a_get(tool_name)
-        existing_dict = existing_tool.to_dict()
-        
-        # Update metadata if provided
-        if body.labels is not None:
-            existing_dict["metadata"]["labels"] = body.labels
-        if body.annotations is not None:
-            existing_dict["metadata"]["annotations"] = body.annotations
-            
-        # Update spec if provided
+        # Replace metadata and spec if provided, in a single patch request
+        patch = set_fields({"labels": body.labels, "annotations": body.annotations}, path="/metadata")
         if body.spec is not None:
-            existing_dict["spec"] = body.spec.model_dump(by_alias=True, exclude_none=True)
-        
-        # Update the tool
-        updated_resource = ToolV1alpha1(**existing_dict)
+            patch += set_fields({"spec": body.spec.model_dump(by_alias=True, exclude_none=True)}, path="")
         
-        updated_tool = await ark_client.tools.a_update(updated_resource)
+        updated_tool = await ark_client.tools.a_patch(tool_name, patch)
         
         return tool_to_detail_response(updated_tool.to_dict())
 
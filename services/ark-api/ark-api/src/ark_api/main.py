@@ -8,7 +8,11 @@ from fastapi.responses import JSONResponse
 from kubernetes_asyncio import client
 
 from .api import router
+from .api.health import k8s_call_metrics
+from .api.v1.openai_batches import batch_manager
 from .core.config import setup_logging
+from ark_sdk.client import close_clients, get_client_pool
+from ark_sdk.informer import stop_informers
 from ark_sdk.k8s import init_k8s
 
 # Initialize logging
@@ -21,10 +25,14 @@ async def lifespan(app: FastAPI):
     logger.info("Starting up ARK API...")
     await init_k8s()
     logger.info("Kubernetes clients initialized")
+    get_client_pool().add_hook(k8s_call_metrics)
     yield
     # Shutdown
     logger.info("Shutting down ARK API...")
+    await batch_manager.close()
     # Close all kubernetes async clients
+    await stop_informers()
+    await close_clients()
     await client.ApiClient().close()
 
 
@@ -88,6 +96,8 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Let the dashboard read validators for conditional requests
+    expose_headers=["ETag", "Last-Modified"],
 )
 
 # Log CORS origins at startup
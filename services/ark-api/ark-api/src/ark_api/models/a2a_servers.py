@@ -17,6 +17,7 @@ class A2AServerResponse(BaseModel):
 class A2AServerListResponse(BaseModel):
     items: List[A2AServerResponse]
     total: int
+    next_page_token: Optional[str] = None
 
 
 class A2AServerDetailResponse(BaseModel):
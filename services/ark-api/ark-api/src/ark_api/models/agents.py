@@ -86,6 +86,7 @@ class AgentListResponse(BaseModel):
     """List of agents response model."""
     items: List[AgentResponse]
     count: int
+    next_page_token: Optional[str] = None
 
 
 class AgentCreateRequest(BaseModel):
@@ -28,6 +28,34 @@ class EventListResponse(BaseModel):
     """Response model for listing events."""
     items: List[EventResponse]
     total: int
+    next_page_token: Optional[str] = None
+
+
+def raw_event_to_dict(event: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a raw Kubernetes event (camelCase JSON) to the to_dict() form used by event_to_response."""
+    metadata = event.get("metadata") or {}
+    involved_object = event.get("involvedObject") or {}
+    return {
+        "metadata": {
+            "name": metadata.get("name"),
+            "namespace": metadata.get("namespace"),
+            "uid": metadata.get("uid"),
+            "creation_timestamp": metadata.get("creationTimestamp"),
+        },
+        "involved_object": {
+            "kind": involved_object.get("kind"),
+            "name": involved_object.get("name"),
+            "namespace": involved_object.get("namespace"),
+            "uid": involved_object.get("uid"),
+        },
+        "source": event.get("source") or {},
+        "type": event.get("type"),
+        "reason": event.get("reason"),
+        "message": event.get("message"),
+        "first_timestamp": event.get("firstTimestamp"),
+        "last_timestamp": event.get("lastTimestamp"),
+        "count": event.get("count"),
+    }
 
 
 def event_to_response(event_dict: Dict[str, Any]) -> EventResponse:
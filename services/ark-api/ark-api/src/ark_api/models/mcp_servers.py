@@ -20,6 +20,7 @@ class MCPServerResponse(BaseModel):
 class MCPServerListResponse(BaseModel):
     items: List[MCPServerResponse]
     total: int
+    next_page_token: Optional[str] = None
 
 
 class MCPServerDetailResponse(BaseModel):
@@ -24,6 +24,7 @@ class MemoryDetailResponse(BaseModel):
 class MemoryListResponse(BaseModel):
     """Response model for memory list."""
     items: List[MemoryResponse]
+    next_page_token: Optional[str] = None
 
 
 class MemoryCreateRequest(BaseModel):
@@ -54,6 +54,7 @@ class ModelListResponse(BaseModel):
     """List of models response model."""
     items: List[ModelResponse]
     count: int
+    next_page_token: Optional[str] = None
 
 
 class ModelCreateRequest(BaseModel):
@@ -76,6 +76,7 @@ class QueryListResponse(BaseModel):
     """Response for listing queries."""
     items: List[QueryResponse]
     count: int
+    next_page_token: Optional[str] = None
 
 
 class QueryCreateRequest(BaseModel):
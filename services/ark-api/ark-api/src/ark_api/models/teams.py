@@ -45,6 +45,7 @@ class TeamListResponse(BaseModel):
     """List of teams response model."""
     items: List[TeamResponse]
     count: int
+    next_page_token: Optional[str] = None
 
 
 class TeamCreateRequest(BaseModel):
@@ -14,6 +14,7 @@ class ToolResponse(BaseModel):
 class ToolListResponse(BaseModel):
     items: List[ToolResponse]
     total: int
+    next_page_token: Optional[str] = None
 
 
 class ToolDetailResponse(BaseModel):
@@ -0,0 +1,277 @@
+"""In-process runner for the OpenAI-compatible batches API."""
+
+import asyncio
+import json
+import logging
+import os
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+import aiofiles
+from fastapi import HTTPException
+from openai.types import Batch, BatchError, BatchRequestCounts
+from openai.types.batch import Errors
+
+from .file_store import FileStore
+
+logger = logging.getLogger(__name__)
+
+# Requests of all batches in flight at once, leaving room for interactive queries
+BATCH_CONCURRENCY = int(os.getenv("ARK_API_BATCH_CONCURRENCY", "8"))
+# Batches validating or in progress at once; further batches are rejected with 429
+BATCH_MAX_ACTIVE = int(os.getenv("ARK_API_BATCH_MAX_ACTIVE", "4"))
+BATCH_MAX_REQUESTS = 50000
+BATCH_MAX_ERRORS = 100
+COMPLETION_WINDOW_SECONDS = {"24h": 24 * 60 * 60}
+SUPPORTED_ENDPOINTS = ("/v1/chat/completions",)
+ACTIVE_STATUSES = ("validating", "in_progress", "finalizing", "cancelling")
+
+# Runs one request: (batch_id, line index, body) -> (status code, request id, response body)
+RequestRunner = Callable[[str, int, Dict[str, Any]], Awaitable[Tuple[int, Optional[str], Dict[str, Any]]]]
+
+
+def error_body(message: str, error_type: str = "server_error") -> Dict[str, Any]:
+    """Create an OpenAI-compatible error response body."""
+    return {"error": {"message": message, "type": error_type}}
+
+
+class BatchManager:
+    """
+    Runs batches of requests from JSONL input files.
+
+    Each line is run by the request runner; requests of all batches share one
+    concurrency limit and at most max_active batches run at once. Results are
+    appended to output and error files as they complete, so memory does not
+    grow with the batch size. Batch state is kept in memory and is lost on
+    restart; input and output files are kept by the FileStore.
+    """
+
+    def __init__(
+        self,
+        store: FileStore,
+        run_request: RequestRunner,
+        concurrency: int = BATCH_CONCURRENCY,
+        max_active: int = BATCH_MAX_ACTIVE,
+        max_requests: int = BATCH_MAX_REQUESTS,
+    ):
+        self.store = store
+        self.run_request = run_request
+        self.concurrency = concurrency
+        self.max_active = max_active
+        self.max_requests = max_requests
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._batches: Dict[str, Batch] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._cancel_events: Dict[str, asyncio.Event] = {}
+
+    def _active_count(self) -> int:
+        return sum(1 for batch in self._batches.values() if batch.status in ACTIVE_STATUSES)
+
+    async def create(
+        self,
+        input_file_id: str,
+        endpoint: str,
+        completion_window: str,
+        metadata: Optional[Dict[str, str]] = None,
+    ) -> Batch:
+        """
+        Create a batch and start running it in the background.
+
+        Raises:
+            HTTPException: 400 for unsupported parameters, 404 if the input file
+                does not exist, 429 if max_active batches are already running
+        """
+        if endpoint not in SUPPORTED_ENDPOINTS:
+            raise HTTPException(status_code=400, detail=f"Unsupported endpoint '{endpoint}', supported: {', '.join(SUPPORTED_ENDPOINTS)}")
+        if completion_window not in COMPLETION_WINDOW_SECONDS:
+            raise HTTPException(status_code=400, detail=f"Unsupported completion_window '{completion_window}', supported: {', '.join(COMPLETION_WINDOW_SECONDS)}")
+        input_file = self.store.get(input_file_id)
+        if input_file.purpose != "batch":
+            raise HTTPException(status_code=400, detail=f"File '{input_file_id}' does not have purpose 'batch'")
+        if self._active_count() >= self.max_active:
+            raise HTTPException(status_code=429, detail=f"Too many active batches, at most {self.max_active} can run at once")
+
+        created_at = int(time.time())
+        batch = Batch(
+            id=f"batch_{uuid.uuid4().hex}",
+            object="batch",
+            endpoint=endpoint,
+            input_file_id=input_file_id,
+            completion_window=completion_window,
+            status="validating",
+            created_at=created_at,
+            expires_at=created_at + COMPLETION_WINDOW_SECONDS[completion_window],
+            request_counts=BatchRequestCounts(total=0, completed=0, failed=0),
+            metadata=metadata,
+        )
+        self._batches[batch.id] = batch
+        self._cancel_events[batch.id] = asyncio.Event()
+        self._tasks[batch.id] = asyncio.create_task(self._run(batch))
+        logger.info(f"Created batch {batch.id} for file {input_file_id}")
+        return batch
+
+    def get(self, batch_id: str) -> Batch:
+        batch = self._batches.get(batch_id)
+        if batch is None:
+            raise HTTPException(status_code=404, detail=f"Batch '{batch_id}' not found")
+        return batch
+
+    def list(self) -> List[Batch]:
+        """Batches, newest first"""
+        return sorted(self._batches.values(), key=lambda batch: batch.created_at, reverse=True)
+
+    def cancel(self, batch_id: str) -> Batch:
+        """Stop starting new requests; requests in flight finish and are kept"""
+        batch = self.get(batch_id)
+        if batch.status in ("validating", "in_progress"):
+            batch.status = "cancelling"
+            batch.cancelling_at = int(time.time())
+            self._cancel_events[batch_id].set()
+        return batch
+
+    async def close(self) -> None:
+        """Cancel running batches, e.g. on FastAPI lifespan shutdown"""
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _validate(self, batch: Batch) -> bool:
+        """Check every input line, failing the batch with the errors found"""
+        errors: List[BatchError] = []
+        custom_ids = set()
+        total = 0
+        async for line in self.store.read_lines(batch.input_file_id):
+            if not line.strip():
+                continue
+            total += 1
+            message, param = self._check_line(line, batch.endpoint, custom_ids)
+            if message and len(errors) < BATCH_MAX_ERRORS:
+                errors.append(BatchError(code="invalid_request", line=total, message=message, param=param))
+        if total == 0:
+            errors.append(BatchError(code="empty_file", message="The input file contains no requests"))
+        elif total > self.max_requests:
+            errors.append(BatchError(code="too_many_requests", message=f"The input file contains {total} requests, at most {self.max_requests} are allowed"))
+
+        batch.request_counts.total = total
+        if errors:
+            batch.status = "failed"
+            batch.failed_at = int(time.time())
+            batch.errors = Errors(object="list", data=errors)
+            return False
+        return True
+
+    def _check_line(self, line: str, endpoint: str, custom_ids: set) -> Tuple[Optional[str], Optional[str]]:
+        try:
+            request = json.loads(line)
+        except json.JSONDecodeError as e:
+            return f"Invalid JSON: {e}", None
+        if not isinstance(request, dict):
+            return "Each line must be a JSON object", None
+        custom_id = request.get("custom_id")
+        if not isinstance(custom_id, str) or not custom_id:
+            return "Missing custom_id", "custom_id"
+        if custom_id in custom_ids:
+            return f"Duplicate custom_id '{custom_id}'", "custom_id"
+        custom_ids.add(custom_id)
+        if request.get("method") != "POST":
+            return "Only method 'POST' is supported", "method"
+        if request.get("url") != endpoint:
+            return f"The url must match the batch endpoint '{endpoint}'", "url"
+        if not isinstance(request.get("body"), dict):
+            return "Missing request body", "body"
+        return None, None
+
+    async def _run(self, batch: Batch) -> None:
+        try:
+            if not await self._validate(batch):
+                return
+            if batch.status == "validating":
+                batch.status = "in_progress"
+                batch.in_progress_at = int(time.time())
+            await self._execute(batch)
+        except Exception as e:
+            logger.error(f"Batch {batch.id} failed: {e}")
+            batch.status = "failed"
+            batch.failed_at = int(time.time())
+            batch.errors = Errors(object="list", data=[BatchError(code="batch_failed", message=str(e))])
+        finally:
+            self._tasks.pop(batch.id, None)
+
+    async def _execute(self, batch: Batch) -> None:
+        cancelled = self._cancel_events[batch.id]
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.concurrency * 2)
+        output_id, error_id = self.store.new_id(), self.store.new_id()
+        counts = batch.request_counts
+
+        def stopped() -> bool:
+            return cancelled.is_set() or time.time() >= batch.expires_at
+
+        async def produce():
+            index = 0
+            async for line in self.store.read_lines(batch.input_file_id):
+                if not line.strip():
+                    continue
+                if stopped():
+                    break
+                await queue.put((index, json.loads(line)))
+                index += 1
+            for _ in range(self.concurrency):
+                await queue.put(None)
+
+        async def work(output, error_output):
+            while (item := await queue.get()) is not None:
+                index, request = item
+                async with self._semaphore:
+                    # Lines queued before a cancel or expiry are not run
+                    if stopped():
+                        continue
+                    try:
+                        status_code, request_id, body = await self.run_request(batch.id, index, request["body"])
+                    except Exception as e:
+                        logger.error(f"Batch {batch.id} request {request['custom_id']} failed: {e}")
+                        status_code, request_id, body = 500, None, error_body(str(e))
+                result = {
+                    "id": f"batch_req_{uuid.uuid4().hex}",
+                    "custom_id": request["custom_id"],
+                    "response": {"status_code": status_code, "request_id": request_id, "body": body},
+                    "error": None,
+                }
+                if status_code < 400:
+                    counts.completed += 1
+                    await output.write(json.dumps(result) + "\n")
+                else:
+                    counts.failed += 1
+                    await error_output.write(json.dumps(result) + "\n")
+
+        async with aiofiles.open(self.store.path(output_id), "w") as output, \
+                aiofiles.open(self.store.path(error_id), "w") as error_output:
+            # A failing worker cancels the others instead of leaving the producer blocked
+            async with asyncio.TaskGroup() as tasks:
+                tasks.create_task(produce())
+                for _ in range(self.concurrency):
+                    tasks.create_task(work(output, error_output))
+
+        batch.status = "finalizing"
+        batch.finalizing_at = int(time.time())
+        if counts.completed:
+            batch.output_file_id = (await self.store.register(output_id, f"{batch.id}_output.jsonl", "batch_output")).id
+        else:
+            os.remove(self.store.path(output_id))
+        if counts.failed:
+            batch.error_file_id = (await self.store.register(error_id, f"{batch.id}_error.jsonl", "batch_output")).id
+        else:
+            os.remove(self.store.path(error_id))
+
+        now = int(time.time())
+        if cancelled.is_set():
+            batch.status = "cancelled"
+            batch.cancelled_at = now
+        elif counts.completed + counts.failed < counts.total:
+            batch.status = "expired"
+            batch.expired_at = now
+        else:
+            batch.status = "completed"
+            batch.completed_at = now
+        logger.info(f"Batch {batch.id} {batch.status}: {counts.completed} completed, {counts.failed} failed of {counts.total}")
@@ -0,0 +1,46 @@
+"""Conditional GET support for single-resource endpoints."""
+
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Optional
+
+from ark_sdk.cache import http_validators
+from fastapi import Request, Response
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against an ETag."""
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or any(tag.removeprefix("W/") == etag.removeprefix("W/") for tag in tags)
+
+
+def not_modified(request: Request, response: Response, resource: Dict[str, Any]) -> Optional[Response]:
+    """
+    Set ETag and Last-Modified for a resource and check the request's validators.
+
+    Args:
+        request: The incoming request
+        response: The response the endpoint will return
+        resource: The resource dict, including its metadata
+
+    Returns:
+        A 304 Not Modified response when the client's copy is current, otherwise None
+    """
+    validators = http_validators(resource)
+    response.headers.update(validators)
+
+    # If-None-Match takes precedence over If-Modified-Since (RFC 9110)
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        if "ETag" in validators and _etag_matches(if_none_match, validators["ETag"]):
+            return Response(status_code=304, headers=validators)
+        return None
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and "Last-Modified" in validators:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return None
+        if since.tzinfo is not None and parsedate_to_datetime(validators["Last-Modified"]) <= since:
+            return Response(status_code=304, headers=validators)
+    return None
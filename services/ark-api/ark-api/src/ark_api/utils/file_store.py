@@ -0,0 +1,120 @@
+"""Local storage for files of the OpenAI-compatible files API."""
+
+import logging
+import os
+import tempfile
+import time
+import uuid
+from typing import AsyncIterator, Dict, List, Optional
+
+import aiofiles
+from fastapi import HTTPException
+from openai.types import FileObject
+
+logger = logging.getLogger(__name__)
+
+FILES_DIR = os.getenv("ARK_API_FILES_DIR") or os.path.join(tempfile.gettempdir(), "ark-api-files")
+FILES_MAX_BYTES = int(os.getenv("ARK_API_FILES_MAX_BYTES", str(200 * 1024 * 1024)))
+CHUNK_SIZE = 1024 * 1024
+
+
+class FileStore:
+    """
+    Files kept on local disk, as a content file and a JSON metadata file per id.
+
+    Metadata is loaded from the directory on first use, so files outlive
+    restarts when the directory is on a persistent volume.
+    """
+
+    def __init__(self, directory: str = FILES_DIR, max_bytes: int = FILES_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._files: Optional[Dict[str, FileObject]] = None
+
+    def _load(self) -> Dict[str, FileObject]:
+        if self._files is None:
+            os.makedirs(self.directory, exist_ok=True)
+            files = {}
+            for entry in os.listdir(self.directory):
+                if not entry.endswith(".json"):
+                    continue
+                try:
+                    with open(os.path.join(self.directory, entry)) as f:
+                        file = FileObject.model_validate_json(f.read())
+                    files[file.id] = file
+                except Exception as e:
+                    logger.warning(f"Skipping unreadable file metadata {entry}: {e}")
+            self._files = files
+        return self._files
+
+    def new_id(self) -> str:
+        return f"file-{uuid.uuid4().hex}"
+
+    def path(self, file_id: str) -> str:
+        """Path of a file's content, also used to write output files before register"""
+        self._load()
+        return os.path.join(self.directory, file_id)
+
+    async def create(self, filename: str, purpose: str, chunks: AsyncIterator[bytes]) -> FileObject:
+        """
+        Store an uploaded file, streaming it to disk.
+
+        Raises:
+            HTTPException: 413 if the file is larger than max_bytes
+        """
+        file_id = self.new_id()
+        path = self.path(file_id)
+        size = 0
+        try:
+            async with aiofiles.open(path, "wb") as f:
+                async for chunk in chunks:
+                    size += len(chunk)
+                    if size > self.max_bytes:
+                        raise HTTPException(status_code=413, detail=f"File exceeds the maximum size of {self.max_bytes} bytes")
+                    await f.write(chunk)
+        except BaseException:
+            if os.path.exists(path):
+                os.remove(path)
+            raise
+        return await self.register(file_id, filename, purpose)
+
+    async def register(self, file_id: str, filename: str, purpose: str) -> FileObject:
+        """Add the metadata for content written to path(file_id)"""
+        file = FileObject(
+            id=file_id,
+            bytes=os.path.getsize(self.path(file_id)),
+            created_at=int(time.time()),
+            filename=filename,
+            object="file",
+            purpose=purpose,
+            status="processed",
+        )
+        async with aiofiles.open(self.path(file_id) + ".json", "w") as f:
+            await f.write(file.model_dump_json())
+        self._load()[file_id] = file
+        return file
+
+    def get(self, file_id: str) -> FileObject:
+        file = self._load().get(file_id)
+        if file is None:
+            raise HTTPException(status_code=404, detail=f"File '{file_id}' not found")
+        return file
+
+    def list(self, purpose: Optional[str] = None) -> List[FileObject]:
+        """Files, newest first"""
+        files = [file for file in self._load().values() if purpose is None or file.purpose == purpose]
+        return sorted(files, key=lambda file: file.created_at, reverse=True)
+
+    async def read_lines(self, file_id: str) -> AsyncIterator[str]:
+        """Read a file line by line without loading it into memory"""
+        self.get(file_id)
+        async with aiofiles.open(self.path(file_id), "r", encoding="utf-8") as f:
+            async for line in f:
+                yield line
+
+    def delete(self, file_id: str) -> None:
+        self.get(file_id)
+        for path in (self.path(file_id), self.path(file_id) + ".json"):
+            if os.path.exists(path):
+                os.remove(path)
+        self._load().pop(file_id, None)
@@ -0,0 +1,39 @@
+"""Informer cache helpers for frequently listed ARK resources."""
+
+import logging
+import os
+from collections import OrderedDict
+
+from ark_sdk.informer import start_informer, stop_informers
+
+logger = logging.getLogger(__name__)
+
+# Serve agent/team/model/tool reads from a shared list+watch cache per namespace
+INFORMER_CACHE_ENABLED = os.getenv("ARK_API_INFORMER_CACHE", "false").lower() == "true"
+INFORMER_MAX_STALENESS = float(os.getenv("ARK_API_INFORMER_MAX_STALENESS", "30"))
+# Namespaces with informers; the least recently listed one is stopped beyond this
+INFORMER_MAX_NAMESPACES = int(os.getenv("ARK_API_INFORMER_MAX_NAMESPACES", "20"))
+
+_namespaces: "OrderedDict[str, None]" = OrderedDict()
+
+
+async def ensure_informer(resource_client, namespace: str) -> None:
+    """
+    Attach the shared informer for a resource kind and namespace if caching is enabled.
+
+    The informer syncs in the background; reads use the API server until it has.
+    """
+    if not INFORMER_CACHE_ENABLED:
+        return
+    _namespaces[namespace] = None
+    _namespaces.move_to_end(namespace)
+    while len(_namespaces) > INFORMER_MAX_NAMESPACES:
+        evicted, _ = _namespaces.popitem(last=False)
+        logger.info(f"Stopping informers for namespace {evicted}")
+        await stop_informers(evicted)
+    await start_informer(
+        resource_client,
+        namespace,
+        max_staleness=INFORMER_MAX_STALENESS,
+        wait=False,
+    )
@@ -0,0 +1,30 @@
+"""JSON patch helpers for single-request resource updates."""
+
+from typing import Any, Dict, List
+
+
+def set_fields(fields: Dict[str, Any], path: str = "/spec") -> List[Dict[str, Any]]:
+    """
+    Build JSON patch operations that set each field under a path.
+
+    An "add" operation replaces an existing member wholesale and creates a
+    missing one, matching the replace-per-field semantics of the update
+    routes without reading the resource first. Fields set to None are skipped.
+
+    Args:
+        fields: Field names and their new values
+        path: JSON pointer of the object holding the fields
+
+    Returns:
+        The list of JSON patch operations
+    """
+    return [
+        {"op": "add", "path": f"{path}/{_escape(name)}", "value": value}
+        for name, value in fields.items()
+        if value is not None
+    ]
+
+
+def _escape(name: str) -> str:
+    """Escape a member name for use in a JSON pointer (RFC 6901)."""
+    return name.replace("~", "~0").replace("/", "~1")
@@ -0,0 +1,128 @@
+"""Short-lived cache of the resources listed as OpenAI models."""
+
+import asyncio
+import logging
+import math
+import os
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Seconds a namespace's listing is served; 0 disables the cache
+MODELS_CACHE_TTL = float(os.getenv("ARK_API_MODELS_CACHE_TTL", "30"))
+
+Listing = Dict[str, Any]  # Metadata items, or the Exception raised, by plural
+
+
+class _Entry:
+    def __init__(self, listing: Listing, ttl: float):
+        self.listing = listing
+        self.expires_at = time.monotonic() + ttl
+        self.watches: List[asyncio.Task] = []
+
+
+class MetadataListCache:
+    """
+    Per-namespace cache of metadata listings of several resource kinds.
+
+    The kinds are listed concurrently. A listing is served for at most ttl
+    seconds, and dropped sooner when a metadata watch, started from each
+    list's resourceVersion, sees a resource added or deleted. The watches
+    end with the entry. Listings with a failed kind are not cached.
+    """
+
+    def __init__(self, ttl: float = MODELS_CACHE_TTL):
+        self.ttl = ttl
+        self._entries: Dict[Tuple[str, Tuple[str, ...]], _Entry] = {}
+        self._locks: Dict[Tuple[str, Tuple[str, ...]], asyncio.Lock] = {}
+
+    async def get(self, ark_client, namespace: str, plurals: Sequence[str]) -> Listing:
+        """
+        List the metadata of resource kinds in a namespace.
+
+        Args:
+            ark_client: The ARK client for the namespace
+            namespace: The namespace to list
+            plurals: Resource client attributes of ark_client, e.g. ('agents', 'teams')
+
+        Returns:
+            The metadata items, or the Exception raised, by plural
+        """
+        key = (namespace, tuple(plurals))
+        entry = self._fresh_entry(key)
+        if entry is not None:
+            return entry.listing
+
+        # Concurrent misses for the same namespace share one listing
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        try:
+            async with lock:
+                entry = self._fresh_entry(key)
+                if entry is not None:
+                    return entry.listing
+
+                resource_clients = [getattr(ark_client, plural) for plural in plurals]
+                results = await asyncio.gather(
+                    *(client.a_list_metadata_versioned(namespace) for client in resource_clients),
+                    return_exceptions=True,
+                )
+                listing = {
+                    plural: result if isinstance(result, Exception) else result[0]
+                    for plural, result in zip(plurals, results)
+                }
+                if self.ttl > 0 and not any(isinstance(result, Exception) for result in results):
+                    self._store(key, listing, zip(resource_clients, (result[1] for result in results)))
+                return listing
+        finally:
+            self._discard_lock(key)
+
+    def invalidate(self, namespace: Optional[str] = None) -> None:
+        """Drop the cached listings of a namespace, or of all namespaces"""
+        for key in [key for key in self._entries if namespace is None or key[0] == namespace]:
+            self._drop(key, self._entries[key])
+
+    def _fresh_entry(self, key) -> Optional[_Entry]:
+        entry = self._entries.get(key)
+        if entry is not None and entry.expires_at <= time.monotonic():
+            self._drop(key, entry)
+            return None
+        return entry
+
+    def _store(self, key, listing: Listing, versions) -> None:
+        entry = _Entry(listing, self.ttl)
+        self._entries[key] = entry
+        for resource_client, resource_version in versions:
+            entry.watches.append(asyncio.create_task(self._watch(key, entry, resource_client, resource_version)))
+
+    def _discard_lock(self, key) -> None:
+        """Forget the lock of a key with no entry, so any namespace sent by a client is not kept"""
+        lock = self._locks.get(key)
+        if lock is not None and not lock.locked() and key not in self._entries:
+            del self._locks[key]
+
+    def _drop(self, key, entry: _Entry) -> None:
+        if self._entries.get(key) is entry:
+            del self._entries[key]
+            self._discard_lock(key)
+        current = asyncio.current_task()
+        for task in entry.watches:
+            if task is not current:
+                task.cancel()
+
+    async def _watch(self, key, entry: _Entry, resource_client, resource_version: Optional[str]) -> None:
+        try:
+            async for event in resource_client.a_watch_metadata(
+                key[0],
+                resource_version=resource_version,
+                timeout_seconds=math.ceil(self.ttl),
+            ):
+                # Names and creation times don't change on MODIFIED
+                if event.get("type") in ("ADDED", "DELETED"):
+                    break
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.debug(f"Watch for {resource_client.kind}s in {key[0]} ended: {e}")
+        # A change, an error or the end of the watch all mean the entry can't be trusted
+        self._drop(key, entry)
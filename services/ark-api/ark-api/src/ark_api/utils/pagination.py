@@ -0,0 +1,29 @@
+"""Pagination helpers for ARK resource list endpoints."""
+
+from typing import Any, List, Optional, Tuple
+
+DEFAULT_PAGE_SIZE = 100
+
+
+async def list_resources(
+    resource_client,
+    limit: Optional[int] = None,
+    page_token: Optional[str] = None
+) -> Tuple[List[Any], Optional[str]]:
+    """
+    List all resources, or a single page when a limit or page token is given.
+
+    Items are returned as raw resource dicts, skipping SDK model construction.
+
+    Args:
+        resource_client: The ARK resource client to list with
+        limit: Maximum number of items in the page
+        page_token: Continue token returned as next_page_token by the previous page
+
+    Returns:
+        The listed items and the token for the next page, if any
+    """
+    if limit is None and not page_token:
+        return await resource_client.a_list(raw=True), None
+    return await resource_client.a_list_page(limit=limit or DEFAULT_PAGE_SIZE, continue_token=page_token, raw=True)
+
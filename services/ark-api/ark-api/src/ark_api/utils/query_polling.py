@@ -1,11 +1,16 @@
 """Query polling utilities for waiting on query completion."""
 
 import asyncio
+import json
 import logging
+import os
 import time
+from typing import AsyncIterator, Optional
+
 from fastapi import HTTPException
-from openai.types.chat import ChatCompletion, ChatCompletionMessage
+from openai.types.chat import ChatCompletion, ChatCompletionChunk, ChatCompletionMessage
 from openai.types.chat.chat_completion import Choice
+from openai.types.chat.chat_completion_chunk import Choice as ChunkChoice, ChoiceDelta
 from openai.types.completion_usage import CompletionUsage
 
 logger = logging.getLogger(__name__)
@@ -49,31 +54,149 @@ def _get_error_message(status: dict) -> str:
         return "Query execution failed: No error details available"
 
 
-async def poll_query_completion(ark_client, query_name: str, model: str, input_text: str) -> ChatCompletion:
-    """Poll for query completion and return chat completion response."""
-    max_attempts = 60  # 5 minutes with 5 second intervals
-    
-    for _ in range(max_attempts):
-        await asyncio.sleep(5)
-        
-        query = await ark_client.queries.a_get(query_name)
-        query_dict = query.to_dict()
-        status = query_dict.get("status", {})
-        phase = status.get("phase", "pending")
-        
-        logger.info(f"Query {query_name} status: {phase}")
-        
-        if phase == "done":
-            responses = status.get("responses", [])
-            if not responses:
-                raise HTTPException(status_code=500, detail="No response received")
-                
-            content = responses[0].get("content", "")
-            return _create_chat_completion_response(query_name, model, content, input_text)
-                    
-        elif phase == "error":
-            detail_message = _get_error_message(status)
-            raise HTTPException(status_code=500, detail=detail_message)
-                
-    # If we get here, we timed out waiting for completion
-    raise HTTPException(status_code=504, detail=f"Query {query_name} timed out after 5 minutes")
\ No newline at end of file
+# Default wait for a query, matching the default Query spec.timeout of 5m
+QUERY_TIMEOUT_SECONDS = float(os.getenv("ARK_API_QUERY_TIMEOUT_SECONDS", "300"))
+TERMINAL_PHASES = ("done", "error")
+# Seconds between SSE keep-alive comments while a streamed query is pending
+STREAM_KEEPALIVE_SECONDS = float(os.getenv("ARK_API_STREAM_KEEPALIVE_SECONDS", "15"))
+
+
+async def poll_query_completion(
+    ark_client,
+    query_name: str,
+    model: str,
+    input_text: str,
+    timeout: Optional[float] = None,
+) -> ChatCompletion:
+    """Wait for query completion and return chat completion response.
+
+    Watches the query instead of polling it, so the response is returned as
+    soon as the query reaches a terminal phase. Waits at most timeout seconds,
+    defaulting to QUERY_TIMEOUT_SECONDS.
+    """
+    timeout = timeout or QUERY_TIMEOUT_SECONDS
+    try:
+        query_dict = await ark_client.queries.a_wait_for(
+            query_name,
+            lambda query: query.get("status", {}).get("phase") in TERMINAL_PHASES,
+            timeout=timeout,
+            raw=True
+        )
+    except TimeoutError:
+        raise HTTPException(status_code=504, detail=f"Query {query_name} timed out after {timeout:g} seconds")
+
+    status = query_dict.get("status", {})
+    phase = status.get("phase")
+    logger.info(f"Query {query_name} status: {phase}")
+
+    if phase == "error":
+        detail_message = _get_error_message(status)
+        raise HTTPException(status_code=500, detail=detail_message)
+
+    responses = status.get("responses", [])
+    if not responses:
+        raise HTTPException(status_code=500, detail="No response received")
+
+    content = responses[0].get("content", "")
+    return _create_chat_completion_response(query_name, model, content, input_text)
+
+
+def _sse_event(data: str) -> str:
+    return f"data: {data}\n\n"
+
+
+def _chunk_event(query_name: str, model: str, created: int, delta: ChoiceDelta, finish_reason: Optional[str] = None) -> str:
+    """Create an OpenAI-compatible chat.completion.chunk event."""
+    chunk = ChatCompletionChunk(
+        id=query_name,
+        object="chat.completion.chunk",
+        created=created,
+        model=model,
+        choices=[ChunkChoice(index=0, delta=delta, finish_reason=finish_reason)],
+    )
+    return _sse_event(chunk.model_dump_json())
+
+
+def _error_event(message: str) -> str:
+    """Create an error event, which OpenAI clients raise as an API error."""
+    return _sse_event(json.dumps({"error": {"message": message, "type": "server_error"}}))
+
+
+async def stream_query_completion(
+    ark_client,
+    query_name: str,
+    model: str,
+    timeout: Optional[float] = None,
+) -> AsyncIterator[str]:
+    """Stream query progress as chat.completion.chunk server-sent events.
+
+    Watches the query and sends the role and content chunks as soon as it has
+    a response, further chunks if the response grows, and keep-alive comments
+    while it is pending. The HTTP status is already sent by then, so failures
+    and timeouts are sent as an error event.
+    """
+    timeout = timeout or QUERY_TIMEOUT_SECONDS
+    deadline = time.monotonic() + timeout
+    created = int(time.time())
+    sent: Optional[str] = None  # Content sent so far, None until the role chunk
+
+    events = ark_client.queries.a_watch(field_selector=f"metadata.name={query_name}", raw=True)
+    next_event = None
+    try:
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                yield _error_event(f"Query {query_name} timed out after {timeout:g} seconds")
+                return
+            if next_event is None:
+                next_event = asyncio.ensure_future(events.__anext__())
+            done, _ = await asyncio.wait({next_event}, timeout=min(STREAM_KEEPALIVE_SECONDS, remaining))
+            if not done:
+                yield ": keep-alive\n\n"
+                continue
+
+            try:
+                event = next_event.result()
+            except Exception as e:
+                logger.error(f"Error streaming query {query_name}: {e}")
+                yield _error_event(str(e))
+                return
+            finally:
+                next_event = None
+
+            if event.type == "DELETED":
+                yield _error_event(f"Query {query_name} was deleted")
+                return
+            if event.type not in ("ADDED", "MODIFIED"):
+                continue
+
+            status = event.object.get("status") or {}
+            phase = status.get("phase")
+            if phase == "error":
+                yield _error_event(_get_error_message(status))
+                return
+
+            responses = status.get("responses") or []
+            if responses:
+                content = responses[0].get("content") or ""
+                if sent is None:
+                    sent = ""
+                    yield _chunk_event(query_name, model, created, ChoiceDelta(role="assistant", content=""))
+                if len(content) > len(sent) and content.startswith(sent):
+                    yield _chunk_event(query_name, model, created, ChoiceDelta(content=content[len(sent):]))
+                    sent = content
+
+            if phase == "done":
+                logger.info(f"Query {query_name} status: {phase}")
+                if sent is None:
+                    yield _error_event("No response received")
+                    return
+                yield _chunk_event(query_name, model, created, ChoiceDelta(), finish_reason="stop")
+                yield _sse_event("[DONE]")
+                return
+    finally:
+        if next_event is not None:
+            next_event.cancel()
+            await asyncio.gather(next_event, return_exceptions=True)
+        # Release the watch connection now rather than when the generator is collected
+        await events.aclose()
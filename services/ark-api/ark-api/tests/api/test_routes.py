@@ -56,27 +56,20 @@ class TestSecretsEndpoint(unittest.TestCase):
         self.client = TestClient(app)
     
     @patch('ark_api.api.v1.secrets.ApiClient')
-    @patch('ark_api.api.v1.secrets.client.CoreV1Api')
-    def test_list_secrets_success(self, mock_v1_api, mock_api_client):
+    @patch('ark_api.api.v1.secrets.list_metadata')
+    def test_list_secrets_success(self, mock_list_metadata, mock_api_client):
         """Test successful secret listing."""
         # Setup async context manager mock
         mock_api_client_instance = AsyncMock()
         mock_api_client.return_value.__aenter__.return_value = mock_api_client_instance
         
-        # Mock secret objects
-        mock_secret1 = Mock()
-        mock_secret1.metadata.name = "my-secret"
-        mock_secret1.metadata.uid = "uuid-1234-5678"
-        
-        mock_secret2 = Mock()
-        mock_secret2.metadata.name = "app-config"
-        mock_secret2.metadata.uid = "uuid-abcd-efgh"
-        
-        # Mock the API response
-        mock_api_instance = mock_v1_api.return_value
-        mock_response = Mock()
-        mock_response.items = [mock_secret1, mock_secret2]
-        mock_api_instance.list_namespaced_secret = AsyncMock(return_value=mock_response)
+        # Mock the metadata-only API response
+        mock_list_metadata.return_value = {
+            "items": [
+                {"metadata": {"name": "my-secret", "uid": "uuid-1234-5678"}},
+                {"metadata": {"name": "app-config", "uid": "uuid-abcd-efgh"}}
+            ]
+        }
         
         # Make the request
         response = self.client.get("/v1/namespaces/default/secrets")
@@ -95,22 +88,23 @@ class TestSecretsEndpoint(unittest.TestCase):
         self.assertEqual(data["items"][1]["name"], "app-config")
         self.assertEqual(data["items"][1]["id"], "uuid-abcd-efgh")
         
-        # Verify namespace parameter was passed correctly
-        mock_api_instance.list_namespaced_secret.assert_called_once_with("default")
+        # Verify only metadata was requested for the namespace
+        mock_list_metadata.assert_awaited_once_with(
+            mock_api_client_instance,
+            "/api/v1/namespaces/{namespace}/secrets",
+            {"namespace": "default"}
+        )
     
     @patch('ark_api.api.v1.secrets.ApiClient')
-    @patch('ark_api.api.v1.secrets.client.CoreV1Api')
-    def test_list_secrets_empty(self, mock_v1_api, mock_api_client):
+    @patch('ark_api.api.v1.secrets.list_metadata')
+    def test_list_secrets_empty(self, mock_list_metadata, mock_api_client):
         """Test listing secrets when none exist in the namespace."""
         # Setup async context manager mock
         mock_api_client_instance = AsyncMock()
         mock_api_client.return_value.__aenter__.return_value = mock_api_client_instance
         
         # Mock empty response
-        mock_api_instance = mock_v1_api.return_value
-        mock_response = Mock()
-        mock_response.items = []
-        mock_api_instance.list_namespaced_secret = AsyncMock(return_value=mock_response)
+        mock_list_metadata.return_value = {"items": []}
         
         # Make the request
         response = self.client.get("/v1/namespaces/empty-namespace/secrets")
@@ -122,22 +116,21 @@ class TestSecretsEndpoint(unittest.TestCase):
         self.assertEqual(data["items"], [])
         
         # Verify namespace parameter was passed correctly
-        mock_api_instance.list_namespaced_secret.assert_called_once_with("empty-namespace")
+        self.assertEqual(mock_list_metadata.call_args.args[2], {"namespace": "empty-namespace"})
     
     @patch('ark_api.api.v1.secrets.ApiClient')
-    @patch('ark_api.api.v1.secrets.client.CoreV1Api')
-    def test_list_secrets_kubernetes_api_error(self, mock_v1_api, mock_api_client):
+    @patch('ark_api.api.v1.secrets.list_metadata')
+    def test_list_secrets_kubernetes_api_error(self, mock_list_metadata, mock_api_client):
         """Test handling of Kubernetes API errors."""
         # Setup async context manager mock
         mock_api_client_instance = AsyncMock()
         mock_api_client.return_value.__aenter__.return_value = mock_api_client_instance
         
         # Mock API exception for namespace not found
-        mock_api_instance = mock_v1_api.return_value
-        mock_api_instance.list_namespaced_secret = AsyncMock(side_effect=ApiException(
+        mock_list_metadata.side_effect = ApiException(
             status=404,
             reason="Not Found"
-        ))
+        )
         
         # Make the request
         response = self.client.get("/v1/namespaces/nonexistent/secrets")
@@ -149,19 +142,18 @@ class TestSecretsEndpoint(unittest.TestCase):
         self.assertIn("Not Found", data["detail"])
     
     @patch('ark_api.api.v1.secrets.ApiClient')
-    @patch('ark_api.api.v1.secrets.client.CoreV1Api')
-    def test_list_secrets_forbidden_error(self, mock_v1_api, mock_api_client):
+    @patch('ark_api.api.v1.secrets.list_metadata')
+    def test_list_secrets_forbidden_error(self, mock_list_metadata, mock_api_client):
         """Test handling of forbidden access errors."""
         # Setup async context manager mock
         mock_api_client_instance = AsyncMock()
         mock_api_client.return_value.__aenter__.return_value = mock_api_client_instance
         
         # Mock API exception for forbidden access
-        mock_api_instance = mock_v1_api.return_value
-        mock_api_instance.list_namespaced_secret = AsyncMock(side_effect=ApiException(
+        mock_list_metadata.side_effect = ApiException(
             status=403,
             reason="Forbidden"
-        ))
+        )
         
         # Make the request
         response = self.client.get("/v1/namespaces/restricted-namespace/secrets")
@@ -173,22 +165,17 @@ class TestSecretsEndpoint(unittest.TestCase):
         self.assertIn("Forbidden", data["detail"])
     
     @patch('ark_api.api.v1.secrets.ApiClient')
-    @patch('ark_api.api.v1.secrets.client.CoreV1Api')
-    def test_list_secrets_with_special_characters_in_namespace(self, mock_v1_api, mock_api_client):
+    @patch('ark_api.api.v1.secrets.list_metadata')
+    def test_list_secrets_with_special_characters_in_namespace(self, mock_list_metadata, mock_api_client):
         """Test listing secrets with special characters in namespace name."""
         # Setup async context manager mock
         mock_api_client_instance = AsyncMock()
         mock_api_client.return_value.__aenter__.return_value = mock_api_client_instance
         
         # Mock response with secrets
-        mock_secret = Mock()
-        mock_secret.metadata.name = "secret-in-special-namespace"
-        mock_secret.metadata.uid = "uuid-special"
-        
-        mock_api_instance = mock_v1_api.return_value
-        mock_response = Mock()
-        mock_response.items = [mock_secret]
-        mock_api_instance.list_namespaced_secret = AsyncMock(return_value=mock_response)
+        mock_list_metadata.return_value = {
+            "items": [{"metadata": {"name": "secret-in-special-namespace", "uid": "uuid-special"}}]
+        }
         
         # Make the request with special characters in namespace
         response = self.client.get("/v1/namespaces/test-namespace-123_prod/secrets")
@@ -200,7 +187,7 @@ class TestSecretsEndpoint(unittest.TestCase):
         self.assertEqual(data["items"][0]["name"], "secret-in-special-namespace")
         
         # Verify namespace parameter was passed correctly
-        mock_api_instance.list_namespaced_secret.assert_called_once_with("test-namespace-123_prod")
+        self.assertEqual(mock_list_metadata.call_args.args[2], {"namespace": "test-namespace-123_prod"})
 
 
 class TestSecretGetEndpoint(unittest.TestCase):
@@ -562,8 +549,7 @@ class TestAgentsEndpoint(unittest.TestCase):
         mock_ark_client.return_value.__aenter__.return_value = mock_client
         
         # Mock agent objects
-        mock_agent1 = Mock()
-        mock_agent1.to_dict.return_value = {
+        mock_agent1 = {
             "metadata": {"name": "test-agent", "namespace": "default"},
             "spec": {
                 "description": "Test agent",
@@ -573,8 +559,7 @@ class TestAgentsEndpoint(unittest.TestCase):
             "status": {"phase": "Ready"}
         }
         
-        mock_agent2 = Mock()
-        mock_agent2.to_dict.return_value = {
+        mock_agent2 = {
             "metadata": {"name": "another-agent", "namespace": "default"},
             "spec": {
                 "description": "Another test agent",
@@ -625,7 +610,31 @@ class TestAgentsEndpoint(unittest.TestCase):
         data = response.json()
         self.assertEqual(data["count"], 0)
         self.assertEqual(data["items"], [])
-    
+
+    @patch('ark_api.api.v1.agents.with_ark_client')
+    def test_list_agents_paginated(self, mock_ark_client):
+        """Test listing a page of agents with a page token."""
+        # Setup async context manager mock
+        mock_client = AsyncMock()
+        mock_ark_client.return_value.__aenter__.return_value = mock_client
+
+        mock_agent = {
+            "metadata": {"name": "test-agent", "namespace": "default"},
+            "spec": {"prompt": "You are a helpful assistant"}
+        }
+        mock_client.agents.a_list_page = AsyncMock(return_value=([mock_agent], "next-token"))
+
+        # Make the request
+        response = self.client.get("/v1/namespaces/default/agents?limit=1&page_token=this-token")
+
+        # Assert response
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data["count"], 1)
+        self.assertEqual(data["next_page_token"], "next-token")
+        mock_client.agents.a_list_page.assert_awaited_once_with(limit=1, continue_token="this-token", raw=True)
+        mock_client.agents.a_list.assert_not_called()
+
     @patch('ark_api.api.v1.agents.with_ark_client')
     def test_create_agent_success(self, mock_ark_client):
         """Test successful agent creation."""
@@ -740,22 +749,54 @@ class TestAgentsEndpoint(unittest.TestCase):
         self.assertEqual(data["status"]["phase"], "Ready")
     
     @patch('ark_api.api.v1.agents.with_ark_client')
-    def test_update_agent_success(self, mock_ark_client):
-        """Test successful agent update."""
-        # Setup async context manager mock
+    def test_get_agent_not_modified(self, mock_ark_client):
+        """Test conditional agent reads answered with 304 when unchanged."""
         mock_client = AsyncMock()
         mock_ark_client.return_value.__aenter__.return_value = mock_client
         
-        # Mock existing agent
-        existing_agent = Mock()
-        existing_agent.to_dict.return_value = {
-            "metadata": {"name": "test-agent", "namespace": "default"},
-            "spec": {
-                "description": "Old description",
-                "prompt": "Old prompt"
+        mock_agent = Mock()
+        mock_agent.to_dict.return_value = {
+            "metadata": {
+                "name": "test-agent",
+                "namespace": "default",
+                "resourceVersion": "123",
+                "creationTimestamp": "2025-01-01T00:00:00Z"
             },
-            "status": {"phase": "Ready"}
+            "spec": {"prompt": "You are a helpful assistant"}
         }
+        mock_client.agents.a_get = AsyncMock(return_value=mock_agent)
+        
+        response = self.client.get("/v1/namespaces/default/agents/test-agent")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["etag"], 'W/"123"')
+        self.assertEqual(response.headers["last-modified"], "Wed, 01 Jan 2025 00:00:00 GMT")
+        
+        response = self.client.get(
+            "/v1/namespaces/default/agents/test-agent",
+            headers={"If-None-Match": '"123"'}
+        )
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+        
+        response = self.client.get(
+            "/v1/namespaces/default/agents/test-agent",
+            headers={"If-Modified-Since": "Thu, 02 Jan 2025 00:00:00 GMT"}
+        )
+        self.assertEqual(response.status_code, 304)
+        
+        response = self.client.get(
+            "/v1/namespaces/default/agents/test-agent",
+            headers={"If-None-Match": 'W/"122"'}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["name"], "test-agent")
+    
+    @patch('ark_api.api.v1.agents.with_ark_client')
+    def test_update_agent_success(self, mock_ark_client):
+        """Test successful agent update."""
+        # Setup async context manager mock
+        mock_client = AsyncMock()
+        mock_ark_client.return_value.__aenter__.return_value = mock_client
         
         # Mock updated agent
         updated_agent = Mock()
@@ -769,8 +810,7 @@ class TestAgentsEndpoint(unittest.TestCase):
             "status": {"phase": "Ready"}
         }
         
-        mock_client.agents.a_get = AsyncMock(return_value=existing_agent)
-        mock_client.agents.a_update = AsyncMock(return_value=updated_agent)
+        mock_client.agents.a_patch = AsyncMock(return_value=updated_agent)
         
         # Make the request
         request_data = {
@@ -795,18 +835,6 @@ class TestAgentsEndpoint(unittest.TestCase):
         mock_client = AsyncMock()
         mock_ark_client.return_value.__aenter__.return_value = mock_client
         
-        # Mock existing agent
-        existing_agent = Mock()
-        existing_agent.to_dict.return_value = {
-            "metadata": {"name": "test-agent", "namespace": "default"},
-            "spec": {
-                "description": "Original description",
-                "prompt": "Original prompt",
-                "modelRef": {"name": "gpt-3.5-turbo"}
-            },
-            "status": {"phase": "Ready"}
-        }
-        
         # Mock updated agent
         updated_agent = Mock()
         updated_agent.to_dict.return_value = {
@@ -819,8 +847,7 @@ class TestAgentsEndpoint(unittest.TestCase):
             "status": {"phase": "Ready"}
         }
         
-        mock_client.agents.a_get = AsyncMock(return_value=existing_agent)
-        mock_client.agents.a_update = AsyncMock(return_value=updated_agent)
+        mock_client.agents.a_patch = AsyncMock(return_value=updated_agent)
         
         # Make the request - only update description
         request_data = {"description": "Updated description only"}
@@ -828,6 +855,10 @@ class TestAgentsEndpoint(unittest.TestCase):
         
         # Assert response
         self.assertEqual(response.status_code, 200)
+        mock_client.agents.a_patch.assert_awaited_once_with(
+            "test-agent",
+            [{"op": "add", "path": "/spec/description", "value": "Updated description only"}]
+        )
         data = response.json()
         self.assertEqual(data["description"], "Updated description only")
         self.assertEqual(data["prompt"], "Original prompt")
@@ -868,8 +899,7 @@ class TestModelsEndpoint(unittest.TestCase):
         mock_ark_client.return_value.__aenter__.return_value = mock_client
         
         # Mock model objects
-        mock_model1 = Mock()
-        mock_model1.to_dict.return_value = {
+        mock_model1 = {
             "metadata": {"name": "gpt-4-model", "namespace": "default"},
             "spec": {
                 "type": "openai",
@@ -878,8 +908,7 @@ class TestModelsEndpoint(unittest.TestCase):
             "status": {"phase": "Ready"}
         }
         
-        mock_model2 = Mock()
-        mock_model2.to_dict.return_value = {
+        mock_model2 = {
             "metadata": {"name": "claude-model", "namespace": "default"},
             "spec": {
                 "type": "bedrock",
@@ -1279,8 +1308,7 @@ class TestQueriesEndpoint(unittest.TestCase):
         mock_ark_client.return_value.__aenter__.return_value = mock_client
         
         # Mock query objects
-        mock_query1 = Mock()
-        mock_query1.to_dict.return_value = {
+        mock_query1 = {
             "metadata": {"name": "test-query", "namespace": "default"},
             "spec": {
                 "input": "What is the weather today?"
@@ -1288,8 +1316,7 @@ class TestQueriesEndpoint(unittest.TestCase):
             "status": {"phase": "done", "response": "It's sunny and 72°F"}
         }
         
-        mock_query2 = Mock()
-        mock_query2.to_dict.return_value = {
+        mock_query2 = {
             "metadata": {"name": "another-query", "namespace": "default"},
             "spec": {
                 "input": "Tell me a joke"
@@ -1501,19 +1528,6 @@ class TestQueriesEndpoint(unittest.TestCase):
         mock_client = AsyncMock()
         mock_ark_client.return_value.__aenter__.return_value = mock_client
         
-        # Mock existing query
-        existing_query = Mock()
-        existing_query.to_dict.return_value = {
-            "metadata": {"name": "test-query", "namespace": "default"},
-            "spec": {
-                "input": "Old question"
-            },
-            "status": {"phase": "done"}
-        }
-        # Need to add other attributes to avoid KeyError
-        existing_query.metadata = {"name": "test-query", "namespace": "default"}
-        existing_query.spec = existing_query.to_dict()["spec"]
-        
         # Mock updated query
         updated_query = Mock()
         updated_query.to_dict.return_value = {
@@ -1525,8 +1539,7 @@ class TestQueriesEndpoint(unittest.TestCase):
             "status": {"phase": "pending"}
         }
         
-        mock_client.queries.a_get = AsyncMock(return_value=existing_query)
-        mock_client.queries.a_update = AsyncMock(return_value=updated_query)
+        mock_client.queries.a_patch = AsyncMock(return_value=updated_query)
         
         # Make the request
         request_data = {
@@ -1549,21 +1562,6 @@ class TestQueriesEndpoint(unittest.TestCase):
         mock_client = AsyncMock()
         mock_ark_client.return_value.__aenter__.return_value = mock_client
         
-        # Mock existing query
-        existing_query = Mock()
-        existing_query.to_dict.return_value = {
-            "metadata": {"name": "test-query", "namespace": "default"},
-            "spec": {
-                "input": "Question",
-                "memory": {"name": "old-memory"},
-                "sessionId": "old-session"
-            },
-            "status": {"phase": "done"}
-        }
-        # Need to add other attributes to avoid KeyError
-        existing_query.metadata = {"name": "test-query", "namespace": "default"}
-        existing_query.spec = existing_query.to_dict()["spec"]
-        
         # Mock updated query
         updated_query = Mock()
         updated_query.to_dict.return_value = {
@@ -1576,8 +1574,7 @@ class TestQueriesEndpoint(unittest.TestCase):
             "status": {"phase": "pending"}
         }
         
-        mock_client.queries.a_get = AsyncMock(return_value=existing_query)
-        mock_client.queries.a_update = AsyncMock(return_value=updated_query)
+        mock_client.queries.a_patch = AsyncMock(return_value=updated_query)
         
         # Make the request - only update memory
         request_data = {"memory": {"name": "new-memory"}}
@@ -1585,6 +1582,10 @@ class TestQueriesEndpoint(unittest.TestCase):
         
         # Assert response
         self.assertEqual(response.status_code, 200)
+        mock_client.queries.a_patch.assert_awaited_once_with(
+            "test-query",
+            [{"op": "add", "path": "/spec/memory", "value": {"name": "new-memory", "namespace": None}}]
+        )
         data = response.json()
         self.assertEqual(data["input"], "Question")  # Unchanged
         self.assertEqual(data["memory"]["name"], "new-memory")  # Updated
@@ -1625,8 +1626,7 @@ class TestTeamsEndpoint(unittest.TestCase):
         mock_ark_client.return_value.__aenter__.return_value = mock_client
         
         # Mock team objects
-        mock_team1 = Mock()
-        mock_team1.to_dict.return_value = {
+        mock_team1 = {
             "metadata": {"name": "dev-team", "namespace": "default"},
             "spec": {
                 "description": "Development team",
@@ -1639,8 +1639,7 @@ class TestTeamsEndpoint(unittest.TestCase):
             "status": {"phase": "Ready"}
         }
         
-        mock_team2 = Mock()
-        mock_team2.to_dict.return_value = {
+        mock_team2 = {
             "metadata": {"name": "research-team", "namespace": "default"},
             "spec": {
                 "strategy": "parallel",
@@ -1888,18 +1887,6 @@ class TestTeamsEndpoint(unittest.TestCase):
         mock_client = AsyncMock()
         mock_ark_client.return_value.__aenter__.return_value = mock_client
         
-        # Mock existing team
-        existing_team = Mock()
-        existing_team.to_dict.return_value = {
-            "metadata": {"name": "test-team", "namespace": "default"},
-            "spec": {
-                "description": "Old description",
-                "members": [{"name": "agent1", "type": "agent"}],
-                "strategy": "sequential"
-            },
-            "status": {"phase": "Ready"}
-        }
-        
         # Mock updated team
         updated_team = Mock()
         updated_team.to_dict.return_value = {
@@ -1915,8 +1902,7 @@ class TestTeamsEndpoint(unittest.TestCase):
             "status": {"phase": "Ready"}
         }
         
-        mock_client.teams.a_get = AsyncMock(return_value=existing_team)
-        mock_client.teams.a_update = AsyncMock(return_value=updated_team)
+        mock_client.teams.a_patch = AsyncMock(return_value=updated_team)
         
         # Make the request
         request_data = {
@@ -1944,19 +1930,6 @@ class TestTeamsEndpoint(unittest.TestCase):
         mock_client = AsyncMock()
         mock_ark_client.return_value.__aenter__.return_value = mock_client
         
-        # Mock existing team
-        existing_team = Mock()
-        existing_team.to_dict.return_value = {
-            "metadata": {"name": "test-team", "namespace": "default"},
-            "spec": {
-                "description": "Original description",
-                "members": [{"name": "agent1", "type": "agent"}],
-                "strategy": "sequential",
-                "maxTurns": 5
-            },
-            "status": {"phase": "Ready"}
-        }
-        
         # Mock updated team
         updated_team = Mock()
         updated_team.to_dict.return_value = {
@@ -1970,8 +1943,7 @@ class TestTeamsEndpoint(unittest.TestCase):
             "status": {"phase": "Ready"}
         }
         
-        mock_client.teams.a_get = AsyncMock(return_value=existing_team)
-        mock_client.teams.a_update = AsyncMock(return_value=updated_team)
+        mock_client.teams.a_patch = AsyncMock(return_value=updated_team)
         
         # Make the request - only update maxTurns
         request_data = {"maxTurns": 10}
@@ -2001,4 +1973,244 @@ class TestTeamsEndpoint(unittest.TestCase):
         self.assertEqual(response.status_code, 204)
         
         # Verify the delete was called correctly
-        mock_client.teams.a_delete.assert_called_once_with("test-team")
\ No newline at end of file
+        mock_client.teams.a_delete.assert_called_once_with("test-team")
+
+class TestOpenAIChatCompletionsEndpoint(unittest.TestCase):
+    """Test cases for the /openai/v1/chat/completions endpoint."""
+    
+    def setUp(self):
+        """Set up test client."""
+        self.client = TestClient(app)
+    
+    @patch('ark_api.api.v1.openai.with_ark_client')
+    def test_chat_completion_with_timeout(self, mock_ark_client):
+        """Test that the request timeout bounds both the wait and the query."""
+        mock_client = AsyncMock()
+        mock_ark_client.return_value.__aenter__.return_value = mock_client
+        mock_client.queries.a_wait_for = AsyncMock(return_value={
+            "metadata": {"name": "openai-query-1"},
+            "status": {"phase": "done", "responses": [{"content": "Hello there"}]}
+        })
+        
+        response = self.client.post("/openai/v1/chat/completions", json={
+            "model": "agent/test-agent",
+            "messages": [{"role": "user", "content": "Hi"}],
+            "timeout": 2.5
+        })
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["choices"][0]["message"]["content"], "Hello there")
+        query = mock_client.queries.a_create.call_args[0][0]
+        self.assertEqual(query.spec.timeout, "3s")
+        self.assertEqual(mock_client.queries.a_wait_for.call_args.kwargs["timeout"], 2.5)
+    
+    @patch('ark_api.api.v1.openai.with_ark_client')
+    def test_chat_completion_in_namespace(self, mock_ark_client):
+        """Test that the query is created in the namespace the models were listed from."""
+        mock_client = AsyncMock()
+        mock_ark_client.return_value.__aenter__.return_value = mock_client
+        mock_client.queries.a_wait_for = AsyncMock(return_value={
+            "status": {"phase": "done", "responses": [{"content": "Hello there"}]}
+        })
+        
+        response = self.client.post("/openai/v1/chat/completions?namespace=team-a", json={
+            "model": "agent/test-agent",
+            "messages": [{"role": "user", "content": "Hi"}]
+        })
+        
+        self.assertEqual(response.status_code, 200)
+        mock_ark_client.assert_called_once_with("team-a", "v1alpha1")
+        self.assertEqual(mock_client.queries.a_create.call_args[0][0].metadata["namespace"], "team-a")
+    
+    @patch('ark_api.api.v1.openai.with_ark_client')
+    def test_chat_completion_timed_out(self, mock_ark_client):
+        """Test that a query not finishing in time returns 504."""
+        mock_client = AsyncMock()
+        mock_ark_client.return_value.__aenter__.return_value = mock_client
+        mock_client.queries.a_wait_for = AsyncMock(side_effect=TimeoutError("timed out"))
+        
+        response = self.client.post("/openai/v1/chat/completions", json={
+            "model": "agent/test-agent",
+            "messages": [{"role": "user", "content": "Hi"}],
+            "timeout": 1
+        })
+        
+        self.assertEqual(response.status_code, 504)
+        self.assertIn("timed out after 1 seconds", response.json()["detail"])
+    
+    def test_chat_completion_invalid_timeout(self):
+        """Test that a non-positive timeout is rejected."""
+        response = self.client.post("/openai/v1/chat/completions", json={
+            "model": "agent/test-agent",
+            "messages": [{"role": "user", "content": "Hi"}],
+            "timeout": 0
+        })
+        
+        self.assertEqual(response.status_code, 422)
+    
+    @patch('ark_api.utils.query_polling.STREAM_KEEPALIVE_SECONDS', 0.01)
+    @patch('ark_api.api.v1.openai.with_ark_client')
+    def test_chat_completion_stream(self, mock_ark_client):
+        """Test that a streamed completion sends chunks as the query progresses."""
+        import asyncio
+        import json
+        from types import SimpleNamespace
+        
+        mock_client = AsyncMock()
+        mock_ark_client.return_value.__aenter__.return_value = mock_client
+        
+        async def watch(**kwargs):
+            self.assertTrue(kwargs["field_selector"].startswith("metadata.name=openai-query-"))
+            yield SimpleNamespace(type="ADDED", object={"status": {"phase": "running"}})
+            await asyncio.sleep(0.05)
+            yield SimpleNamespace(type="MODIFIED", object={
+                "status": {"phase": "running", "responses": [{"content": "Hello"}]}
+            })
+            yield SimpleNamespace(type="MODIFIED", object={
+                "status": {"phase": "done", "responses": [{"content": "Hello there"}]}
+            })
+        
+        mock_client.queries.a_watch = watch
+        
+        response = self.client.post("/openai/v1/chat/completions", json={
+            "model": "agent/test-agent",
+            "messages": [{"role": "user", "content": "Hi"}],
+            "stream": True
+        })
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.headers["content-type"].startswith("text/event-stream"))
+        self.assertIn(": keep-alive", response.text)
+        events = [line[len("data: "):] for line in response.text.splitlines() if line.startswith("data: ")]
+        self.assertEqual(events[-1], "[DONE]")
+        chunks = [json.loads(event) for event in events[:-1]]
+        self.assertTrue(all(chunk["object"] == "chat.completion.chunk" for chunk in chunks))
+        self.assertEqual(chunks[0]["choices"][0]["delta"]["role"], "assistant")
+        content = "".join(chunk["choices"][0]["delta"].get("content") or "" for chunk in chunks)
+        self.assertEqual(content, "Hello there")
+        self.assertEqual(chunks[-1]["choices"][0]["finish_reason"], "stop")
+    
+    @patch('ark_api.api.v1.openai.with_ark_client')
+    def test_chat_completion_stream_error(self, mock_ark_client):
+        """Test that a failed streamed query sends an error event."""
+        import json
+        from types import SimpleNamespace
+        
+        mock_client = AsyncMock()
+        mock_ark_client.return_value.__aenter__.return_value = mock_client
+        
+        async def watch(**kwargs):
+            yield SimpleNamespace(type="ADDED", object={"status": {"phase": "error", "message": "model unavailable"}})
+        
+        mock_client.queries.a_watch = watch
+        
+        response = self.client.post("/openai/v1/chat/completions", json={
+            "model": "agent/test-agent",
+            "messages": [{"role": "user", "content": "Hi"}],
+            "stream": True
+        })
+        
+        self.assertEqual(response.status_code, 200)
+        event = json.loads(response.text.strip()[len("data: "):])
+        self.assertEqual(event["error"]["message"], "Query execution failed: model unavailable")
+    
+    @patch('ark_api.api.v1.openai.model_list_cache')
+    @patch('ark_api.api.v1.openai.with_ark_client')
+    def test_list_models_in_namespace(self, mock_ark_client, mock_cache):
+        """Test that /models lists the selected namespace and skips kinds that failed."""
+        mock_client = AsyncMock()
+        mock_ark_client.return_value.__aenter__.return_value = mock_client
+        metadata = {"name": "researcher", "creationTimestamp": "2025-01-01T00:00:00Z"}
+        mock_cache.get = AsyncMock(return_value={
+            "agents": [{"metadata": metadata}],
+            "teams": Exception("Failed to list Teams: forbidden"),
+            "models": [],
+            "tools": [],
+        })
+        
+        response = self.client.get("/openai/v1/models?namespace=research")
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([model["id"] for model in response.json()["data"]], ["agent/researcher"])
+        mock_ark_client.assert_called_once_with("research", "v1alpha1")
+        self.assertEqual(mock_cache.get.call_args[0][1:], ("research", ["agents", "teams", "models", "tools"]))
+
+
+class TestEventsEndpoint(unittest.TestCase):
+    """Test cases for the /namespaces/{namespace}/events endpoint."""
+    
+    def setUp(self):
+        """Set up test client."""
+        self.client = TestClient(app)
+    
+    def _event(self, name, created):
+        return {
+            "metadata": {"name": name, "namespace": "default", "uid": f"uid-{name}", "creationTimestamp": created},
+            "involvedObject": {"kind": "Agent", "name": "researcher"},
+            "type": "Warning",
+            "reason": "Failed",
+            "message": f"event {name}",
+            "count": 2,
+        }
+    
+    @patch('ark_api.api.v1.events.SCAN_CHUNK_SIZE', 2)
+    @patch('ark_api.api.v1.events.request_json')
+    @patch('ark_api.api.v1.events.ApiClient')
+    def test_list_events_page_newest_first(self, mock_api_client, mock_request_json):
+        """Test that a numbered page is found by scanning filtered chunks."""
+        mock_request_json.side_effect = [
+            {"metadata": {"continue": "c1"}, "items": [self._event("e1", "2025-01-01T00:00:01Z"), self._event("e2", "2025-01-01T00:00:05Z")]},
+            {"metadata": {"continue": "c2"}, "items": [self._event("e3", "2025-01-01T00:00:03Z"), self._event("e4", "2025-01-01T00:00:02Z")]},
+            {"metadata": {}, "items": [self._event("e5", "2025-01-01T00:00:04Z")]},
+        ]
+        
+        response = self.client.get("/v1/namespaces/default/events?type=Warning&kind=Agent&page=2&limit=2")
+        
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual([event["name"] for event in data["items"]], ["e3", "e4"])
+        self.assertEqual(data["total"], 5)
+        self.assertEqual(data["items"][0]["involved_object_kind"], "Agent")
+        self.assertEqual(data["items"][0]["count"], 2)
+        calls = mock_request_json.call_args_list
+        self.assertEqual(calls[0].kwargs["field_selector"], "type=Warning,involvedObject.kind=Agent")
+        self.assertEqual([call.kwargs["_continue"] for call in calls], [None, "c1", "c2"])
+    
+    @patch('ark_api.api.v1.events.request_json')
+    @patch('ark_api.api.v1.events.ApiClient')
+    def test_list_events_page_token(self, mock_api_client, mock_request_json):
+        """Test that with a page token one API server page is returned with the next token."""
+        mock_request_json.return_value = {
+            "metadata": {"continue": "next"},
+            "items": [self._event("e1", "2025-01-01T00:00:01Z"), self._event("e2", "2025-01-01T00:00:05Z")],
+        }
+        
+        response = self.client.get("/v1/namespaces/default/events?name=researcher&limit=2&page_token=prev")
+        
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual([event["name"] for event in data["items"]], ["e2", "e1"])
+        self.assertEqual(data["next_page_token"], "next")
+        mock_request_json.assert_called_once()
+        kwargs = mock_request_json.call_args.kwargs
+        self.assertEqual((kwargs["field_selector"], kwargs["limit"], kwargs["_continue"]), ("involvedObject.name=researcher", 2, "prev"))
+    
+    @patch('ark_api.api.v1.events.request_json')
+    @patch('ark_api.api.v1.events.ApiClient')
+    def test_list_events_defaults_to_first_page(self, mock_api_client, mock_request_json):
+        """Test that a limit alone returns the newest events of the whole list, and an empty token starts token paging."""
+        mock_request_json.return_value = {
+            "metadata": {"continue": "next"},
+            "items": [self._event("e1", "2025-01-01T00:00:01Z"), self._event("e2", "2025-01-01T00:00:05Z")],
+        }
+        
+        with patch('ark_api.api.v1.events._scan_page', new_callable=AsyncMock) as mock_scan:
+            mock_scan.return_value = ([self._event("e2", "2025-01-01T00:00:05Z")], 7)
+            data = self.client.get("/v1/namespaces/default/events?limit=1").json()
+        
+        self.assertEqual(mock_scan.call_args.args[3:], (1, 1))
+        self.assertEqual((data["total"], data["next_page_token"]), (7, None))
+        
+        data = self.client.get("/v1/namespaces/default/events?limit=2&page_token=").json()
+        self.assertEqual(data["next_page_token"], "next")
+        self.assertIsNone(mock_request_json.call_args.kwargs["_continue"])
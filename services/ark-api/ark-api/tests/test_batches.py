@@ -0,0 +1,213 @@
+"""Tests for the OpenAI-compatible files and batches API."""
+import asyncio
+import json
+import tempfile
+import unittest
+from unittest.mock import AsyncMock, patch
+
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+
+from ark_api.main import app
+from ark_api.utils.batches import BatchManager, error_body
+from ark_api.utils.file_store import FileStore
+
+
+def _batch_lines(*custom_ids, url="/v1/chat/completions"):
+    return "".join(
+        json.dumps({
+            "custom_id": custom_id,
+            "method": "POST",
+            "url": url,
+            "body": {"model": "agent/test-agent", "messages": [{"role": "user", "content": custom_id}]},
+        }) + "\n"
+        for custom_id in custom_ids
+    ).encode()
+
+
+async def _chunks(content: bytes):
+    yield content
+
+
+class TestBatchManager(unittest.IsolatedAsyncioTestCase):
+    """Test cases for running batches."""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.store = FileStore(self.directory.name)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    async def _wait(self, manager, batch_id, statuses=("completed", "failed", "cancelled", "expired")):
+        for _ in range(500):
+            batch = manager.get(batch_id)
+            if batch.status in statuses:
+                return batch
+            await asyncio.sleep(0.01)
+        self.fail(f"Batch stayed {manager.get(batch_id).status}")
+
+    async def _read(self, file_id):
+        return [json.loads(line) async for line in self.store.read_lines(file_id)]
+
+    async def test_batch_writes_output_and_errors(self):
+        """Test that results are written as they complete, with bounded concurrency."""
+        running, peak = 0, 0
+
+        async def run_request(batch_id, index, body):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            if body["messages"][0]["content"] == "bad":
+                return 500, f"query-{index}", error_body("Query execution failed")
+            return 200, f"query-{index}", {"object": "chat.completion", "index": index}
+
+        manager = BatchManager(self.store, run_request, concurrency=2)
+        input_file = await self.store.create("in.jsonl", "batch", _chunks(_batch_lines("a", "b", "bad", "c", "d")))
+
+        batch = await manager.create(input_file.id, "/v1/chat/completions", "24h")
+        batch = await self._wait(manager, batch.id)
+
+        self.assertEqual(batch.status, "completed")
+        self.assertEqual((batch.request_counts.total, batch.request_counts.completed, batch.request_counts.failed), (5, 4, 1))
+        self.assertLessEqual(peak, 2)
+        output = await self._read(batch.output_file_id)
+        self.assertEqual(sorted(line["custom_id"] for line in output), ["a", "b", "c", "d"])
+        self.assertTrue(all(line["response"]["status_code"] == 200 for line in output))
+        errors = await self._read(batch.error_file_id)
+        self.assertEqual(errors[0]["custom_id"], "bad")
+        self.assertEqual(errors[0]["response"]["body"]["error"]["message"], "Query execution failed")
+        self.assertEqual(self.store.get(batch.output_file_id).purpose, "batch_output")
+
+    async def test_invalid_input_fails_batch(self):
+        """Test that invalid lines fail the batch before any request runs."""
+        run_request = AsyncMock()
+        manager = BatchManager(self.store, run_request)
+        content = _batch_lines("a") + _batch_lines("a") + _batch_lines("b", url="/v1/embeddings") + b"not json\n"
+        input_file = await self.store.create("in.jsonl", "batch", _chunks(content))
+
+        batch = await manager.create(input_file.id, "/v1/chat/completions", "24h")
+        batch = await self._wait(manager, batch.id)
+
+        self.assertEqual(batch.status, "failed")
+        self.assertEqual([(error.line, error.param) for error in batch.errors.data], [(2, "custom_id"), (3, "url"), (4, None)])
+        run_request.assert_not_called()
+
+    async def test_admission_control_and_cancel(self):
+        """Test that batches beyond max_active are rejected and cancel keeps finished results."""
+        started, release = asyncio.Event(), asyncio.Event()
+
+        async def run_request(batch_id, index, body):
+            started.set()
+            await release.wait()
+            return 200, f"query-{index}", {"index": index}
+
+        manager = BatchManager(self.store, run_request, concurrency=1, max_active=1)
+        input_file = await self.store.create("in.jsonl", "batch", _chunks(_batch_lines("a", "b", "c")))
+
+        batch = await manager.create(input_file.id, "/v1/chat/completions", "24h")
+        await asyncio.wait_for(started.wait(), 5)
+        with self.assertRaises(HTTPException) as context:
+            await manager.create(input_file.id, "/v1/chat/completions", "24h")
+        self.assertEqual(context.exception.status_code, 429)
+
+        self.assertEqual(manager.cancel(batch.id).status, "cancelling")
+        release.set()
+        batch = await self._wait(manager, batch.id)
+
+        self.assertEqual(batch.status, "cancelled")
+        self.assertEqual(batch.request_counts.completed, 1)
+        self.assertEqual(len(await self._read(batch.output_file_id)), 1)
+
+    async def test_rejects_unsupported_endpoint(self):
+        manager = BatchManager(self.store, AsyncMock())
+        input_file = await self.store.create("in.jsonl", "batch", _chunks(_batch_lines("a")))
+
+        with self.assertRaises(HTTPException) as context:
+            await manager.create(input_file.id, "/v1/embeddings", "24h")
+        self.assertEqual(context.exception.status_code, 400)
+
+    async def test_file_store_reloads_files(self):
+        """Test that file metadata survives a new store on the same directory."""
+        input_file = await self.store.create("in.jsonl", "batch", _chunks(_batch_lines("a")))
+
+        store = FileStore(self.directory.name)
+
+        self.assertEqual(store.get(input_file.id).filename, "in.jsonl")
+        self.assertEqual(store.get(input_file.id).bytes, len(_batch_lines("a")))
+
+
+class TestRunBatchRequest(unittest.IsolatedAsyncioTestCase):
+    """Test cases for running a batch line as a query."""
+
+    @patch('ark_api.api.v1.openai_batches.with_ark_client')
+    async def test_run_batch_request(self, mock_ark_client):
+        """Test that a line runs as a query that is deleted once answered."""
+        from ark_api.api.v1.openai_batches import run_batch_request
+
+        mock_client = AsyncMock()
+        mock_ark_client.return_value.__aenter__.return_value = mock_client
+        mock_client.queries.a_wait_for = AsyncMock(return_value={
+            "status": {"phase": "done", "responses": [{"content": "Hello"}]}
+        })
+
+        status_code, request_id, body = await run_batch_request(
+            "batch_0123456789abcdef", 7, {"model": "agent/test-agent", "messages": [{"role": "user", "content": "Hi"}]}
+        )
+
+        self.assertEqual(status_code, 200)
+        self.assertEqual(request_id, "openai-batch-0123456789ab-7")
+        self.assertEqual(body["choices"][0]["message"]["content"], "Hello")
+        self.assertEqual(mock_client.queries.a_create.call_args[0][0].metadata["name"], request_id)
+        mock_client.queries.a_delete.assert_called_once_with(request_id)
+
+    async def test_run_batch_request_invalid_model(self):
+        from ark_api.api.v1.openai_batches import run_batch_request
+
+        status_code, request_id, body = await run_batch_request(
+            "batch_0123456789abcdef", 0, {"model": "gpt-4", "messages": [{"role": "user", "content": "Hi"}]}
+        )
+
+        self.assertEqual(status_code, 400)
+        self.assertIsNone(request_id)
+        self.assertEqual(body["error"]["type"], "invalid_request_error")
+
+
+class TestFilesEndpoint(unittest.TestCase):
+    """Test cases for the /openai/v1/files endpoint."""
+
+    def setUp(self):
+        self.client = TestClient(app)
+        self.directory = tempfile.TemporaryDirectory()
+        patcher = patch('ark_api.api.v1.openai_batches.file_store', FileStore(self.directory.name))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.directory.cleanup)
+
+    def test_upload_and_download_file(self):
+        content = _batch_lines("a", "b")
+        response = self.client.post(
+            "/openai/v1/files",
+            files={"file": ("requests.jsonl", content)},
+            data={"purpose": "batch"},
+        )
+
+        self.assertEqual(response.status_code, 200)
+        file = response.json()
+        self.assertEqual((file["filename"], file["bytes"], file["purpose"]), ("requests.jsonl", len(content), "batch"))
+        self.assertEqual(self.client.get(f"/openai/v1/files/{file['id']}/content").content, content)
+        self.assertEqual([f["id"] for f in self.client.get("/openai/v1/files").json()["data"]], [file["id"]])
+
+        self.assertTrue(self.client.delete(f"/openai/v1/files/{file['id']}").json()["deleted"])
+        self.assertEqual(self.client.get(f"/openai/v1/files/{file['id']}").status_code, 404)
+
+    def test_upload_rejects_other_purposes(self):
+        response = self.client.post(
+            "/openai/v1/files",
+            files={"file": ("data.jsonl", b"{}\n")},
+            data={"purpose": "fine-tune"},
+        )
+
+        self.assertEqual(response.status_code, 400)
@@ -93,3 +93,20 @@ class TestHealthEndpoints(unittest.TestCase):
         self.assertEqual(data["service"], "ark-api")
         self.assertIn("error", data)
         self.assertEqual(data["error"], "An internal error occurred during readiness check.")
+    
+    def test_metrics(self):
+        """Test the metrics endpoint exposes the Kubernetes call histogram."""
+        from ark_sdk.instrumentation import CallInfo
+        from ark_api.api.health import k8s_call_metrics
+        call = CallInfo("get", "Agent", "default")
+        call.status, call.duration = 200, 0.02
+        k8s_call_metrics.after_call(call)
+        
+        response = self.client.get("/metrics")
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.headers["content-type"].startswith("text/plain"))
+        self.assertIn(
+            'ark_sdk_request_duration_seconds_count{verb="get",kind="Agent",namespace="default",code="200"}',
+            response.text
+        )
@@ -0,0 +1,41 @@
+"""Tests for the informer cache helpers."""
+import unittest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+from ark_api.utils import informers
+
+
+class TestEnsureInformer(unittest.IsolatedAsyncioTestCase):
+    """Test cases for ensure_informer."""
+
+    def setUp(self):
+        for name, value in (("INFORMER_CACHE_ENABLED", True), ("INFORMER_MAX_NAMESPACES", 2)):
+            patcher = patch.object(informers, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        patcher = patch.object(informers, "_namespaces", informers.OrderedDict())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @patch('ark_api.utils.informers.stop_informers', new_callable=AsyncMock)
+    @patch('ark_api.utils.informers.start_informer', new_callable=AsyncMock)
+    async def test_starts_without_waiting_and_evicts_least_recent(self, mock_start, mock_stop):
+        """Test that informers sync in the background and the least recently listed namespace is stopped."""
+        agents = SimpleNamespace(kind="Agent")
+
+        await informers.ensure_informer(agents, "ns1")
+        await informers.ensure_informer(agents, "ns2")
+        await informers.ensure_informer(agents, "ns1")
+        await informers.ensure_informer(agents, "ns3")
+
+        self.assertFalse(mock_start.call_args.kwargs["wait"])
+        mock_stop.assert_awaited_once_with("ns2")
+        self.assertEqual(list(informers._namespaces), ["ns1", "ns3"])
+
+    @patch('ark_api.utils.informers.start_informer', new_callable=AsyncMock)
+    async def test_disabled(self, mock_start):
+        with patch.object(informers, "INFORMER_CACHE_ENABLED", False):
+            await informers.ensure_informer(SimpleNamespace(kind="Agent"), "ns1")
+
+        mock_start.assert_not_called()
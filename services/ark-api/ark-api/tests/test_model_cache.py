@@ -0,0 +1,98 @@
+"""Tests for the cache of resources listed as OpenAI models."""
+import asyncio
+import unittest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+from ark_api.utils.model_cache import MetadataListCache
+
+
+class FakeResourceClient:
+    def __init__(self, kind, names):
+        self.kind = kind
+        self.names = names
+        self.events = asyncio.Queue()
+        self.watched_versions = []
+        self.a_list_metadata_versioned = AsyncMock(side_effect=self._list)
+
+    async def _list(self, namespace):
+        return [{"metadata": {"name": name}} for name in self.names], "100"
+
+    async def a_watch_metadata(self, namespace, resource_version=None, timeout_seconds=None):
+        self.watched_versions.append(resource_version)
+        while True:
+            yield await self.events.get()
+
+
+class TestMetadataListCache(unittest.IsolatedAsyncioTestCase):
+    """Test cases for MetadataListCache."""
+
+    def setUp(self):
+        self.agents = FakeResourceClient("Agent", ["a1"])
+        self.teams = FakeResourceClient("Team", ["t1"])
+        self.ark_client = SimpleNamespace(agents=self.agents, teams=self.teams)
+        self.cache = MetadataListCache(ttl=30)
+
+    async def asyncTearDown(self):
+        self.cache.invalidate()
+        await asyncio.sleep(0)
+
+    async def test_serves_listing_until_resource_added(self):
+        """Test that a listing is cached until a watch sees a resource added."""
+        listing = await self.cache.get(self.ark_client, "default", ["agents", "teams"])
+        await self.cache.get(self.ark_client, "default", ["agents", "teams"])
+
+        self.assertEqual([item["metadata"]["name"] for item in listing["agents"]], ["a1"])
+        self.assertEqual(self.agents.a_list_metadata_versioned.await_count, 1)
+        await asyncio.sleep(0)
+        self.assertEqual(self.agents.watched_versions, ["100"])
+
+        # Status updates don't change the listing
+        await self.teams.events.put({"type": "MODIFIED", "object": {"metadata": {"name": "t1"}}})
+        await asyncio.sleep(0.01)
+        await self.cache.get(self.ark_client, "default", ["agents", "teams"])
+        self.assertEqual(self.agents.a_list_metadata_versioned.await_count, 1)
+
+        self.teams.names.append("t2")
+        await self.teams.events.put({"type": "ADDED", "object": {"metadata": {"name": "t2"}}})
+        await asyncio.sleep(0.01)
+        listing = await self.cache.get(self.ark_client, "default", ["agents", "teams"])
+
+        self.assertEqual(self.agents.a_list_metadata_versioned.await_count, 2)
+        self.assertEqual([item["metadata"]["name"] for item in listing["teams"]], ["t1", "t2"])
+
+    async def test_concurrent_misses_list_once(self):
+        await asyncio.gather(*(self.cache.get(self.ark_client, "default", ["agents"]) for _ in range(5)))
+
+        self.assertEqual(self.agents.a_list_metadata_versioned.await_count, 1)
+
+    async def test_failed_listing_is_not_cached(self):
+        """Test that a kind failing to list is reported and not cached."""
+        self.teams.a_list_metadata_versioned.side_effect = Exception("Failed to list Teams: forbidden")
+
+        listing = await self.cache.get(self.ark_client, "default", ["agents", "teams"])
+        await self.cache.get(self.ark_client, "default", ["agents", "teams"])
+
+        self.assertIsInstance(listing["teams"], Exception)
+        self.assertEqual(len(listing["agents"]), 1)
+        self.assertEqual(self.agents.a_list_metadata_versioned.await_count, 2)
+
+    async def test_locks_are_dropped_with_entries(self):
+        """Test that locks of namespaces without a cached listing are not kept."""
+        self.teams.a_list_metadata_versioned.side_effect = Exception("Failed to list Teams: forbidden")
+        await self.cache.get(self.ark_client, "unknown", ["agents", "teams"])
+        await self.cache.get(self.ark_client, "default", ["agents"])
+
+        self.assertEqual(list(self.cache._locks), [("default", ("agents",))])
+        self.cache.invalidate()
+        self.assertEqual(self.cache._locks, {})
+
+    async def test_expired_listing_is_reloaded(self):
+        cache = MetadataListCache(ttl=0.01)
+
+        await cache.get(self.ark_client, "default", ["agents"])
+        await asyncio.sleep(0.02)
+        await cache.get(self.ark_client, "default", ["agents"])
+
+        self.assertEqual(self.agents.a_list_metadata_versioned.await_count, 2)
+        cache.invalidate()
@@ -0,0 +1,60 @@
+"""Tests for streaming query completions."""
+import asyncio
+import unittest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+from ark_api.utils.query_polling import stream_query_completion
+
+
+class TestStreamQueryCompletion(unittest.IsolatedAsyncioTestCase):
+    """Test that the query watch is closed however the stream ends."""
+
+    def _client(self, *events, block=False):
+        self.closed = False
+
+        async def watch(**kwargs):
+            try:
+                for event in events:
+                    yield event
+                if block:
+                    await asyncio.Event().wait()
+            finally:
+                self.closed = True
+
+        return SimpleNamespace(queries=SimpleNamespace(a_watch=watch))
+
+    async def _drain(self, stream):
+        return [chunk async for chunk in stream]
+
+    async def test_closed_after_done(self):
+        done = SimpleNamespace(type="MODIFIED", object={"status": {"phase": "done", "responses": [{"content": "Hi"}]}})
+
+        chunks = await self._drain(stream_query_completion(self._client(done, block=True), "q", "agent/a", 5))
+
+        self.assertEqual(chunks[-1], "data: [DONE]\n\n")
+        self.assertTrue(self.closed)
+
+    async def test_closed_after_error(self):
+        failed = SimpleNamespace(type="ADDED", object={"status": {"phase": "error", "message": "boom"}})
+
+        chunks = await self._drain(stream_query_completion(self._client(failed, block=True), "q", "agent/a", 5))
+
+        self.assertIn("boom", chunks[-1])
+        self.assertTrue(self.closed)
+
+    async def test_closed_after_timeout(self):
+        chunks = await self._drain(stream_query_completion(self._client(block=True), "q", "agent/a", 0.05))
+
+        self.assertIn("timed out", chunks[-1])
+        self.assertTrue(self.closed)
+
+    @patch('ark_api.utils.query_polling.STREAM_KEEPALIVE_SECONDS', 0.01)
+    async def test_closed_on_disconnect(self):
+        """Test that closing the stream, as on a client disconnect, closes a pending watch."""
+        stream = stream_query_completion(self._client(block=True), "q", "agent/a", 5)
+
+        self.assertEqual(await stream.__anext__(), ": keep-alive\n\n")
+        await stream.aclose()
+
+        self.assertTrue(self.closed)
@@ -38,7 +38,7 @@ CLEAN_TARGETS += $(ARK_API_SERVICE_SOURCE_DIR)/htmlcov
 CLEAN_TARGETS += $(ARK_API_SERVICE_SOURCE_DIR)/coverage
 
 # Define phony targets
-.PHONY: $(ARK_API_SERVICE_NAME)-build $(ARK_API_SERVICE_NAME)-install $(ARK_API_SERVICE_NAME)-uninstall $(ARK_API_SERVICE_NAME)-dev $(ARK_API_SERVICE_NAME)-test $(ARK_API_SERVICE_NAME)-clean-stamps
+.PHONY: $(ARK_API_SERVICE_NAME)-build $(ARK_API_SERVICE_NAME)-install $(ARK_API_SERVICE_NAME)-uninstall $(ARK_API_SERVICE_NAME)-dev $(ARK_API_SERVICE_NAME)-test $(ARK_API_SERVICE_NAME)-benchmark $(ARK_API_SERVICE_NAME)-clean-stamps
 
 # Generate clean-stamps target
 $(eval $(call CLEAN_STAMPS_TEMPLATE,$(ARK_API_SERVICE_NAME)))
@@ -66,6 +66,10 @@ $(ARK_API_STAMP_TEST): $(ARK_API_STAMP_DEPS)
 	uv run python generate_openapi.py && cp openapi.json ..
 	@touch $@
 
+# Benchmark target (not stamped, results vary between runs)
+$(ARK_API_SERVICE_NAME)-benchmark: $(ARK_API_STAMP_DEPS) # HELP: Run ARK API server benchmarks against a fake API server
+	cd $(ARK_API_SERVICE_SOURCE_DIR) && uv run --with pytest --with pytest-benchmark pytest benchmarks --benchmark-only
+
 # Build target
 $(ARK_API_SERVICE_NAME)-build: $(ARK_API_STAMP_BUILD) # HELP: Build ARK API server Docker image
 $(ARK_API_STAMP_BUILD): $(ARK_API_STAMP_TEST) $(ARK_SDK_WHL)
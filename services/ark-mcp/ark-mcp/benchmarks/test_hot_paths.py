@@ -0,0 +1,71 @@
+"""
+Benchmarks of ark-mcp hot paths against the in-process fake API server.
+
+Set FAKE_APISERVER_LATENCY (seconds) to model a remote API server.
+Run with: make ark-mcp-benchmark
+"""
+import asyncio
+import os
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from ark_sdk.client import close_clients, configure_client_pool
+from ark_sdk.testing import FakeApiServer, make_resource
+
+from ark_mcp.resources import get_agent_sdk, list_all_agents_sdk
+from ark_mcp.tools import get_query_sdk, list_agents_sdk, wait_for_query_completion_sdk
+
+NAMESPACES = ("default", "team-a", "team-b")
+AGENTS = 30
+
+
+@pytest.fixture(scope="module")
+def run():
+    """Run coroutines on one event loop, so SDK connections are reused across rounds"""
+    with FakeApiServer(latency=float(os.getenv("FAKE_APISERVER_LATENCY", "0"))) as server:
+        for namespace in NAMESPACES:
+            for i in range(AGENTS):
+                server.add(make_resource("Agent", f"agent-{i}", namespace, spec={
+                    "description": f"Agent {i}",
+                    "prompt": "You are a helpful assistant.",
+                    "modelRef": {"name": "default"},
+                }))
+        server.add(make_resource("Query", "done-query", "default", spec={
+            "input": "Hello",
+            "targets": [{"type": "agent", "name": "agent-1"}],
+        }, status={
+            "phase": "done",
+            "responses": [{"target": {"type": "agent", "name": "agent-1"}, "content": "Hi! " * 500}],
+        }))
+        configure_client_pool(configuration=server.configuration())
+        loop = asyncio.new_event_loop()
+        yield loop.run_until_complete
+        loop.run_until_complete(close_clients())
+        loop.close()
+
+
+def test_list_agents(benchmark, run):
+    agents = benchmark(lambda: run(list_agents_sdk("default")))
+    assert len(agents) == AGENTS
+
+
+def test_get_agent(benchmark, run):
+    agent = benchmark(lambda: run(get_agent_sdk("default", "agent-1")))
+    assert agent["metadata"]["name"] == "agent-1"
+
+
+def test_list_all_agents(benchmark, run):
+    grouped = benchmark(lambda: run(list_all_agents_sdk()))
+    assert sorted(grouped) == sorted(NAMESPACES)
+
+
+def test_get_query(benchmark, run):
+    query = benchmark(lambda: run(get_query_sdk("done-query")))
+    assert query["status"]["phase"] == "done"
+
+
+def test_wait_for_completed_query(benchmark, run):
+    result = benchmark(lambda: run(wait_for_query_completion_sdk("done-query", timeout_seconds=5)))
+    assert result["success"]
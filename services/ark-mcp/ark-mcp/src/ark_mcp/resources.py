@@ -6,7 +6,7 @@ from typing import List, Dict, Any
 from fastmcp import FastMCP
 from fastmcp.exceptions import ResourceError, NotFoundError
 from ark_sdk.client import with_ark_client
-from ark_sdk.k8s import init_k8s
+from ark_sdk.k8s import init_k8s, get_namespace
 from kubernetes_asyncio import client
 from kubernetes_asyncio.client.api_client import ApiClient
 
@@ -31,39 +31,52 @@ async def list_namespaces_sdk() -> List[str]:
         raise ResourceError(f"Could not list namespaces: {str(e)}") from e
 
 
+def agent_summary(agent: dict[str, Any]) -> dict[str, Any]:
+    """Summarize a raw agent resource for listing."""
+    metadata = agent.get("metadata", {})
+    spec = agent.get("spec", {})
+    status = agent.get("status", {})
+    
+    # Extract model ref name if exists
+    model_ref = None
+    if spec.get("modelRef"):
+        model_ref = spec["modelRef"].get("name")
+    
+    return {
+        "name": metadata.get("name", ""),
+        "namespace": metadata.get("namespace", ""),
+        "description": spec.get("description"),
+        "model_ref": model_ref,
+        "prompt": spec.get("prompt"),
+        "status": status.get("phase")
+    }
+
+
 async def list_agents_sdk(namespace: str) -> List[Dict[str, Any]]:
     """List all agents in a namespace using ark-sdk."""
     try:
         async with with_ark_client(namespace, VERSION) as ark_client:
-            agents = await ark_client.agents.a_list()
-            
-            agent_list = []
-            for agent in agents:
-                agent_dict = agent.to_dict()
-                metadata = agent_dict.get("metadata", {})
-                spec = agent_dict.get("spec", {})
-                status = agent_dict.get("status", {})
-                
-                # Extract model ref name if exists
-                model_ref = None
-                if spec.get("modelRef"):
-                    model_ref = spec["modelRef"].get("name")
-                
-                agent_list.append({
-                    "name": metadata.get("name", ""),
-                    "namespace": metadata.get("namespace", ""),
-                    "description": spec.get("description"),
-                    "model_ref": model_ref,
-                    "prompt": spec.get("prompt"),
-                    "status": status.get("phase")
-                })
-            
-            return agent_list
+            agents = await ark_client.agents.a_list(raw=True)
+            return [agent_summary(agent) for agent in agents]
     except Exception as e:
         logger.error(f"Failed to list agents in namespace {namespace}: {e}")
         raise ResourceError(f"Could not list agents in namespace '{namespace}': {str(e)}") from e
 
 
+async def list_all_agents_sdk() -> dict[str, list[dict[str, Any]]]:
+    """List agents in all namespaces with a single cluster-wide request, grouped by namespace."""
+    try:
+        async with with_ark_client(get_namespace(), VERSION) as ark_client:
+            grouped = await ark_client.agents.a_list_all_namespaces(raw=True)
+            return {
+                namespace: [agent_summary(agent) for agent in agents]
+                for namespace, agents in sorted(grouped.items())
+            }
+    except Exception as e:
+        logger.error(f"Failed to list agents across namespaces: {e}")
+        raise ResourceError(f"Could not list agents across namespaces: {e!s}") from e
+
+
 async def get_agent_sdk(namespace: str, name: str) -> Dict[str, Any]:
     """Get a specific agent using ark-sdk."""
     try:
@@ -92,6 +105,18 @@ def register_resources(mcp: FastMCP):
             "description": "Available Kubernetes namespaces"
         }, indent=2)
 
+    @mcp.resource("ark://agents")
+    async def list_all_agents_resource() -> str:
+        """List agents in all namespaces.
+        
+        Returns agents grouped by namespace, fetched with one cluster-wide request.
+        """
+        agents_by_namespace = await list_all_agents_sdk()
+        return json.dumps({
+            "namespaces": agents_by_namespace,
+            "count": sum(len(agents) for agents in agents_by_namespace.values())
+        }, indent=2)
+
     @mcp.resource("ark://namespaces/{namespace}/agents")
     async def list_agents_resource(namespace: str) -> str:
         """List all agents in a specific namespace.
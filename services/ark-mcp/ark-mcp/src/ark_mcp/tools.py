@@ -2,7 +2,6 @@
 
 import os
 import logging
-import asyncio
 from typing import Annotated, List, Dict, Any, Optional
 from fastmcp import FastMCP
 from fastmcp.exceptions import ToolError, NotFoundError, ValidationError
@@ -51,14 +50,13 @@ async def list_agents_sdk(namespace: str = DEFAULT_NAMESPACE) -> List[Agent]:
     """List all agents in a namespace using ark-sdk."""
     try:
         async with with_ark_client(namespace, VERSION) as ark_client:
-            agents = await ark_client.agents.a_list()
+            agents = await ark_client.agents.a_list(raw=True)
             
             agent_list = []
             for agent in agents:
-                agent_dict = agent.to_dict()
-                metadata = agent_dict.get("metadata", {})
-                spec = agent_dict.get("spec", {})
-                status = agent_dict.get("status", {})
+                metadata = agent.get("metadata", {})
+                spec = agent.get("spec", {})
+                status = agent.get("status", {})
                 
                 # Extract model ref name if exists
                 model_ref = None
@@ -123,41 +121,45 @@ async def get_query_sdk(name: str, namespace: str = DEFAULT_NAMESPACE) -> Dict[s
         raise ToolError(f"Could not retrieve query '{name}': {str(e)}") from e
 
 
+TERMINAL_QUERY_PHASES = ("done", "error", "canceled")
+
+
 async def wait_for_query_completion_sdk(
     name: str, 
     namespace: str = DEFAULT_NAMESPACE, 
-    timeout_seconds: int = 300,
-    poll_interval: float = 2.0
+    timeout_seconds: int = 300
 ) -> Dict[str, Any]:
     """Wait for query to complete and return final status with results."""
-    start_time = asyncio.get_event_loop().time()
+    try:
+        async with with_ark_client(namespace, VERSION) as ark_client:
+            query_result = await ark_client.queries.a_wait_for(
+                name,
+                lambda query: query.get("status", {}).get("phase") in TERMINAL_QUERY_PHASES,
+                timeout=timeout_seconds,
+                raw=True
+            )
+    except TimeoutError as e:
+        raise ToolError(f"Query '{name}' timed out after {timeout_seconds} seconds") from e
+    except Exception as e:
+        if "not found" in str(e).lower():
+            raise NotFoundError(f"Query '{name}' not found in namespace '{namespace}'") from e
+        logger.error(f"Failed to wait for query '{name}': {e}")
+        raise ToolError(f"Could not wait for query '{name}': {e!s}") from e
     
-    while True:
-        current_time = asyncio.get_event_loop().time()
-        if current_time - start_time > timeout_seconds:
-            raise ToolError(f"Query '{name}' timed out after {timeout_seconds} seconds")
-        
-        query_result = await get_query_sdk(name, namespace)
-        status = query_result.get("status", {})
-        phase = status.get("phase", "pending")
-        
-        logger.info(f"Query {name} status: {phase}")
-        
-        # Terminal phases
-        if phase in ["done", "error", "canceled"]:
-            return {
-                "name": name,
-                "namespace": namespace,
-                "phase": phase,
-                "status": status,
-                "responses": status.get("responses", []),
-                "evaluations": status.get("evaluations", []),
-                "tokenUsage": status.get("tokenUsage", {}),
-                "success": phase == "done"
-            }
-        
-        # Wait before next poll
-        await asyncio.sleep(poll_interval)
+    status = query_result.get("status", {})
+    phase = status.get("phase")
+    logger.info(f"Query {name} status: {phase}")
+    
+    return {
+        "name": name,
+        "namespace": namespace,
+        "phase": phase,
+        "status": status,
+        "responses": status.get("responses", []),
+        "evaluations": status.get("evaluations", []),
+        "tokenUsage": status.get("tokenUsage", {}),
+        "success": phase == "done"
+    }
 
 
 def register_tools(mcp: FastMCP):
@@ -33,7 +33,7 @@ CLEAN_TARGETS += $(ARK_MCP_SERVICE_SOURCE_DIR)/.coverage
 CLEAN_TARGETS += $(ARK_MCP_SERVICE_SOURCE_DIR)/htmlcov
 
 # Define phony targets
-.PHONY: $(ARK_MCP_SERVICE_NAME)-build $(ARK_MCP_SERVICE_NAME)-install $(ARK_MCP_SERVICE_NAME)-uninstall $(ARK_MCP_SERVICE_NAME)-dev $(ARK_MCP_SERVICE_NAME)-dev-deps $(ARK_MCP_SERVICE_NAME)-test $(ARK_MCP_SERVICE_NAME)-clean-stamps
+.PHONY: $(ARK_MCP_SERVICE_NAME)-build $(ARK_MCP_SERVICE_NAME)-install $(ARK_MCP_SERVICE_NAME)-uninstall $(ARK_MCP_SERVICE_NAME)-dev $(ARK_MCP_SERVICE_NAME)-dev-deps $(ARK_MCP_SERVICE_NAME)-test $(ARK_MCP_SERVICE_NAME)-benchmark $(ARK_MCP_SERVICE_NAME)-clean-stamps
 
 # Generate clean-stamps target
 $(eval $(call CLEAN_STAMPS_TEMPLATE,$(ARK_MCP_SERVICE_NAME)))
@@ -47,6 +47,10 @@ $(ARK_MCP_STAMP_DEPS): $(ARK_MCP_SERVICE_SOURCE_DIR)/pyproject.toml $(ARK_SDK_WH
 	rm -f uv.lock && uv sync
 	@touch $@
 
+# Benchmark target (not stamped, results vary between runs)
+$(ARK_MCP_SERVICE_NAME)-benchmark: $(ARK_MCP_STAMP_DEPS) # HELP: Run ark-mcp benchmarks against a fake API server
+	cd $(ARK_MCP_SERVICE_SOURCE_DIR) && uv run --with pytest --with pytest-benchmark pytest benchmarks --benchmark-only
+
 # Build target
 $(ARK_MCP_SERVICE_NAME)-build: $(ARK_MCP_STAMP_BUILD) # HELP: Build ark-mcp Docker image
 $(ARK_MCP_STAMP_BUILD): $(ARK_MCP_STAMP_DEPS) $(ARK_SDK_WHL)
@@ -5,6 +5,7 @@ Handles communication with ARK cluster via kubectl
 
 import subprocess
 import json
+import threading
 import time
 import yaml
 from typing import Dict, List, Optional, Tuple
@@ -225,33 +226,55 @@ spec:
         return query_yaml
     
     def wait_for_completion(self, query_name: str, timeout: int = 300) -> Tuple[bool, str]:
-        """Wait for query to complete with timeout"""
-        start_time = time.time()
+        """Wait for query to complete with timeout
         
-        while time.time() - start_time < timeout:
-            success, status = self.get_query_status(query_name)
-            
-            if success:
+        Streams phase changes from a kubectl watch instead of polling, so
+        completion is noticed as soon as the query status changes.
+        """
+        command = [
+            "kubectl", "get", "query", query_name, "--watch",
+            "-o", "jsonpath={.status.phase}{\"\\n\"}"
+        ]
+        try:
+            process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+        except Exception:
+            return False, "error"
+        
+        timer = threading.Timer(timeout, process.kill)
+        timer.start()
+        try:
+            for line in process.stdout:
+                status = line.strip().strip("'\"")
                 if status == "done":
                     return True, "completed"
                 elif status == "error":
                     return False, "error"
-                # Continue waiting for "running" status
-            
-            time.sleep(2)  # Check every 2 seconds for faster response
+        finally:
+            timed_out = not timer.is_alive()
+            timer.cancel()
+            process.kill()
+            process.wait()
+        
+        return False, "timeout" if timed_out else "error"
+    
+    def _names_from_table(self, output: str) -> List[str]:
+        """Extract resource names from default kubectl table output
         
-        return False, "timeout"
+        The default output is a server-side Table built from object metadata,
+        so full specs are never downloaded just to read names.
+        """
+        return [line.split()[0] for line in output.splitlines() if line.strip()]
     
     def get_available_agents(self) -> List[str]:
         """Get list of available agents"""
-        success, output = self._run_kubectl("kubectl get agents -o jsonpath='{.items[*].metadata.name}'")
+        success, output = self._run_kubectl("kubectl get agents --no-headers")
         if success:
-            return output.strip().split() if output.strip() else []
+            return self._names_from_table(output)
         return []
     
     def get_available_tools(self) -> List[str]:
         """Get list of available tools"""
-        success, output = self._run_kubectl("kubectl get tools -o jsonpath='{.items[*].metadata.name}'")
+        success, output = self._run_kubectl("kubectl get tools --no-headers")
         if success:
-            return output.strip().split() if output.strip() else []
+            return self._names_from_table(output)
         return []